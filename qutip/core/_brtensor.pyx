@@ -10,6 +10,7 @@ from qutip.core._brtools cimport _EigenBasisTransform
 from qutip.core.qobj import Qobj
 
 import numpy as np
+from collections import OrderedDict
 from libcpp.vector cimport vector
 from libc.math cimport fabs, fmin
 
@@ -22,6 +23,24 @@ cpdef enum TensorType:
     DATA = 2
 
 
+cdef tuple _secular_windows(double[:, ::1] skew, double cutoff):
+    """
+    Sort the Bohr frequencies ``skew`` once and find, for each pair ``(a, b)``,
+    the window ``order[lo[a*N+b]:hi[a*N+b]]`` of pairs ``c*N+d`` such that
+    ``|skew[a, b] - skew[c, d]| < cutoff``. The windows are widened by one
+    element on each side to be safe from rounding: the condition must still be
+    checked on the pairs at their edges.
+    """
+    flat_skew = np.asarray(skew).ravel()
+    order = np.argsort(flat_skew, kind="stable")
+    sorted_skew = flat_skew[order]
+    lo = np.searchsorted(sorted_skew, flat_skew - cutoff, side="right")
+    hi = np.searchsorted(sorted_skew, flat_skew + cutoff, side="left")
+    lo = np.maximum(lo - 1, 0)
+    hi = np.minimum(hi + 1, len(order))
+    return order, lo, hi
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cpdef Data _br_term_data(Data A, double[:, ::1] spectrum,
@@ -30,10 +49,13 @@ cpdef Data _br_term_data(Data A, double[:, ::1] spectrum,
     Compute the contribution of A to the Bloch Redfield tensor.
     Computation are done using dispatched function.
     """
-    cdef object cutoff_arr
-    cdef int nrows = A.shape[0], a, b, c, d
+    cdef size_t nrows = A.shape[0], ab, cd, k
     cdef Data S, I, AS, AST, out, C
     cdef type cls = type(A)
+    cdef Py_ssize_t[::1] order, lo, hi
+    cdef double[::1] flat_skew
+    cdef vector[idxint] coo_rows, coo_cols
+    cdef vector[double complex] coo_data
 
     S = _data.to(cls, _data.mul(_data.Dense(spectrum, copy=False), 0.5))
     I = _data.identity[cls](nrows)
@@ -48,18 +70,22 @@ cpdef Data _br_term_data(Data A, double[:, ::1] spectrum,
     if cutoff == np.inf:
         return out
 
-    # The cutoff_arr should be sparse most of the time, but it depend on the
-    # cutoff and we cannot easily guess a nnz to make it efficiently...
-    # But there is probably room from improvement.
-    cutoff_arr = np.zeros((nrows*nrows, nrows*nrows), dtype=np.complex128)
-    for a in range(nrows):
-        for b in range(nrows):
-            for c in range(nrows):
-                for d in range(nrows):
-                    if fabs(skew[a, b] - skew[c, d]) < cutoff:
-                        cutoff_arr[a * nrows + b, c * nrows + d] = 1.
-    C = _data.to(cls, _data.Dense(cutoff_arr, copy=False))
-    return _data.multiply(out, C)
+    # Mask of the terms kept by the secular approximation, only the pairs
+    # within the cutoff are visited.
+    order, lo, hi = _secular_windows(skew, cutoff)
+    flat_skew = np.asarray(skew).ravel()
+    for ab in range(nrows * nrows):
+        for k in range(lo[ab], hi[ab]):
+            cd = order[k]
+            if fabs(flat_skew[ab] - flat_skew[cd]) < cutoff:
+                coo_rows.push_back(ab)
+                coo_cols.push_back(cd)
+                coo_data.push_back(1.)
+    C = csr.from_coo_pointers(
+        coo_rows.data(), coo_cols.data(), coo_data.data(),
+        nrows*nrows, nrows*nrows, coo_rows.size()
+    )
+    return _data.multiply(out, _data.to(cls, C))
 
 
 @cython.boundscheck(False)
@@ -71,12 +97,13 @@ cpdef Dense _br_term_dense(Data A, double[:, ::1] spectrum,
     Allocate a Dense array and fill it.
     """
     cdef size_t nrows = A.shape[0]
-    cdef size_t a, b, c, d, k # matrix indexing variables
+    cdef size_t a, b, c, d, k, ab, cd # matrix indexing variables
     cdef double complex elem
     cdef double complex[:,:] A_mat, ac_term, bd_term
     cdef object np2term
     cdef Dense out
     cdef double complex[::1, :] out_array
+    cdef Py_ssize_t[::1] order, lo, hi
 
     if type(A) is Dense:
         A_mat = A.as_ndarray()
@@ -99,18 +126,22 @@ cpdef Dense _br_term_dense(Data A, double[:, ::1] spectrum,
                     bd_term[a, b] += A_mat[a, k] * A_mat[k, b] * spectrum[b, k]
 
     # TODO: we could use openmp to speed up.
-    for a in range(nrows):
-        for b in range(nrows):
-            for c in range(nrows):
-                for d in range(nrows):
-                    if fabs(skew[a, b] - skew[c, d]) < cutoff:
-                        elem = A_mat[a, c] * A_mat[d, b] * 0.5
-                        elem *= (spectrum[c, a] + spectrum[d, b])
-                        if a == c:
-                            elem = elem - 0.5 * ac_term[d, b]
-                        if b == d:
-                            elem = elem - 0.5 * bd_term[a, c]
-                        out_array[a * nrows + b, c * nrows + d] = elem
+    order, lo, hi = _secular_windows(skew, cutoff)
+    for ab in range(nrows * nrows):
+        a = ab // nrows
+        b = ab % nrows
+        for k in range(lo[ab], hi[ab]):
+            cd = order[k]
+            c = cd // nrows
+            d = cd % nrows
+            if fabs(skew[a, b] - skew[c, d]) < cutoff:
+                elem = A_mat[a, c] * A_mat[d, b] * 0.5
+                elem *= (spectrum[c, a] + spectrum[d, b])
+                if a == c:
+                    elem = elem - 0.5 * ac_term[d, b]
+                if b == d:
+                    elem = elem - 0.5 * bd_term[a, c]
+                out_array[ab, cd] = elem
     return out
 
 
@@ -123,11 +154,11 @@ cpdef CSR _br_term_sparse(Data A, double[:, :] spectrum,
     Create it as coo pointers and return as CSR.
     """
     cdef size_t nrows = A.shape[0]
-    cdef size_t a, b, c, d, k, d_min # matrix indexing variables
-    cdef double complex elem, ac_elem, bd_elem
+    cdef size_t a, b, c, d, k, ab, cd # matrix indexing variables
+    cdef double complex elem
     cdef double complex[:,:] A_mat, ac_term, bd_term
-    cdef double dskew
     cdef object np2term
+    cdef Py_ssize_t[::1] order, lo, hi
     cdef vector[idxint] coo_rows, coo_cols
     cdef vector[double complex] coo_data
 
@@ -150,31 +181,27 @@ cpdef CSR _br_term_sparse(Data A, double[:, :] spectrum,
                 break
 
     # skew[a,b] = w[a] - w[b]
-    # (w[a] - w[b] - w[c] + w[d]) < cutoff
-    # w's are sorted so we can skip part of the loop.
-    for a in range(nrows):
-        for b in range(nrows):
-            d_min = 0
-            for c in range(nrows):
-                if skew[a, b] - skew[c, nrows-1] <= -cutoff:
-                    break
-                for d in range(d_min, nrows):
-                    dskew = skew[a, b] - skew[c, d]
-                    if -dskew > cutoff:
-                        d_min = d
-                    elif fabs(dskew) < cutoff:
-                        elem = (A_mat[a, c] * A_mat[d, b]) * 0.5
-                        elem *= (spectrum[c, a] + spectrum[d, b])
-                        if a == c:
-                            elem -= 0.5 * ac_term[d, b]
-                        if b == d:
-                            elem -= 0.5 * bd_term[a, c]
-                        if elem != 0:
-                            coo_rows.push_back(a * nrows + b)
-                            coo_cols.push_back(c * nrows + d)
-                            coo_data.push_back(elem)
-                    elif dskew >= cutoff:
-                        break
+    # Only the pairs with |skew[a, b] - skew[c, d]| < cutoff are visited, found
+    # by binary search in the sorted Bohr frequencies.
+    order, lo, hi = _secular_windows(skew, cutoff)
+    for ab in range(nrows * nrows):
+        a = ab // nrows
+        b = ab % nrows
+        for k in range(lo[ab], hi[ab]):
+            cd = order[k]
+            c = cd // nrows
+            d = cd % nrows
+            if fabs(skew[a, b] - skew[c, d]) < cutoff:
+                elem = (A_mat[a, c] * A_mat[d, b]) * 0.5
+                elem *= (spectrum[c, a] + spectrum[d, b])
+                if a == c:
+                    elem -= 0.5 * ac_term[d, b]
+                if b == d:
+                    elem -= 0.5 * bd_term[a, c]
+                if elem != 0:
+                    coo_rows.push_back(ab)
+                    coo_cols.push_back(cd)
+                    coo_data.push_back(elem)
 
     return csr.from_coo_pointers(
         coo_rows.data(), coo_cols.data(), coo_data.data(),
@@ -195,6 +222,14 @@ cdef class _BlochRedfieldElement(_BaseElement):
     Diffenrent term can share a same instance of the eigen transform tool
     (``H`` as _EigenBasisTransform) so that the Hamiltonian is diagonalized
     only once even when needed by multiple terms.
+
+    The last ``cache_size`` tensors are kept and reused when called again at
+    the same time. When both ``H`` and ``a_op`` are constant, the tensor only
+    depends on time through the spectrum: when the spectrum is only rescaled,
+    so is the tensor instead of being computed again. If ``tensor_grid`` is
+    given, the tensor is only computed at these times and linearly
+    interpolated between them. In the ``eig_basis``, this is only possible
+    for a constant Hamiltonian.
     """
     cdef readonly _EigenBasisTransform H
     cdef readonly QobjEvo a_op
@@ -208,9 +243,16 @@ cdef class _BlochRedfieldElement(_BaseElement):
     cdef readonly double[:, ::1] spectrum
     cdef readonly bint eig_basis
     cdef readonly TensorType tensortype
+    cdef readonly int cache_size
+    cdef readonly object tensor_grid
+    cdef readonly bint constant_ops
+    cdef object _cache
+    cdef object _grid_tensors
+    cdef object _ref_spectrum
+    cdef Data _ref_tensor
 
     def __init__(self, H, a_op, spectra, sec_cutoff, eig_basis=False,
-                 dtype=None):
+                 dtype=None, cache_size=1, tensor_grid=None):
         if isinstance(H, _EigenBasisTransform):
             self.H = H
         else:
@@ -237,6 +279,29 @@ cdef class _BlochRedfieldElement(_BaseElement):
         self.skew = self.np_datas[0]
         self.spectrum = self.np_datas[1]
 
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.constant_ops = self.H.isconstant and a_op.isconstant
+        self._ref_spectrum = None
+        self._ref_tensor = None
+        if tensor_grid is not None:
+            if eig_basis and not self.H.isconstant:
+                # The eigenvectors at each grid time have arbitrary phases
+                # and order: tensors in these bases cannot be interpolated.
+                raise ValueError(
+                    "The tensor grid can only be used in the eigenbasis "
+                    "when the Hamiltonian is constant."
+                )
+            tensor_grid = np.array(tensor_grid, dtype=np.float64)
+            if tensor_grid.ndim != 1 or len(tensor_grid) < 2:
+                raise ValueError(
+                    "The tensor grid must be a list of at least 2 times."
+                )
+            if np.any(np.diff(tensor_grid) <= 0):
+                raise ValueError("The tensor grid must be increasing.")
+            self._grid_tensors = [None] * len(tensor_grid)
+        self.tensor_grid = tensor_grid
+
     cpdef double _compute_spectrum(self, double t) except *:
         "Compute the skew, spectrum and dw_min"
         cdef Coefficient spec
@@ -265,6 +330,80 @@ cdef class _BlochRedfieldElement(_BaseElement):
             return _br_term_data(A_eig, self.spectrum, self.skew, cutoff)
         raise ValueError('Invalid tensortype')
 
+    cdef object _rescaling(self):
+        """
+        Return the factor between the current spectrum and the one used to
+        compute ``_ref_tensor`` or ``None`` if not proportional.
+        """
+        if self._ref_spectrum is None:
+            return None
+        ref = self._ref_spectrum
+        spectrum = np.asarray(self.spectrum)
+        idx = np.argmax(np.abs(ref))
+        if ref.flat[idx] == 0:
+            return 0. if not np.any(spectrum) else None
+        factor = spectrum.flat[idx] / ref.flat[idx]
+        if np.allclose(spectrum, factor * ref, rtol=1e-12, atol=0):
+            return factor
+        return None
+
+    cdef Data _eig_tensor(self, double t):
+        """
+        Bloch Redfield tensor in the eigenbasis at ``t``.
+        """
+        cdef double cutoff
+        cdef Data BR_eig
+        if t in self._cache:
+            self._cache.move_to_end(t)
+            return self._cache[t]
+        cutoff = self.sec_cutoff * self._compute_spectrum(t)
+        factor = self._rescaling() if self.constant_ops else None
+        if factor is not None:
+            BR_eig = _data.mul(self._ref_tensor, factor)
+        else:
+            A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
+            BR_eig = self._br_term(A_eig, cutoff)
+            if self.constant_ops:
+                self._ref_spectrum = np.array(self.spectrum)
+                self._ref_tensor = BR_eig
+        if self.cache_size > 0:
+            self._cache[t] = BR_eig
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return BR_eig
+
+    cdef Data _grid_tensor(self, size_t idx):
+        """
+        Bloch Redfield tensor at the ``idx`` point of the grid, in the output
+        basis.
+        """
+        cdef double t
+        if self._grid_tensors[idx] is None:
+            t = self.tensor_grid[idx]
+            BR = self._eig_tensor(t)
+            if not self.eig_basis:
+                BR = self.H.from_eigbasis(t, BR)
+            self._grid_tensors[idx] = BR
+        return self._grid_tensors[idx]
+
+    cdef Data _interpolated_tensor(self, double t):
+        """
+        Bloch Redfield tensor interpolated from the grid, in the output basis.
+        """
+        grid = self.tensor_grid
+        # Past the ends of the grid, the tensor at the end is used: solvers
+        # check that the evolution is within the grid, but integrators can
+        # step past the last time.
+        idx = np.searchsorted(grid, t, side="right")
+        idx = min(max(idx, 1), len(grid) - 1)
+        weight = (t - grid[idx - 1]) / (grid[idx] - grid[idx - 1])
+        weight = min(max(weight, 0.), 1.)
+        return _data.add(
+            _data.mul(self._grid_tensor(idx - 1), 1. - weight),
+            self._grid_tensor(idx),
+            weight,
+        )
+
     cpdef object qobj(self, t):
         return Qobj(self.data(t), dims=self.dims, copy=False, superrep="super")
 
@@ -272,25 +411,25 @@ cdef class _BlochRedfieldElement(_BaseElement):
         return 1.
 
     cpdef Data data(self, t):
-        cdef size_t i
-        cdef double cutoff = self.sec_cutoff * self._compute_spectrum(t)
-        A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
-        BR_eig = self._br_term(A_eig, cutoff)
+        if self.tensor_grid is not None:
+            return self._interpolated_tensor(t)
+        BR_eig = self._eig_tensor(t)
         if self.eig_basis:
             return BR_eig
         return self.H.from_eigbasis(t, BR_eig)
 
     cdef Data matmul_data_t(self, t, Data state, Data out=None):
-        cdef size_t i
-        cdef double cutoff = self.sec_cutoff * self._compute_spectrum(t)
-        cdef Data A_eig, BR_eig
+        cdef Data BR_eig
 
+        if self.tensor_grid is not None:
+            return _data.add(
+                _data.matmul(self._interpolated_tensor(t), state), out
+            )
         if not self.eig_basis:
             state = self.H.to_eigbasis(t, state)
         if not self.eig_basis and out is not None:
             out = self.H.to_eigbasis(t, out)
-        A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
-        BR_eig = self._br_term(A_eig, cutoff)
+        BR_eig = self._eig_tensor(t)
         out = _data.add(_data.matmul(BR_eig, state), out)
         if not self.eig_basis:
             out = self.H.from_eigbasis(t, out)
@@ -305,7 +444,9 @@ cdef class _BlochRedfieldElement(_BaseElement):
                 self.H,
                 QobjEvo(self.a_op, args=args),
                 self.spectra,
-                self.sec_cutoff
+                self.sec_cutoff,
+                cache_size=self.cache_size,
+                tensor_grid=self.tensor_grid,
             )
         H = None
         for old, new in cache:
@@ -318,7 +459,8 @@ cdef class _BlochRedfieldElement(_BaseElement):
                                      type(self.H.oper) is CSR)
         new = _BlochRedfieldElement(
             H, QobjEvo(self.a_op, args=args),
-            self.spectra.replace_arguments(**args), self.sec_cutoff
+            self.spectra.replace_arguments(**args), self.sec_cutoff,
+            cache_size=self.cache_size, tensor_grid=self.tensor_grid,
         )
         cache.append((self, new))
         cache.append((self.H, H))
@@ -14,7 +14,7 @@ __all__ = ['bloch_redfield_tensor', 'brterm']
 
 def bloch_redfield_tensor(H, a_ops, c_ops=[], sec_cutoff=0.1,
                           fock_basis=False, sparse_eigensolver=False,
-                          br_dtype='sparse'):
+                          br_dtype='sparse', br_cache_size=1, br_grid=None):
     """
     Calculates the Bloch-Redfield tensor for a system given
     a set of operators and corresponding spectral functions that describes the
@@ -71,6 +71,16 @@ def bloch_redfield_tensor(H, a_ops, c_ops=[], sec_cutoff=0.1,
         Which data type to use when computing the brtensor.
         With a cutoff 'sparse' is usually the most efficient.
 
+    br_cache_size : int {1}
+        Number of time-dependent brtensors kept for reuse when evaluated again
+        at the same time.
+
+    br_grid : array_like, optional
+        Times at which to compute time-dependent brtensors. When given, the
+        brtensor at other times is linearly interpolated from these, and
+        kept constant past the ends of the grid. Only supported with
+        ``fock_basis`` when ``H`` is time-dependent.
+
     Returns
     -------
     R, [evecs]: :class:`qutip.Qobj`, tuple of :class:`qutip.Qobj`
@@ -85,7 +95,8 @@ def bloch_redfield_tensor(H, a_ops, c_ops=[], sec_cutoff=0.1,
     if fock_basis:
         for (a_op, spectra) in a_ops:
             R += brterm(H_transform, a_op, spectra, sec_cutoff, True,
-                        br_dtype=br_dtype)
+                        br_dtype=br_dtype, br_cache_size=br_cache_size,
+                        br_grid=br_grid)
         return R
     else:
         # When the Hamiltonian is time-dependent, the transformation of `L` to
@@ -98,12 +109,14 @@ def bloch_redfield_tensor(H, a_ops, c_ops=[], sec_cutoff=0.1,
         R = sprepost(evec, evec.dag()) @ R @ sprepost(evec.dag(), evec)
         for (a_op, spectra) in a_ops:
             R += brterm(H_transform, a_op, spectra, sec_cutoff,
-                        False, br_dtype=br_dtype)[0]
+                        False, br_dtype=br_dtype, br_cache_size=br_cache_size,
+                        br_grid=br_grid)[0]
         return R, H_transform.as_Qobj()
 
 
 def brterm(H, a_op, spectra, sec_cutoff=0.1,
-           fock_basis=False, sparse_eigensolver=False, br_dtype='sparse'):
+           fock_basis=False, sparse_eigensolver=False, br_dtype='sparse',
+           br_cache_size=1, br_grid=None):
     """
     Calculates the contribution of one coupling operator to the Bloch-Redfield
     tensor.
@@ -145,6 +158,16 @@ def brterm(H, a_op, spectra, sec_cutoff=0.1,
         Which data type to use when computing the brtensor.
         With a cutoff 'sparse' is usually the most efficient.
 
+    br_cache_size : int {1}
+        Number of time-dependent brtensors kept for reuse when evaluated again
+        at the same time.
+
+    br_grid : array_like, optional
+        Times at which to compute time-dependent brtensors. When given, the
+        brtensor at other times is linearly interpolated from these, and
+        kept constant past the ends of the grid. Only supported with
+        ``fock_basis`` when ``H`` is time-dependent.
+
     Returns
     -------
     R, [evecs]: :obj:`.Qobj`, :obj:`.QobjEvo` or tuple
@@ -177,7 +200,8 @@ def brterm(H, a_op, spectra, sec_cutoff=0.1,
 
     sec_cutoff = sec_cutoff if sec_cutoff >= 0 else np.inf
     R = QobjEvo(_BlochRedfieldElement(Hdiag, QobjEvo(a_op), spectra,
-                sec_cutoff, not fock_basis, dtype=br_dtype))
+                sec_cutoff, not fock_basis, dtype=br_dtype,
+                cache_size=br_cache_size, tensor_grid=br_grid))
 
     if (
         ((isinstance(H, _EigenBasisTransform) and H.isconstant)
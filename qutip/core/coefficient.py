@@ -12,8 +12,16 @@ import dis
 import hashlib
 import glob
 import importlib
+import importlib.machinery
+import json
+import shutil
+import tempfile
+import time
 import warnings
 import numbers
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from collections import defaultdict
 try:
     from setuptools import setup, Extension
@@ -27,7 +35,8 @@ from .options import QutipOptions
 from .data import Data
 from .cy.coefficient import (
     Coefficient, InterCoefficient, FunctionCoefficient, StrFunctionCoefficient,
-    ConjCoefficient, NormCoefficient, ConstantCoefficient
+    ConjCoefficient, NormCoefficient, ConstantCoefficient, DeferredCoefficient,
+    simplify
 )
 from qutip.typing import CoefficientLike
 
@@ -215,6 +224,56 @@ def const(value):
     return ConstantCoefficient(value)
 
 
+def _tabulate(coeff, t0, t1, tol, max_points=100_000):
+    """
+    Interpolate ``coeff`` over ``[t0, t1]`` with a cubic spline.
+
+    The grid starts uniform and the intervals where the spline differs from
+    the coefficient at their midpoint by more than ``tol`` times the largest
+    value are split until none remains. The spline error scaling as the
+    fourth power of the step, each interval is split in as many parts as
+    needed to reach the tolerance. Returns ``None`` if this needs more than
+    ``max_points`` points, or steps too small to be represented, as happens
+    at discontinuities, or if the coefficient is not finite.
+    """
+    grid = np.linspace(t0, t1, 33)
+    values = coeff.evaluate(grid)
+    while True:
+        if not np.all(np.isfinite(values)):
+            return None
+        spline = InterCoefficient(values, grid, 3, None)
+        mids = (grid[1:] + grid[:-1]) / 2
+        exact = coeff.evaluate(mids)
+        if not np.all(np.isfinite(exact)):
+            return None
+        scale = max(np.max(np.abs(values)), np.max(np.abs(exact)))
+        ratio = np.abs(spline.evaluate(mids) - exact) / (tol * scale or 1.)
+        bad = ratio > 1
+        if not np.any(bad):
+            return spline
+        splits = np.clip(np.ceil(ratio[bad] ** 0.25), 2, 16).astype(int)
+        n_new = splits - 1
+        width = grid[1:][bad] - grid[:-1][bad]
+        if (
+            len(grid) + n_new.sum() > max_points
+            or np.min(width) < 1e-10 * (t1 - t0)
+        ):
+            return None
+        interval = np.repeat(np.flatnonzero(bad), n_new)
+        first = np.repeat(np.cumsum(n_new) - n_new, n_new)
+        part = np.arange(n_new.sum()) - first + 1
+        new = (
+            grid[interval]
+            + (grid[interval + 1] - grid[interval])
+            * part / np.repeat(splits, n_new)
+        )
+        grid = np.concatenate([grid, new])
+        values = np.concatenate([values, coeff.evaluate(new)])
+        order = np.argsort(grid)
+        grid = grid[order]
+        values = values[order]
+
+
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 # %%%%%%%%%      Everything under this is for string compilation      %%%%%%%%%
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -267,6 +326,24 @@ class CompilationOptions(QutipOptions):
 
     build_dir: str [None]
         cythonize's build_dir.
+
+    background_compile : bool [False]
+        Compile new string coefficients in a separate process instead of
+        waiting for the compilation. The coefficient is evaluated with
+        python's ``eval`` until the compiled version is ready, at which
+        point it switches to it. Strings compiled previously are still used
+        directly.
+
+    max_cache_files : int [None]
+        Maximum number of compiled coefficients kept in
+        ``qutip.settings.coeffroot``. When a new coefficient is compiled, the
+        least recently used ones are removed to stay within this number.
+        ``None`` keeps all of them.
+
+    max_cache_size : int [None]
+        Maximum total size, in bytes, of the compiled coefficients kept in
+        ``qutip.settings.coeffroot``. The least recently used ones are removed
+        past this size. ``None`` keeps all of them.
     """
     _link_flags = ""
     _compiler_flags = ""
@@ -298,6 +375,9 @@ class CompilationOptions(QutipOptions):
         "extra_import": "",
         "clean_on_error": True,
         "build_dir": None,
+        "background_compile": False,
+        "max_cache_files": None,
+        "max_cache_size": None,
     }
     _settings_name = "compile"
 
@@ -412,11 +492,24 @@ def coeff_from_str(base, args, args_ctypes, compile_opt=None, **_):
     # See if it already exist and import it.
     if not compile_opt['recompile']:
         coeff = try_import(file_name, parsed)
+        if coeff is not None:
+            _record_access(file_name, compile_opt)
 
+    keys = [key for _, key, _ in variables]
+    const = [fromstr(val) for _, val, _ in constants]
     if not coeff and qset.coeff_write_ok:
         # Previously compiled coefficient not available: create the cython code
         code = make_cy_code(parsed, variables, constants,
                             raw, compile_opt)
+        if compile_opt['background_compile']:
+            future = compile_in_background(code, file_name, parsed,
+                                           compile_opt)
+            factory = functools.partial(
+                _load_compiled, future, file_name, parsed, base, keys, const
+            )
+            return DeferredCoefficient(
+                StrFunctionCoefficient(base, args), future, factory
+            )
         try:
             coeff = compile_code(code, file_name, parsed, compile_opt)
         except PermissionError:
@@ -424,8 +517,6 @@ def coeff_from_str(base, args, args_ctypes, compile_opt=None, **_):
     if coeff is None:
         # We don't use cython or compilation failed
         return StrFunctionCoefficient(base, args)
-    keys = [key for _, key, _ in variables]
-    const = [fromstr(val) for _, val, _ in constants]
     return coeff(base, keys, const, args)
 
 
@@ -561,14 +652,28 @@ def compile_code(code, file_name, parsed, c_opt):
     lock = filelock.FileLock("compile_lock_" + file_name + ".lock")
     try:
         lock.acquire(timeout=0)
+        if not c_opt['recompile']:
+            # Another process could have compiled it since we looked for it.
+            importlib.invalidate_caches()
+            coeff = try_import(file_name, parsed)
+            if coeff is not None:
+                return coeff
         for file in glob.glob(file_name + "*"):
             os.remove(file)
         file_ = open(file_name + ".pyx", "w")
         file_.writelines(code)
         file_.close()
         oldargs = sys.argv
+        # The module is built away from coeffroot then moved in place, so
+        # that other processes never import a partially written file.
+        build = tempfile.mkdtemp(prefix="compile_build_", dir=".")
+        build_lib = os.path.join(build, "lib")
         try:
-            sys.argv = ["setup.py", "build_ext", "--inplace"]
+            sys.argv = [
+                "setup.py", "build_ext",
+                "--build-lib", build_lib,
+                "--build-temp", os.path.join(build, "temp"),
+            ]
             coeff_file = Extension(
                 file_name,
                 sources=[file_name + ".pyx"],
@@ -581,6 +686,8 @@ def compile_code(code, file_name, parsed, c_opt):
                 coeff_file, force=True, build_dir=c_opt['build_dir']
             )
             setup(ext_modules=ext_modules)
+            for file in os.listdir(build_lib):
+                os.replace(os.path.join(build_lib, file), file)
         except Exception as e:
             if c_opt['clean_on_error']:
                 for file in glob.glob(file_name + "*"):
@@ -588,6 +695,7 @@ def compile_code(code, file_name, parsed, c_opt):
             raise Exception("Could not compile") from e
         finally:
             sys.argv = oldargs
+            shutil.rmtree(build, ignore_errors=True)
     except filelock.Timeout:
         with lock:
             # We wait for the lock to be released and then retry the import.
@@ -595,7 +703,173 @@ def compile_code(code, file_name, parsed, c_opt):
     finally:
         lock.release()
         os.chdir(pwd)
-    return try_import(file_name, parsed)
+    importlib.invalidate_caches()
+    coeff = try_import(file_name, parsed)
+    if coeff is not None:
+        _record_access(file_name, c_opt, force=True)
+        _evict_compiled(c_opt, file_name)
+    return coeff
+
+
+def _manifest_path():
+    return os.path.join(qset.coeffroot, "manifest.json")
+
+
+def _manifest_lock():
+    return filelock.FileLock(os.path.join(qset.coeffroot, "manifest.lock"))
+
+
+def _read_manifest():
+    """
+    Read the manifest of compiled coefficients: ``{file_name: entry}`` where
+    each entry has the ``size`` in bytes of the coefficient's files and the
+    ``access`` time it was last imported.
+    """
+    try:
+        with open(_manifest_path()) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest):
+    tmp = _manifest_path() + ".tmp"
+    with open(tmp, "w") as file:
+        json.dump(manifest, file)
+    os.replace(tmp, _manifest_path())
+
+
+def _compiled_size(file_name):
+    size = 0
+    for file in glob.glob(os.path.join(qset.coeffroot, file_name + "*")):
+        try:
+            size += os.path.getsize(file)
+        except OSError:
+            pass
+    return size
+
+
+# Time at which this process last recorded the use of each compiled
+# coefficient, and the minimum interval, in seconds, between two records.
+_recorded_access = {}
+_ACCESS_REFRESH = 60.
+
+
+def _record_access(file_name, c_opt, force=False):
+    """
+    Mark the compiled coefficient as used now in the manifest. To limit the
+    locking of the manifest, the use of a coefficient is recorded again only
+    when the last record of this process is older than ``_ACCESS_REFRESH``,
+    unless ``force``. Nothing is recorded when the cache size is not bounded.
+    """
+    now = time.time()
+    if (
+        (c_opt['max_cache_files'] is None and c_opt['max_cache_size'] is None)
+        or not qset.coeff_write_ok
+        or (
+            not force
+            and now - _recorded_access.get(file_name, -np.inf)
+            < _ACCESS_REFRESH
+        )
+    ):
+        return
+    _recorded_access[file_name] = now
+    with _manifest_lock():
+        manifest = _read_manifest()
+        manifest[file_name] = {
+            "size": _compiled_size(file_name),
+            "access": now,
+        }
+        _write_manifest(manifest)
+
+
+def _evict_compiled(c_opt, keep):
+    """
+    Remove the least recently used compiled coefficients, other than
+    ``keep``, until the cache is within the ``max_cache_files`` and
+    ``max_cache_size`` budget.
+    """
+    max_files = c_opt['max_cache_files']
+    max_size = c_opt['max_cache_size']
+    if (max_files is None and max_size is None) or not qset.coeff_write_ok:
+        return
+    with _manifest_lock():
+        manifest = _read_manifest()
+        # Add coefficients compiled before the manifest existed. Only built
+        # modules are considered, not the sources of compilations in progress.
+        for path in glob.glob(os.path.join(qset.coeffroot, "qtcoeff_*")):
+            name, ext = os.path.basename(path).split(".", 1)
+            if (
+                name not in manifest
+                and "." + ext in importlib.machinery.EXTENSION_SUFFIXES
+            ):
+                manifest[name] = {
+                    "size": _compiled_size(name),
+                    "access": os.path.getmtime(path),
+                }
+        total = sum(entry["size"] for entry in manifest.values())
+        for name in sorted(manifest, key=lambda n: manifest[n]["access"]):
+            if (
+                (max_files is None or len(manifest) <= max_files)
+                and (max_size is None or total <= max_size)
+            ):
+                break
+            if name == keep:
+                continue
+            for file in glob.glob(os.path.join(qset.coeffroot, name + "*")):
+                try:
+                    os.remove(file)
+                except OSError:
+                    pass
+            total -= manifest.pop(name)["size"]
+        _write_manifest(manifest)
+
+
+# Compilations running in the background, by file name, and the process
+# pool running them. The pool is only started when first needed.
+_background_compilations = {}
+_background_executor = [None]
+
+
+def compile_in_background(code, file_name, parsed, c_opt):
+    """
+    Compile the code in a separate process and return the future of the
+    compilation. Each file is only compiled once.
+    """
+    future = _background_compilations.get(file_name)
+    if future is None or (future.done() and future.exception()):
+        if _background_executor[0] is None:
+            # ``compile_code`` changes the working directory, so it cannot
+            # run in a thread of this process.
+            _background_executor[0] = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+        options = {key: c_opt[key] for key in CompilationOptions._options}
+        future = _background_executor[0].submit(
+            _compile_in_subprocess, code, file_name, parsed, options,
+            qset.coeffroot,
+        )
+        _background_compilations[file_name] = future
+    return future
+
+
+def _compile_in_subprocess(code, file_name, parsed, c_opt, coeffroot):
+    qset.coeffroot = coeffroot
+    compile_code(code, file_name, parsed, c_opt)
+
+
+def _load_compiled(future, file_name, parsed, base, keys, const, args):
+    """
+    Create the compiled coefficient once the background compilation is done,
+    or return ``None`` if it failed.
+    """
+    if future.exception() is not None:
+        return None
+    importlib.invalidate_caches()
+    coeff = try_import(file_name, parsed)
+    if coeff is None:
+        return None
+    return coeff(base, keys, const, args)
 
 
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
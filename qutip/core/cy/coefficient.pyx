@@ -3,11 +3,13 @@
 
 import inspect
 import pickle
+import warnings
 import scipy
 from scipy.interpolate import make_interp_spline
 import numpy as np
 cimport numpy as cnp
 cimport cython
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 import qutip
 
 cdef extern from "<complex>" namespace "std" nogil:
@@ -17,7 +19,8 @@ cdef extern from "<complex>" namespace "std" nogil:
 
 __all__ = [
     "Coefficient",  "InterCoefficient", "FunctionCoefficient",
-    "StrFunctionCoefficient", "ConjCoefficient", "NormCoefficient"
+    "StrFunctionCoefficient", "ConjCoefficient", "NormCoefficient",
+    "DeferredCoefficient",
 ]
 
 
@@ -127,6 +130,34 @@ cdef class Coefficient:
                                                          **kwargs))._call(t)
         return self._call(t)
 
+    def evaluate(self, tlist):
+        """
+        Return the coefficient values at each time of ``tlist``.
+
+        Parameters
+        ----------
+        tlist : array_like
+            Times at which to evaluate the :obj:`.Coefficient`.
+
+        Returns
+        -------
+        values : np.ndarray
+            Complex array of the values, with the same shape as ``tlist``.
+        """
+        tlist = np.asarray(tlist, dtype=np.float64)
+        return self._evaluate(
+            np.ascontiguousarray(tlist.ravel())
+        ).reshape(tlist.shape)
+
+    def _evaluate(self, double[::1] tlist):
+        """Values at each time of the 1D array ``tlist``."""
+        cdef Py_ssize_t i
+        out = np.empty(tlist.shape[0], dtype=np.complex128)
+        cdef double complex[::1] out_view = out
+        for i in range(tlist.shape[0]):
+            out_view[i] = self._call(tlist[i])
+        return out
+
     cdef double complex _call(self, double t) except *:
         """Core computation of the :obj:`.Coefficient`."""
         # All Coefficient sub-classes should overwrite this or __call__
@@ -219,6 +250,12 @@ cdef class FunctionCoefficient(Coefficient):
             return self.func(t, **self.args)
         return self.func(t, self.args)
 
+    def _evaluate(self, tlist):
+        if self._f_pythonic:
+            return _vectorised(self, tlist,
+                               lambda t: self.func(t, **self.args))
+        return _vectorised(self, tlist, lambda t: self.func(t, self.args))
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return FunctionCoefficient(
@@ -260,6 +297,32 @@ cdef class FunctionCoefficient(Coefficient):
         )
 
 
+def _vectorised(Coefficient coeff, tlist, func):
+    """
+    Evaluate ``coeff`` at all times of ``tlist`` with one call of ``func``
+    on the array, when ``func`` supports arrays. The first and last values are
+    checked against scalar calls. Otherwise, fall back on a loop.
+    """
+    tlist = np.asarray(tlist)
+    if tlist.shape[0] == 0:
+        return np.empty(0, dtype=np.complex128)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            out = np.array(
+                np.broadcast_to(func(tlist), tlist.shape), dtype=np.complex128
+            )
+        except Exception:
+            out = None
+    if out is not None and np.allclose(
+        out[[0, -1]],
+        [coeff._call(tlist[0]), coeff._call(tlist[-1])],
+        rtol=1e-10, atol=0,
+    ):
+        return out
+    return Coefficient._evaluate(coeff, tlist)
+
+
 def proj(x):
     if np.isfinite(x):
         return (x)
@@ -347,6 +410,9 @@ def coeff(t, args):
     cdef complex _call(self, double t) except *:
         return self.func(t, self.args)
 
+    def _evaluate(self, tlist):
+        return _vectorised(self, tlist, lambda t: self.func(t, self.args))
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return StrFunctionCoefficient(self.base, self.args.copy())
@@ -536,14 +602,22 @@ cdef class InterCoefficient(Coefficient):
         return InterCoefficient.restore(*self.np_arrays, self.dt)
 
 
-cdef Coefficient add_inter(InterCoefficient left, InterCoefficient right):
-    """ Add two array coefficient with matching tlist into one."""
-    if (
+cdef bint _same_tlist(InterCoefficient left, InterCoefficient right):
+    """
+    Whether the two array coefficients share the same tlist and order, so
+    their polynomials can be added.
+    """
+    return (
         left.np_arrays[0].shape == right.np_arrays[0].shape
         and np.allclose(left.np_arrays[0], right.np_arrays[0],
                         rtol=1e-15, atol=1e-15)
         and (left.order == right.order)
-    ):
+    )
+
+
+cdef Coefficient add_inter(InterCoefficient left, InterCoefficient right):
+    """ Add two array coefficient with matching tlist into one."""
+    if _same_tlist(left, right):
         return InterCoefficient.restore(
             left.np_arrays[0], left.np_arrays[1] + right.np_arrays[1],
             left.dt
@@ -573,6 +647,9 @@ cdef class SumCoefficient(Coefficient):
     cdef complex _call(self, double t) except *:
         return self.first._call(t) + self.second._call(t)
 
+    def _evaluate(self, tlist):
+        return self.first._evaluate(tlist) + self.second._evaluate(tlist)
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return SumCoefficient(self.first.copy(), self.second.copy())
@@ -621,6 +698,9 @@ cdef class MulCoefficient(Coefficient):
     cdef complex _call(self, double t) except *:
         return self.first._call(t) * self.second._call(t)
 
+    def _evaluate(self, tlist):
+        return self.first._evaluate(tlist) * self.second._evaluate(tlist)
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return MulCoefficient(self.first.copy(), self.second.copy())
@@ -665,6 +745,9 @@ cdef class ConjCoefficient(Coefficient):
     cdef complex _call(self, double t) except *:
         return conj(self.base._call(t))
 
+    def _evaluate(self, tlist):
+        return np.conj(self.base._evaluate(tlist))
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return ConjCoefficient(self.base.copy())
@@ -731,6 +814,10 @@ cdef class NormCoefficient(Coefficient):
     cdef complex _call(self, double t) except *:
         return norm(self.base._call(t))
 
+    def _evaluate(self, tlist):
+        values = self.base._evaluate(tlist)
+        return (values.real**2 + values.imag**2).astype(np.complex128)
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return NormCoefficient(self.base.copy())
@@ -771,6 +858,470 @@ cdef class ConstantCoefficient(Coefficient):
     cdef complex _call(self, double t) except *:
         return self.value
 
+    def _evaluate(self, tlist):
+        return np.full(tlist.shape[0], self.value, dtype=np.complex128)
+
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return self
+
+
+cdef class FlatCoefficient(Coefficient):
+    """
+    A sum of products of :obj:`.Coefficient`, evaluated without walking a
+    tree of :obj:`SumCoefficient` and :obj:`MulCoefficient`::
+
+        sum(factor * prod(coeff(t) for coeff in coeffs)
+            for factor, coeffs in terms)
+
+    Each distinct coefficient is only evaluated once per call, even if it
+    appears in multiple terms. :obj:`FlatCoefficient` are usually created by
+    :func:`simplify`.
+
+    Parameters
+    ----------
+    terms : list of (complex, list of :obj:`.Coefficient`)
+        The terms of the sum: a constant factor and the coefficients it
+        multiplies.
+    """
+    cdef tuple leaves
+    cdef double complex[::1] factors
+    cdef Py_ssize_t[::1] offsets
+    cdef Py_ssize_t[::1] indices
+
+    def __init__(self, terms):
+        leaves = {}
+        offsets = [0]
+        indices = []
+        for _, coeffs in terms:
+            for coeff in coeffs:
+                if id(coeff) not in leaves:
+                    leaves[id(coeff)] = (len(leaves), coeff)
+                indices.append(leaves[id(coeff)][0])
+            offsets.append(len(indices))
+        self.leaves = tuple(coeff for _, coeff in leaves.values())
+        self.factors = np.array([factor for factor, _ in terms],
+                                dtype=np.complex128)
+        self.offsets = np.array(offsets, dtype=np.intp)
+        self.indices = np.array(indices, dtype=np.intp)
+
+    def terms(self):
+        """
+        The terms of the sum as a list of ``(factor, [coefficients])``.
+        """
+        return [
+            (
+                self.factors[i],
+                [self.leaves[self.indices[j]]
+                 for j in range(self.offsets[i], self.offsets[i + 1])]
+            )
+            for i in range(self.factors.shape[0])
+        ]
+
+    def _map_leaves(self, method, *args, **kwargs):
+        leaves = {
+            id(leaf): getattr(leaf, method)(*args, **kwargs)
+            for leaf in self.leaves
+        }
+        return FlatCoefficient([
+            (factor, [leaves[id(coeff)] for coeff in coeffs])
+            for factor, coeffs in self.terms()
+        ])
+
+    def replace_arguments(self, _args=None, **kwargs):
+        """
+        Replace the arguments (``args``) of a coefficient.
+
+        Returns a new :obj:`.Coefficient` if the coefficient has arguments, or
+        the original coefficient if it does not. Arguments to replace may be
+        supplied either in a dictionary as the first position argument, or
+        passed as keywords, or as a combination of the two. Arguments not
+        replaced retain their previous values.
+
+        Parameters
+        ----------
+        _args : dict
+            Dictionary of arguments to replace.
+
+        **kwargs
+            Arguments to replace.
+        """
+        return self._map_leaves("replace_arguments", _args, **kwargs)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef complex _call(self, double t) except *:
+        cdef Py_ssize_t i, j, n = len(self.leaves)
+        cdef double complex out = 0, prod
+        cdef double complex small[16]
+        cdef double complex *values = small
+        if n > 16:
+            values = <double complex *> PyMem_Malloc(
+                n * sizeof(double complex)
+            )
+            if values is NULL:
+                raise MemoryError()
+        try:
+            for i in range(n):
+                values[i] = (<Coefficient> self.leaves[i])._call(t)
+            for i in range(self.factors.shape[0]):
+                prod = self.factors[i]
+                for j in range(self.offsets[i], self.offsets[i + 1]):
+                    prod = prod * values[self.indices[j]]
+                out += prod
+        finally:
+            if values != small:
+                PyMem_Free(values)
+        return out
+
+    def _evaluate(self, tlist):
+        values = [leaf._evaluate(tlist) for leaf in self.leaves]
+        out = np.zeros(tlist.shape[0], dtype=np.complex128)
+        for i in range(self.factors.shape[0]):
+            prod = np.full(tlist.shape[0], self.factors[i])
+            for j in range(self.offsets[i], self.offsets[i + 1]):
+                prod *= values[self.indices[j]]
+            out += prod
+        return out
+
+    cpdef Coefficient copy(self):
+        """Return a copy of the :obj:`.Coefficient`."""
+        return self._map_leaves("copy")
+
+    def __reduce__(self):
+        return (FlatCoefficient, (self.terms(),))
+
+
+# Products of sums are only expanded up to this number of terms, larger ones
+# are kept as a product.
+cdef Py_ssize_t _MAX_EXPANDED_TERMS = 64
+
+
+def simplify(Coefficient coeff):
+    """
+    Rewrite a tree of :obj:`.Coefficient` built with ``+``, ``*``,
+    ``conj`` and ``norm`` as a single flat sum of products.
+
+    - Constant coefficients are folded into the factors of the terms.
+    - Terms with the same coefficients are merged.
+    - Interpolated coefficients sharing the same ``tlist`` and order are
+      merged into one :obj:`InterCoefficient`, constant terms are absorbed
+      in it.
+    - Coefficients from strings evaluated by python are fused into one
+      expression if their arguments agree.
+
+    Compiled string coefficients and function coefficients are kept as they
+    are, the result calls each of them once.
+
+    Parameters
+    ----------
+    coeff : :obj:`.Coefficient`
+        Coefficient to simplify.
+
+    Returns
+    -------
+    :obj:`.Coefficient`
+        An equivalent coefficient. A coefficient that cannot be simplified
+        is returned unchanged.
+    """
+    if not isinstance(
+        coeff, (SumCoefficient, MulCoefficient, ConjCoefficient,
+                NormCoefficient, FlatCoefficient)
+    ):
+        return coeff
+    return _build(_expand(coeff))
+
+
+cdef list _expand(Coefficient coeff):
+    """
+    Expand ``coeff`` as a sum of products: ``[(factor, [coeffs]), ...]``.
+    """
+    cdef list left, right, terms
+    if isinstance(coeff, ConstantCoefficient):
+        return [((<ConstantCoefficient> coeff).value, [])]
+    if isinstance(coeff, SumCoefficient):
+        return (
+            _expand((<SumCoefficient> coeff).first)
+            + _expand((<SumCoefficient> coeff).second)
+        )
+    if isinstance(coeff, FlatCoefficient):
+        return coeff.terms()
+    if isinstance(coeff, MulCoefficient):
+        left = _expand((<MulCoefficient> coeff).first)
+        right = _expand((<MulCoefficient> coeff).second)
+        if len(left) * len(right) > _MAX_EXPANDED_TERMS:
+            return [(1, [MulCoefficient(_build(left), _build(right))])]
+        return [
+            (factor_l * factor_r, coeffs_l + coeffs_r)
+            for factor_l, coeffs_l in left
+            for factor_r, coeffs_r in right
+        ]
+    if isinstance(coeff, ConjCoefficient):
+        return [
+            (conj(factor), [_conj_leaf(leaf) for leaf in coeffs])
+            for factor, coeffs in _expand((<ConjCoefficient> coeff).base)
+        ]
+    if isinstance(coeff, NormCoefficient):
+        terms = _expand((<NormCoefficient> coeff).base)
+        if len(terms) == 1:
+            factor, coeffs = terms[0]
+            return [(norm(factor), [NormCoefficient(leaf) for leaf in coeffs])]
+        return [(1, [NormCoefficient(_build(terms))])]
+    return [(1, [coeff])]
+
+
+cdef Coefficient _conj_leaf(Coefficient coeff):
+    cdef InterCoefficient inter
+    if isinstance(coeff, ConjCoefficient):
+        return (<ConjCoefficient> coeff).base
+    if isinstance(coeff, InterCoefficient):
+        inter = coeff
+        return InterCoefficient.restore(
+            inter.np_arrays[0], np.conj(inter.np_arrays[1]), inter.dt
+        )
+    return ConjCoefficient(coeff)
+
+
+cdef Coefficient _build(list terms):
+    """ Create the coefficient for the expanded ``terms``."""
+    # ``+`` and ``*`` copy their operands, use one instance per coefficient.
+    canonical = {}
+    merged = {}
+    for factor, coeffs in terms:
+        coeffs = [
+            canonical.setdefault(_leaf_key(leaf), leaf) for leaf in coeffs
+        ]
+        key = tuple(sorted(id(leaf) for leaf in coeffs))
+        if key in merged:
+            merged[key][0] += factor
+        else:
+            merged[key] = [factor, coeffs]
+    terms = [term for term in merged.values() if term[0] != 0]
+    terms = _fuse_str(_merge_inter(terms))
+    if not terms:
+        return ConstantCoefficient(0)
+    if len(terms) == 1:
+        factor, coeffs = terms[0]
+        if not coeffs:
+            return ConstantCoefficient(factor)
+        if len(coeffs) == 1 and factor == 1:
+            return coeffs[0]
+    return FlatCoefficient(terms)
+
+
+cdef object _leaf_key(Coefficient coeff):
+    """
+    Key identifying a coefficient and its copies, which share their function,
+    string or arrays.
+    """
+    cdef InterCoefficient inter
+    if isinstance(coeff, ConjCoefficient):
+        return (ConjCoefficient, _leaf_key((<ConjCoefficient> coeff).base))
+    if isinstance(coeff, NormCoefficient):
+        return (NormCoefficient, _leaf_key((<NormCoefficient> coeff).base))
+    if isinstance(coeff, InterCoefficient):
+        inter = coeff
+        return (
+            InterCoefficient, id(inter.np_arrays[0]), id(inter.np_arrays[1])
+        )
+    if type(coeff) not in (FunctionCoefficient, StrFunctionCoefficient):
+        return id(coeff)
+    args = tuple(sorted((key, id(value)) for key, value in coeff.args.items()))
+    if type(coeff) is FunctionCoefficient:
+        return (
+            FunctionCoefficient, id((<FunctionCoefficient> coeff).func),
+            (<FunctionCoefficient> coeff)._f_pythonic, args
+        )
+    return (
+        StrFunctionCoefficient, (<StrFunctionCoefficient> coeff).base, args
+    )
+
+
+cdef list _merge_inter(list terms):
+    """
+    Merge the terms made of one :obj:`InterCoefficient` with matching
+    ``tlist``, and absorb the constant term in one of them.
+    """
+    cdef InterCoefficient inter
+    out = []
+    # [first InterCoefficient, summed poly, number merged, first term]
+    groups = []
+    constant = None
+    for term in terms:
+        factor, coeffs = term
+        if not coeffs:
+            constant = term
+            continue
+        if len(coeffs) != 1 or not isinstance(coeffs[0], InterCoefficient):
+            out.append(term)
+            continue
+        inter = coeffs[0]
+        for group in groups:
+            if _same_tlist(group[0], inter):
+                group[1] = group[1] + factor * inter.np_arrays[1]
+                group[2] += 1
+                break
+        else:
+            groups.append([inter, factor * inter.np_arrays[1], 1, term])
+    if constant is not None and groups:
+        groups[0][1] = groups[0][1].copy()
+        groups[0][1][-1] += constant[0]
+        groups[0][2] += 1
+        constant = None
+    for first, poly, count, term in groups:
+        inter = first
+        if count == 1:
+            out.append(term)
+        else:
+            out.append((1, [InterCoefficient.restore(
+                inter.np_arrays[0], poly, inter.dt
+            )]))
+    if constant is not None:
+        out.append(constant)
+    return out
+
+
+cdef list _fuse_str(list terms):
+    """
+    Fuse the terms only made of :obj:`StrFunctionCoefficient` into one
+    expression when their arguments do not conflict.
+    """
+    out = []
+    fused = []
+    parts = []
+    args = {}
+    n_leaves = 0
+    for term in terms:
+        factor, coeffs = term
+        if not coeffs or not all(
+            type(leaf) is StrFunctionCoefficient for leaf in coeffs
+        ) or any(
+            key in args and not _same_arg(args[key], value)
+            for leaf in coeffs for key, value in leaf.args.items()
+        ):
+            out.append(term)
+            continue
+        for leaf in coeffs:
+            args.update(leaf.args)
+        code = " * ".join(
+            "(" + (<StrFunctionCoefficient> leaf).base + ")" for leaf in coeffs
+        )
+        if factor != 1:
+            code = repr(complex(factor)) + " * " + code
+        parts.append(code)
+        fused.append(term)
+        n_leaves += len(coeffs)
+    if n_leaves >= 2:
+        out.append((1, [StrFunctionCoefficient(" + ".join(parts), args)]))
+    else:
+        out += fused
+    return out
+
+
+cdef bint _same_arg(left, right):
+    if left is right:
+        return True
+    try:
+        return bool(left == right)
+    except Exception:
+        return False
+
+
+cdef class DeferredCoefficient(Coefficient):
+    """
+    A :obj:`.Coefficient` evaluated with a fallback until a replacement,
+    prepared in the background, is ready.
+
+    Used for string coefficients compiled in the background: the string is
+    evaluated with Python until the compiled version can be imported, at
+    which point it is swapped in.
+
+    Parameters
+    ----------
+    fallback : :obj:`.Coefficient`
+        The coefficient used until the replacement is ready.
+
+    future : concurrent.futures.Future
+        The background task preparing the replacement.
+
+    factory : callable
+        ``factory(args)`` is called once ``future`` is done and returns the
+        replacement coefficient for the arguments ``args``, or ``None`` to
+        keep using the fallback.
+    """
+    cdef Coefficient _coeff
+    cdef object _future
+    cdef object _factory
+    cdef bint _replaced
+
+    def __init__(self, Coefficient fallback, future, factory):
+        self._coeff = fallback
+        self._replaced = False
+        self._future = future
+        self._factory = factory
+        self.args = fallback.args
+
+    cdef Coefficient _current(self):
+        cdef Coefficient replacement
+        if self._future is not None and self._future.done():
+            replacement = self._factory(self.args)
+            if replacement is not None:
+                self._coeff = replacement
+                self._replaced = True
+            self._future = None
+            self._factory = None
+        return self._coeff
+
+    @property
+    def ready(self):
+        """
+        Whether the replacement coefficient is in use.  Stays ``False`` if
+        the background task failed and the fallback is kept.
+        """
+        self._current()
+        return self._replaced
+
+    def replace_arguments(self, _args=None, **kwargs):
+        """
+        Replace the arguments (``args``) of a coefficient.
+
+        Returns a new :obj:`.Coefficient` if the coefficient has arguments, or
+        the original coefficient if it does not. Arguments to replace may be
+        supplied either in a dictionary as the first position argument, or
+        passed as keywords, or as a combination of the two. Arguments not
+        replaced retain their previous values.
+
+        Parameters
+        ----------
+        _args : dict
+            Dictionary of arguments to replace.
+
+        **kwargs
+            Arguments to replace.
+        """
+        coeff = self._current().replace_arguments(_args, **kwargs)
+        if self._future is None:
+            return coeff
+        return DeferredCoefficient(coeff, self._future, self._factory)
+
+    cdef complex _call(self, double t) except *:
+        return self._current()._call(t)
+
+    def _evaluate(self, tlist):
+        return self._current()._evaluate(tlist)
+
+    cpdef Coefficient copy(self):
+        """Return a copy of the :obj:`.Coefficient`."""
+        coeff = self._current().copy()
+        if self._future is None:
+            return coeff
+        return DeferredCoefficient(coeff, self._future, self._factory)
+
+    def __reduce__(self):
+        # The background task cannot be pickled: the current coefficient is
+        # sent instead.
+        return (_identity, (self._current(),))
+
+
+def _identity(coeff):
+    return coeff
@@ -1,9 +1,8 @@
 #cython: language_level=3
 
-cimport numpy as cnp
-cimport cython
+from qutip.core.data.base cimport idxint
 
 cdef void spmvpy_openmp(
-    complex *data, int *ind, int *ptr, complex * vec, complex a, complex * out,
-    unsigned int nrows, unsigned int nthr,
-)
+    double complex *data, idxint *ind, idxint *ptr, double complex *vec,
+    double complex a, double complex *out, idxint nrows, int nthr,
+) noexcept nogil
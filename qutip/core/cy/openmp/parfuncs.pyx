@@ -1,13 +1,15 @@
 #cython: language_level=3
 
+from qutip.core.data.base cimport idxint
+
 cdef extern from "src/zspmv_openmp.hpp" nogil:
-    void zspmvpy_openmp(double complex *data, int *ind, int *ptr, double complex *vec,
-                double complex a, double complex *out, int nrows, int nthr)
+    void zspmvpy_openmp[T](
+        double complex *data, T *ind, T *ptr, double complex *vec,
+        double complex a, double complex *out, T nrows, int nthr)
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef inline void spmvpy_openmp(complex * data, int * ind, int * ptr,
-                               complex * vec, complex a, complex * out,
-                               unsigned int nrows, unsigned int nthr):
+cdef void spmvpy_openmp(
+    double complex *data, idxint *ind, idxint *ptr, double complex *vec,
+    double complex a, double complex *out, idxint nrows, int nthr,
+) noexcept nogil:
     zspmvpy_openmp(data, ind, ptr, vec, a, out, nrows, nthr)
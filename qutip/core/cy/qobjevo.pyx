@@ -10,7 +10,7 @@ import qutip
 from .. import Qobj
 from .. import data as _data
 from ..dimensions import Dimensions
-from ..coefficient import coefficient, CompilationOptions
+from ..coefficient import coefficient, CompilationOptions, simplify
 from ._element import *
 from qutip.settings import settings
 
@@ -824,9 +824,22 @@ cdef class QobjEvo:
                 qobjs.append(element.qobj(0))
                 coeffs.append(element._coefficient)
         for qobj, coeff in zip(qobjs, coeffs):
-            cleaned_elements.append(_EvoElement(qobj, coeff))
+            cleaned_elements.append(_EvoElement(qobj, simplify(coeff)))
         return cleaned_elements
 
+    def _map_coefficients(QobjEvo self, func):
+        """
+        Return a copy where the coefficient of each ``[Qobj, Coefficient]``
+        term is replaced by ``func(coefficient)``.
+        """
+        cdef QobjEvo res = self.copy()
+        res.elements = [
+            _EvoElement(element.qobj(0), func(element._coefficient))
+            if type(element) is _EvoElement else element
+            for element in res.elements
+        ]
+        return res
+
     def compress(self):
         """
         Look for redundance in the :obj:`.QobjEvo` components:
@@ -838,6 +851,14 @@ cdef class QobjEvo:
         Example:
         ``[[sigmax(), f1], [sigmax(), f2]] -> [[sigmax(), f1+f2]]``
 
+        The coefficients are then flattened with
+        :func:`~qutip.core.coefficient.simplify`: constants are folded, and
+        sums and products of coefficients are evaluated as one flat
+        expression.
+
+        Terms whose data is a lazy :class:`~qutip.core.data.KronOp` are kept
+        as they are, since summing them would build the full matrices.
+
         The :obj:`.QobjEvo` is transformed inplace.
 
         Returns
@@ -847,8 +868,14 @@ cdef class QobjEvo:
         cte_elements = []
         coeff_elements = []
         func_elements = []
+        lazy_elements = []
         for element in self.elements:
-            if type(element) is _ConstantElement:
+            if (
+                type(element) in (_ConstantElement, _EvoElement)
+                and type(element.qobj(0).data) is _data.KronOp
+            ):
+                lazy_elements.append(element)
+            elif type(element) is _ConstantElement:
                 cte_elements.append(element)
             elif type(element) is _EvoElement:
                 coeff_elements.append(element)
@@ -864,7 +891,7 @@ cdef class QobjEvo:
             cleaned_elements += cte_elements
 
         coeff_elements = self._compress_merge_qobj(coeff_elements)
-        cleaned_elements += coeff_elements + func_elements
+        cleaned_elements += coeff_elements + lazy_elements + func_elements
 
         self.elements = cleaned_elements
 
@@ -998,6 +1025,96 @@ cdef class QobjEvo:
         # TODO: remove reading from `settings` for a typed value when options
         # support property.
         cdef float herm_rtol = settings.core['rtol']
+        self._check_expect_state(state)
+        out = self.expect_data(t, state.data)
+        if (
+            check_real and
+            (out == 0 or (out.real and fabs(out.imag / out.real) < herm_rtol))
+        ):
+            return out.real
+        return out
+
+    def expect_tlist(QobjEvo self, tlist, states, check_real=True):
+        """
+        Expectation values of this operator over the times of ``tlist``.
+
+        Equivalent to ``[self.expect(t, state) for t in tlist]``, or with one
+        state per time when ``states`` is a list, but the coefficients are
+        evaluated for all times at once with :meth:`.Coefficient.evaluate`
+        and the expectation value of each operator is computed only once for
+        a single state.
+
+        Parameters
+        ----------
+        tlist : array_like
+            Times at which to compute the expectation values.
+
+        states : Qobj or list of Qobj
+            State used at every time, or one state for each time of
+            ``tlist``.
+
+        check_real : bool (True)
+            Whether to convert the result to a `real` array when all the
+            imaginary parts are smaller than the real parts by a factor of
+            ``settings.core['rtol']``.
+
+        Returns
+        -------
+        expect : np.ndarray
+            Expectation values at each time of ``tlist``.
+        """
+        cdef double herm_rtol = settings.core['rtol']
+        tlist = np.asarray(tlist, dtype=np.float64)
+        single = isinstance(states, Qobj)
+        if single:
+            states = [states]
+        elif len(states) != len(tlist):
+            raise ValueError("One state per time in tlist is expected")
+        for state in states:
+            self._check_expect_state(state)
+
+        if self._feedback_functions:
+            # The arguments depend on the state at each time.
+            if single:
+                states = states * len(tlist)
+            out = np.array([
+                self.expect_data(t, state.data)
+                for t, state in zip(tlist, states)
+            ], dtype=np.complex128)
+        else:
+            datas = [state.data for state in states]
+            if self.issuper:
+                datas = [
+                    _data.column_stack(data) if data.shape[1] != 1 else data
+                    for data in datas
+                ]
+                expect_func = _data.expect_super
+            else:
+                expect_func = _data.expect
+            per_time = datas * len(tlist) if single else datas
+            out = np.zeros(len(tlist), dtype=np.complex128)
+            for element in self.elements:
+                if type(element) is _ConstantElement:
+                    values = 1.
+                elif type(element) is _EvoElement:
+                    values = element._coefficient.evaluate(tlist)
+                else:
+                    # Operators changing with time, no shortcut.
+                    out += [
+                        element.coeff(t) * expect_func(element.data(t), data)
+                        for t, data in zip(tlist, per_time)
+                    ]
+                    continue
+                out += values * np.array([
+                    expect_func(element.data(0), data) for data in datas
+                ], dtype=np.complex128)
+        if check_real and np.all(
+            (out == 0) | (np.abs(out.imag) < herm_rtol * np.abs(out.real))
+        ):
+            return out.real
+        return out
+
+    def _check_expect_state(QobjEvo self, state):
         if not isinstance(state, Qobj):
             raise TypeError("A Qobj state is expected")
         if not (self.isoper or self.issuper):
@@ -1009,13 +1126,6 @@ cdef class QobjEvo:
         ):
             raise ValueError("incompatible dimensions " + str(self.dims) +
                              ", " + str(state.dims))
-        out = self.expect_data(t, state.data)
-        if (
-            check_real and
-            (out == 0 or (out.real and fabs(out.imag / out.real) < herm_rtol))
-        ):
-            return out.real
-        return out
 
     cpdef object expect_data(QobjEvo self, object t, Data state):
         """
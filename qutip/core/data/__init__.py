@@ -47,6 +47,11 @@ to.register_aliases(['csr', 'CSR'], CSR)
 to.register_aliases(['Dense', 'dense'], Dense)
 to.register_aliases(['DIA', 'Dia', 'dia', 'diag'], Dia)
 
+# Lazy Kronecker products are built on top of the types above: the module
+# registers its own conversions and specialisations once those are known.
+from . import kronop
+from .kronop import KronOp
+
 
 from . import _creator_utils
 import numpy as np
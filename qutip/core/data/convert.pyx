@@ -172,6 +172,10 @@ cdef class _to:
     this object, and then rebuilding all of the mathematical dispatchers.  See
     the docstring of that method for more information.
 
+    The `dtypes` attribute lists the general purpose types, which support all
+    data-layer operations.  Special purpose types, such as lazy operators, are
+    known to the conversions and dispatchers but are not part of `dtypes`.
+
 
     Efficiency notes
     ----------------
@@ -185,6 +189,7 @@ cdef class _to:
     """
 
     cdef readonly set dtypes
+    cdef readonly set _all_dtypes
     cdef readonly list dispatchers
     cdef dict _direct_convert
     cdef dict _convert
@@ -195,11 +200,12 @@ cdef class _to:
         self._direct_convert = {}
         self._convert = {}
         self.dtypes = set()
+        self._all_dtypes = set()
         self.weight = {}
         self.dispatchers = []
         self._str2type = {}
 
-    def add_conversions(self, converters):
+    def add_conversions(self, converters, general=True):
         """
         Add conversion functions between different data types.  This is an
         advanced function, and is only intended for the QuTiP user who wants to
@@ -245,6 +251,11 @@ cdef class _to:
                 the `weights` attribute of this object.
                 Weight of ~0.001 are should be used in case when no conversion
                 is needed or ``converter = lambda mat : mat``.
+
+        general : bool, optional (True)
+            Whether the data types seen here for the first time are general
+            purpose types, listed in `dtypes`.  Special purpose types, which
+            only implement some operations efficiently, should not be.
         """
         for arg in converters:
             if len(arg) == 3:
@@ -260,13 +271,16 @@ cdef class _to:
                 raise TypeError(repr(from_type) + " is not a type object")
             if not isinstance(weight, numbers.Real) or weight <= 0:
                 raise TypeError("weight " + repr(weight) + " is not valid")
-            self.dtypes.add(from_type)
-            self.dtypes.add(to_type)
+            for dtype in (from_type, to_type):
+                if dtype not in self._all_dtypes:
+                    self._all_dtypes.add(dtype)
+                    if general:
+                        self.dtypes.add(dtype)
             self._direct_convert[(to_type, from_type)] = (converter, weight)
         # Two-way mapping to convert between the type of a dtype and an integer
         # enumeration value for it.
         order, index = [], {}
-        for i, dtype in enumerate(self.dtypes):
+        for i, dtype in enumerate(self._all_dtypes):
             order.append(dtype)
             index[dtype] = i
         # Treat the conversion problem as a shortest-path graph problem.  We
@@ -303,7 +317,7 @@ cdef class _to:
                 self.weight[(to_t, from_t)] = weight
                 self._convert[(to_t, from_t)] =\
                     _converter(convert[::-1], to_t, from_t)
-        for dtype in self.dtypes:
+        for dtype in self._all_dtypes:
             self.weight[(dtype, Data)] = 1.
             self.weight[(Data, dtype)] = EPSILON
             self._convert[(dtype, Data)] = _partial_converter(self, dtype)
@@ -325,7 +339,7 @@ cdef class _to:
             Data-layer type, must have been registered with
             :meth:`add_conversions` first.
         """
-        if layer_type not in self.dtypes:
+        if layer_type not in self._all_dtypes:
             raise ValueError(
                 "Type is not a data-layer type: " + repr(layer_type))
         if isinstance(aliases, str):
@@ -359,7 +373,7 @@ cdef class _to:
             type.
         """
         if type(dtype) is type:
-            if dtype not in self.dtypes and dtype is not Data:
+            if dtype not in self._all_dtypes and dtype is not Data:
                 raise ValueError(
                     "Type is not a data-layer type: " + repr(dtype))
             return dtype
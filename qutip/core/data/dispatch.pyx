@@ -279,7 +279,7 @@ cdef class Dispatcher:
             for i in range(self._n_dispatch):
                 if (
                     not _defer
-                    and arg[i] not in _to.dtypes
+                    and arg[i] not in _to._all_dtypes
                     and arg[i] is not Data
                 ):
                     raise ValueError(str(arg[i]) + " is not a known data type")
@@ -340,7 +340,7 @@ cdef class Dispatcher:
         """
         if not self._specialisations:
             return
-        self._dtypes = _to.dtypes.copy()
+        self._dtypes = _to._all_dtypes.copy()
         for in_types in itertools.product(self._dtypes, repeat=self._n_dispatch):
             self._find_specialization(in_types, self.output)
         # Now build the lookup table in the case that we dispatch on the output
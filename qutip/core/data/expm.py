@@ -1,7 +1,9 @@
+import inspect
 import numpy as np
 import scipy.sparse.linalg
 import scipy.linalg
 
+from .base import Data
 from .dense import Dense
 from .csr import CSR
 from .dia import Dia
@@ -9,12 +11,23 @@ from . import dia
 from .properties import isdiag_csr, isdiag_dia
 from qutip.settings import settings
 from .base import idxint_dtype
+from .matmul import matmul
+from .adjoint import adjoint
+from .trace import trace
+from .convert import to
 
 __all__ = [
     'expm', 'expm_csr', 'expm_csr_dense', 'expm_dense', 'expm_dia',
+    'expm_multiply', 'expm_multiply_csr_dense', 'expm_multiply_dense',
+    'expm_multiply_data',
     'logm', 'logm_dense',
 ]
 
+# ``traceA`` was added in scipy 1.9, it is needed for linear operators.
+_EXPM_MULTIPLY_TRACE = (
+    "traceA" in inspect.signature(scipy.sparse.linalg.expm_multiply).parameters
+)
+
 
 def expm_csr(matrix: CSR) -> CSR:
     if matrix.shape[0] != matrix.shape[1]:
@@ -87,10 +100,118 @@ def expm_dense(matrix: Dense) -> Dense:
     return Dense(scipy.linalg.expm(matrix.as_ndarray()), copy=False)
 
 
+def _expm_multiply(A, state, t, **kwargs):
+    """
+    Apply ``exp(t A)`` on ``state`` for a scalar or a list of ``t``, where
+    ``A`` is anything accepted by ``scipy.sparse.linalg.expm_multiply``.
+    """
+    if state.shape[0] != A.shape[1] or A.shape[0] != A.shape[1]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(A.shape)
+            + " and "
+            + str(state.shape)
+        )
+    b = state.to_array()
+    if np.ndim(t) == 0:
+        return Dense(
+            scipy.sparse.linalg.expm_multiply(A * t, b, **kwargs), copy=False
+        )
+    # Times in the same direction from 0 are reached by stepping from one to
+    # the next by increasing magnitude: the cost only depends on the span of
+    # the times, not their number, and no step goes backward.
+    times = np.asarray(t)
+    times = times.astype(complex if np.iscomplexobj(times) else float)
+    rays = {}
+    for k, t_ in enumerate(times):
+        direction = np.round(np.angle(t_), 12) if t_ != 0 else None
+        rays.setdefault(direction, []).append(k)
+    out = [None] * len(times)
+    for indices in rays.values():
+        b = state.to_array()
+        t_prev = 0.
+        for k in sorted(indices, key=lambda k: abs(times[k])):
+            if times[k] != t_prev:
+                b = scipy.sparse.linalg.expm_multiply(
+                    A * (times[k] - t_prev), b, **kwargs
+                )
+                t_prev = times[k]
+            out[k] = Dense(b, copy=True)
+    return out
+
+
+def expm_multiply_csr_dense(matrix, state, t=1.):
+    return _expm_multiply(matrix.as_scipy(), state, t)
+
+
+def expm_multiply_dense(matrix, state, t=1.):
+    return _expm_multiply(matrix.as_ndarray(), state, t)
+
+
+def expm_multiply_data(matrix, state, t=1.):
+    if not _EXPM_MULTIPLY_TRACE:
+        return expm_multiply_csr_dense(to(CSR, matrix), state, t)
+    matrix_dag = adjoint(matrix)
+    operator = scipy.sparse.linalg.LinearOperator(
+        matrix.shape,
+        matvec=lambda x: matmul(
+            matrix, Dense(x.reshape(-1, 1)), dtype=Dense
+        ).as_ndarray(),
+        rmatvec=lambda x: matmul(
+            matrix_dag, Dense(x.reshape(-1, 1)), dtype=Dense
+        ).as_ndarray(),
+        matmat=lambda x: matmul(matrix, Dense(x), dtype=Dense).as_ndarray(),
+        dtype=complex,
+    )
+    return _expm_multiply(operator, state, t, traceA=trace(matrix))
+
+
 from .dispatch import Dispatcher as _Dispatcher
 import inspect as _inspect
 
 
+expm_multiply = _Dispatcher(
+    _inspect.Signature([
+        _inspect.Parameter('matrix', _inspect.Parameter.POSITIONAL_ONLY),
+        _inspect.Parameter('state', _inspect.Parameter.POSITIONAL_ONLY),
+        _inspect.Parameter('t', _inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                           default=1.),
+    ]),
+    name='expm_multiply',
+    module=__name__,
+    inputs=('matrix', 'state'),
+    out=False,
+)
+expm_multiply.__doc__ = """
+    Action of the matrix exponential ``exp(t A) @ v``, computed with a
+    truncated Taylor series without building ``exp(t A)``.
+
+    Parameters
+    ----------
+    matrix : Data
+        The square matrix ``A``.
+
+    state : Data
+        The vector or matrix ``v``.
+
+    t : float, complex or array_like, default: 1.
+        Time, or list of times, at which to compute ``exp(t A) @ v``. The
+        times do not need to be sorted.
+
+    Returns
+    -------
+    out : Dense or list of Dense
+        ``exp(t A) @ v``, or the list of ``exp(t_k A) @ v`` for each ``t_k``
+        when ``t`` is a list.
+"""
+expm_multiply.add_specialisations([
+    (CSR, Data, expm_multiply_csr_dense),
+    (Dia, Data, expm_multiply_csr_dense),
+    (Dense, Data, expm_multiply_dense),
+    (Data, Data, expm_multiply_data),
+], _defer=True)
+
+
 expm = _Dispatcher(
     _inspect.Signature([
         _inspect.Parameter('matrix', _inspect.Parameter.POSITIONAL_ONLY),
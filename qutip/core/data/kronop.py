@@ -0,0 +1,398 @@
+"""
+Lazy Kronecker product data-layer type.
+
+A :class:`KronOp` stores the local operators of a tensor product together with
+the subsystems they act on, instead of the full matrix.  Its product with a
+:class:`Dense` state contracts each local operator with the corresponding axes
+of the state reshaped as a tensor, so an operator acting on one of ``N``
+subsystems never needs to be built as a ``prod(dims) x prod(dims)`` matrix.
+
+Sums of Kronecker products are not Kronecker products: adding or subtracting
+``KronOp`` builds the full matrices and returns a :class:`CSR`.  ``KronOp`` is
+a special purpose type, not part of ``data.to.dtypes``.
+"""
+
+import numpy as np
+
+from .base import Data
+from .dense import Dense
+from .csr import CSR
+from . import csr
+from .convert import to
+from .add import add, add_csr, sub, sub_csr
+from .matmul import matmul, matmul_csr
+from .mul import mul, neg
+from .pow import pow
+from .expm import expm, expm_csr
+from .adjoint import adjoint, transpose, conj
+from .kron import kron, kron_csr
+from .trace import trace
+from .properties import isherm, isherm_csr
+
+__all__ = [
+    'KronOp', 'matmul_kronop', 'matmul_kronop_dense',
+    'add_kronop', 'sub_kronop', 'pow_kronop',
+    'expm_kronop',
+    'mul_kronop', 'neg_kronop',
+    'adjoint_kronop', 'transpose_kronop', 'conj_kronop', 'kron_kronop',
+    'trace_kronop', 'isherm_kronop',
+]
+
+
+class KronOp(Data):
+    """
+    Lazy Kronecker product of operators acting on some subsystems of a
+    composite space, with the identity on the other subsystems::
+
+        scale * (... ⊗ factors[0] ⊗ ... ⊗ factors[1] ⊗ ...)
+
+    Parameters
+    ----------
+    dims : list of int or [list of int, list of int]
+        Dimension of each subsystem.  Like the ``dims`` of a ``Qobj``, a pair
+        of lists gives the dimensions of the output and input spaces; they
+        can only differ on the targeted subsystems.
+
+    factors : list of Data, optional
+        Operators, each acting on the subsystems given by the corresponding
+        entry of ``targets``.  A factor acting on many subsystems is ordered
+        as ``targets``: ``factors[0]`` acting on ``[2, 0]`` is an operator on
+        the space ``dims[2] ⊗ dims[0]``.
+
+    targets : list of (int or list of int), optional
+        Subsystems acted on by each factor.  A subsystem can only be
+        targeted by one factor.
+
+    scale : complex, default: 1
+        Scalar multiplying the product.
+    """
+    def __init__(self, dims, factors=(), targets=(), scale=1):
+        if len(dims) == 2 and not np.isscalar(dims[0]):
+            dims_out, dims_in = dims
+        else:
+            dims_out = dims_in = dims
+        dims_out = tuple(int(dim) for dim in dims_out)
+        dims_in = tuple(int(dim) for dim in dims_in)
+        targets = tuple(
+            (int(target),) if np.isscalar(target)
+            else tuple(int(sub) for sub in target)
+            for target in targets
+        )
+        factors = tuple(factors)
+        if len(dims_out) != len(dims_in):
+            raise ValueError("The output and input spaces must have the same "
+                             "number of subsystems.")
+        if len(factors) != len(targets):
+            raise ValueError("There must be one list of targets per factor.")
+        flat_targets = [sub for target in targets for sub in target]
+        if len(set(flat_targets)) != len(flat_targets):
+            raise ValueError("Each subsystem can only be targeted once.")
+        if any(not 0 <= sub < len(dims_in) for sub in flat_targets):
+            raise ValueError("Targets must be subsystems of " + str(dims_in))
+        for sub, (dim_out, dim_in) in enumerate(zip(dims_out, dims_in)):
+            if dim_out != dim_in and sub not in flat_targets:
+                raise ValueError("Subsystems which are not targeted must "
+                                 "have the same output and input dimension.")
+        for factor, target in zip(factors, targets):
+            shape = (
+                int(np.prod([dims_out[sub] for sub in target])),
+                int(np.prod([dims_in[sub] for sub in target])),
+            )
+            if factor.shape != shape:
+                raise ValueError(
+                    "Factor of shape " + str(factor.shape)
+                    + " can not act on subsystems " + str(target)
+                    + " of dimensions " + str([dims_out, dims_in])
+                )
+        super().__init__(
+            (int(np.prod(dims_out)), int(np.prod(dims_in)))
+        )
+        self.dims = (dims_out, dims_in)
+        self.factors = factors
+        self.targets = targets
+        self.scale = complex(scale)
+
+    def _replace(self, factors, scale, dims=None):
+        return KronOp(dims or self.dims, factors, self.targets, scale)
+
+    def to_array(self):
+        return to_csr(self).to_array()
+
+    def trace(self):
+        return trace_kronop(self)
+
+    def adjoint(self):
+        return adjoint_kronop(self)
+
+    def conj(self):
+        return conj_kronop(self)
+
+    def transpose(self):
+        return transpose_kronop(self)
+
+    def copy(self):
+        return self._replace(
+            [factor.copy() for factor in self.factors], self.scale
+        )
+
+    def __repr__(self):
+        return "".join([
+            "KronOp(dims=", repr(list(self.dims)),
+            ", targets=", repr(self.targets),
+            ", scale=", repr(self.scale), ")",
+        ])
+
+
+def _natural_order(dims, order):
+    """
+    Indices, in the space ordered as the subsystems ``order``, of the
+    elements of the space with the subsystems in their natural order.
+    """
+    indices = np.arange(int(np.prod(dims)))
+    indices = indices.reshape([dims[sub] for sub in order])
+    return indices.transpose(np.argsort(order)).ravel()
+
+
+def to_csr(matrix):
+    """Build the full Kronecker product of a ``KronOp`` as a ``CSR``."""
+    dims_out, dims_in = matrix.dims
+    dims = list(dims_in)
+    out = csr.identity(matrix.shape[1], matrix.scale)
+    for factor, target in zip(matrix.factors, matrix.targets):
+        rest = [sub for sub in range(len(dims)) if sub not in target]
+        order = list(target) + rest
+        new_dims = list(dims)
+        for sub in target:
+            new_dims[sub] = dims_out[sub]
+        # Expand the factor in the space ordered as `order`, then permute the
+        # rows and columns back to the natural order.
+        expanded = kron_csr(
+            to(CSR, factor),
+            csr.identity(int(np.prod([dims[sub] for sub in rest]))),
+        ).as_scipy()
+        expanded = expanded[_natural_order(new_dims, order)]
+        expanded = expanded[:, _natural_order(dims, order)]
+        out = matmul_csr(CSR(expanded, copy=False), out)
+        dims = new_dims
+    return out
+
+
+def _wrap(matrix):
+    return KronOp([[matrix.shape[0]], [matrix.shape[1]]], [matrix], [0])
+
+
+def from_data(matrix):
+    """
+    Wrap a matrix as a ``KronOp`` with a single factor acting on the whole
+    space.
+    """
+    return _wrap(matrix.copy())
+
+
+def matmul_kronop_dense(left, right, scale=1):
+    if left.shape[1] != right.shape[0]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+    dims_out, dims_in = left.dims
+    state = right.as_ndarray().reshape(dims_in + (right.shape[1],))
+    for factor, target in zip(left.factors, left.targets):
+        n = len(target)
+        # Bring the targeted axes first and apply the factor to the state as
+        # a matrix of shape (prod(dims_in[target]), -1), so sparse factors
+        # use the sparse product.
+        state = np.moveaxis(state, target, range(n))
+        shape = state.shape
+        state = np.ascontiguousarray(state).reshape(factor.shape[1], -1)
+        state = matmul(factor, Dense(state, copy=False), dtype=Dense)
+        state = state.as_ndarray().reshape(
+            tuple(dims_out[sub] for sub in target) + shape[n:]
+        )
+        state = np.moveaxis(state, range(n), target)
+    out = state.reshape((left.shape[0], right.shape[1])) * (scale * left.scale)
+    return Dense(out, copy=False)
+
+
+def matmul_kronop(left, right, scale=1):
+    if left.shape[1] != right.shape[0]:
+        raise ValueError(
+            "incompatible matrix shapes "
+            + str(left.shape)
+            + " and "
+            + str(right.shape)
+        )
+    if left.dims[1] == right.dims[0] and left.targets == right.targets:
+        # Factors acting on the same subsystems multiply together.
+        return KronOp(
+            [left.dims[0], right.dims[1]],
+            [
+                matmul(factor_l, factor_r)
+                for factor_l, factor_r in zip(left.factors, right.factors)
+            ],
+            left.targets,
+            scale * left.scale * right.scale,
+        )
+    return _wrap(matmul_csr(to_csr(left), to_csr(right), scale))
+
+
+def add_kronop(left, right, scale=1):
+    """
+    Sum of two ``KronOp`` as a ``CSR`` matrix.  Sums of Kronecker products are
+    not Kronecker products, so the full matrices are built.
+    """
+    return add_csr(to_csr(left), to_csr(right), scale)
+
+
+def sub_kronop(left, right):
+    """
+    Difference of two ``KronOp`` as a ``CSR`` matrix.  The full matrices are
+    built, as for :func:`add_kronop`.
+    """
+    return sub_csr(to_csr(left), to_csr(right))
+
+
+def pow_kronop(matrix, n):
+    if matrix.dims[0] != matrix.dims[1]:
+        raise ValueError("matrix power only works with square matrices")
+    return matrix._replace(
+        [pow(factor, n) for factor in matrix.factors], matrix.scale**n
+    )
+
+
+def expm_kronop(matrix):
+    if matrix.dims[0] != matrix.dims[1]:
+        raise ValueError("can only exponentiate square matrix")
+    if not matrix.factors:
+        return matrix._replace((), np.exp(matrix.scale))
+    if len(matrix.factors) == 1:
+        # exp(s A ⊗ 1) = exp(s A) ⊗ 1
+        return matrix._replace(
+            [expm(mul(matrix.factors[0], matrix.scale))], 1
+        )
+    return _wrap(expm_csr(to_csr(matrix)))
+
+
+def mul_kronop(matrix, value):
+    return matrix._replace(matrix.factors, matrix.scale * value)
+
+
+def neg_kronop(matrix):
+    return matrix._replace(matrix.factors, -matrix.scale)
+
+
+def adjoint_kronop(matrix):
+    return matrix._replace(
+        [adjoint(factor) for factor in matrix.factors],
+        matrix.scale.conjugate(),
+        matrix.dims[::-1],
+    )
+
+
+def transpose_kronop(matrix):
+    return matrix._replace(
+        [transpose(factor) for factor in matrix.factors],
+        matrix.scale,
+        matrix.dims[::-1],
+    )
+
+
+def conj_kronop(matrix):
+    return matrix._replace(
+        [conj(factor) for factor in matrix.factors],
+        matrix.scale.conjugate(),
+    )
+
+
+def kron_kronop(left, right):
+    shift = len(left.dims[1])
+    return KronOp(
+        [left.dims[0] + right.dims[0], left.dims[1] + right.dims[1]],
+        left.factors + right.factors,
+        left.targets + tuple(
+            tuple(sub + shift for sub in target) for target in right.targets
+        ),
+        left.scale * right.scale,
+    )
+
+
+def trace_kronop(matrix):
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("".join([
+            "matrix shape ", str(matrix.shape), " is not square.",
+        ]))
+    out = matrix.scale
+    targeted = set()
+    for factor, target in zip(matrix.factors, matrix.targets):
+        out *= trace(factor)
+        targeted.update(target)
+    for sub, dim in enumerate(matrix.dims[1]):
+        if sub not in targeted:
+            out *= dim
+    return out
+
+
+def isherm_kronop(matrix, tol=-1):
+    # Hermitian factors with a real scale are sufficient, but not necessary.
+    if matrix.dims[0] != matrix.dims[1]:
+        return False
+    if matrix.scale.imag == 0 and all(
+        isherm(factor, tol) for factor in matrix.factors
+    ):
+        return True
+    return isherm_csr(to_csr(matrix), tol)
+
+
+# Wrapping a matrix is cheap, but building the full product can be very
+# expensive: give weights such that the dispatcher keep the products lazy, and
+# that no conversion between the other types goes through ``KronOp``.  It
+# only implements some operations lazily, so it is not a general purpose type.
+to.add_conversions([
+    (KronOp, CSR, from_data, 0.5),
+    (KronOp, Dense, from_data, 0.5),
+    (CSR, KronOp, to_csr, 2),
+], general=False)
+to.register_aliases(['KronOp', 'kronop'], KronOp)
+
+matmul.add_specialisations([
+    (KronOp, KronOp, KronOp, matmul_kronop),
+    (KronOp, Dense, Dense, matmul_kronop_dense),
+])
+add.add_specialisations([
+    (KronOp, KronOp, CSR, add_kronop),
+])
+sub.add_specialisations([
+    (KronOp, KronOp, CSR, sub_kronop),
+])
+pow.add_specialisations([
+    (KronOp, KronOp, pow_kronop),
+])
+expm.add_specialisations([
+    (KronOp, KronOp, expm_kronop),
+])
+mul.add_specialisations([
+    (KronOp, KronOp, mul_kronop),
+])
+neg.add_specialisations([
+    (KronOp, KronOp, neg_kronop),
+])
+adjoint.add_specialisations([
+    (KronOp, KronOp, adjoint_kronop),
+])
+transpose.add_specialisations([
+    (KronOp, KronOp, transpose_kronop),
+])
+conj.add_specialisations([
+    (KronOp, KronOp, conj_kronop),
+])
+kron.add_specialisations([
+    (KronOp, KronOp, KronOp, kron_kronop),
+])
+trace.add_specialisations([
+    (KronOp, trace_kronop),
+])
+isherm.add_specialisations([
+    (KronOp, isherm_kronop),
+])
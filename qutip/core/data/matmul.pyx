@@ -6,6 +6,7 @@ from libc.math cimport fabs
 from libc.stdlib cimport abs
 from libcpp.algorithm cimport lower_bound
 
+import os
 import warnings
 from qutip.settings import settings
 
@@ -51,6 +52,26 @@ cdef extern from "src/matmul_diag_vector.hpp" nogil:
         double complex *data, double complex *vec, double complex *out,
         T length, T width)
 
+# Threaded version of `_matmul_csr_vector`.  The kernel is always compiled in,
+# but it only runs in parallel if QuTiP was built with `--with-openmp`.
+cdef extern from "../cy/openmp/src/zspmv_openmp.hpp" nogil:
+    void zspmvpy_openmp[T](
+        double complex *data, T *ind, T *ptr,
+        double complex *vec, double complex a, double complex *out,
+        T nrows, int nthr)
+
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    static const int _QUTIP_OPENMP = 1;
+    #else
+    static const int _QUTIP_OPENMP = 0;
+    #endif
+    """
+    const int _QUTIP_OPENMP
+
+openmp_enabled = bool(_QUTIP_OPENMP)
+
 
 __all__ = [
     'matmul', 'matmul_csr', 'matmul_dense', 'matmul_dia',
@@ -82,6 +103,24 @@ cdef int _check_shape(Data left, Data right, Data out=None) except -1 nogil:
         )
     return 0
 
+
+cdef int _openmp_num_threads(CSR left):
+    """
+    Number of threads to use for the product of ``left`` with a vector.  This
+    is 1 unless QuTiP was built with OpenMP, ``left`` has at least
+    ``settings.core["openmp_thresh"]`` stored elements and we are not already
+    running inside one of the parallel maps (which would oversubscribe the
+    cores).
+    """
+    if not _QUTIP_OPENMP:
+        return 1
+    if left.row_index[left.shape[0]] < settings.core['openmp_thresh']:
+        return 1
+    if os.environ.get('QUTIP_IN_PARALLEL') == 'TRUE':
+        return 1
+    return settings.num_cpus
+
+
 cdef idxint _matmul_csr_estimate_nnz(CSR left, CSR right):
     """
     Produce a sensible upper-bound for the number of non-zero elements that
@@ -225,14 +264,23 @@ cpdef Dense matmul_csr_dense_dense(CSR left, Dense right,
             right = right.reorder()
     cdef idxint row, ptr, idx_r, idx_out, nrows=left.shape[0], ncols=right.shape[1]
     cdef double complex val
-    if right.fortran:
+    cdef int nthr
+    if right.fortran or ncols == 1:
+        nthr = _openmp_num_threads(left)
         idx_r = idx_out = 0
         for _ in range(ncols):
-            _matmul_csr_vector(left.data, left.col_index, left.row_index,
+            if nthr > 1:
+                zspmvpy_openmp(left.data, left.col_index, left.row_index,
                                right.data + idx_r,
                                scale,
                                out.data + idx_out,
-                               nrows)
+                               nrows, nthr)
+            else:
+                _matmul_csr_vector(left.data, left.col_index, left.row_index,
+                                   right.data + idx_r,
+                                   scale,
+                                   out.data + idx_out,
+                                   nrows)
             idx_out += nrows
             idx_r += right.shape[0]
     else:
@@ -1,23 +1,244 @@
 from qutip.core.data import CSR, Data, csr, Dense, Dia
 import qutip.core.data as _data
 import scipy.sparse.linalg as splinalg
+import scipy.linalg
 import numpy as np
 from qutip.settings import settings
+from collections import OrderedDict
+import hashlib
 import warnings
 from typing import Union
 
 if settings.has_mkl:
-    from qutip._mkl.spsolve import mkl_spsolve
+    from qutip._mkl.spsolve import mkl_spsolve, mkl_splu
 else:
     mkl_spsolve = None
+    mkl_splu = None
 
 
-__all__ = ["solve_csr_dense", "solve_dia_dense", "solve_dense", "solve"]
+__all__ = [
+    "solve_csr_dense", "solve_dia_dense", "solve_dense", "solve",
+    "Factorization", "factorize",
+]
+
+
+class _LRUCache:
+    """Minimal least recently used mapping with a bounded size."""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Numerical factorisations, keyed by the identity of the factorised matrix.
+# Entries keep a reference to the matrix so its ``id`` can not be reused while
+# in the cache.
+_factorizations = _LRUCache(8)
+# Fill-in reducing column orderings computed by ``splu``, keyed by sparsity
+# pattern.  They are reused to factorise other matrices with the same
+# structure, skipping the ordering phase of the factorisation.
+_orderings = _LRUCache(32)
+
+
+def _pattern_key(matrix):
+    """Hashable key identifying the sparsity pattern of a scipy matrix."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(matrix.indptr).view(np.uint8))
+    digest.update(np.ascontiguousarray(matrix.indices).view(np.uint8))
+    return (matrix.format, matrix.shape, digest.digest())
+
+
+class Factorization:
+    """
+    Factorisation of a square matrix ``A``, as returned by :func:`factorize`.
+
+    Once created, systems ``Ax=b`` can be solved for many ``b`` at the cost of
+    the triangular solves only.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the factorised matrix.
+
+    method : str
+        Method used to compute the factorisation.
+    """
+    def __init__(self, shape, method, solver, perm=None):
+        self.shape = shape
+        self.method = method
+        self._solver = solver
+        self._perm = perm
+
+    def solve(self, target: Data) -> Dense:
+        """
+        Solve ``Ax=b`` for ``x``.
+
+        Parameters
+        ----------
+        target : Data
+            The matrix or vector ``b``.
+
+        Returns
+        -------
+        x : Dense
+            Solution to the system Ax = b.
+        """
+        if self.shape[1] != target.shape[0]:
+            raise ValueError("target does not match the system")
+        if isinstance(target, Dense):
+            b = target.as_ndarray()
+        else:
+            b = target.to_array()
+        return Dense(self._solve(b), copy=False)
+
+    def _solve(self, b):
+        out = self._solver(b)
+        if self._perm is not None:
+            # The matrix was factorised with its columns permuted.
+            permuted = out
+            out = np.empty_like(permuted)
+            out[self._perm] = permuted
+        return out
+
+    def __repr__(self):
+        return "".join([
+            "Factorization(shape=", str(self.shape),
+            ", method=", repr(self.method), ")",
+        ])
+
+
+def _factorize_splu(matrix, options):
+    return _splu_scipy(matrix.as_scipy(), options)
+
+
+def _splu_scipy(M, options):
+    M = M.tocsc()
+    perm = None
+    if "permc_spec" not in options:
+        key = _pattern_key(M)
+        perm = _orderings.get(key)
+        if perm is not None:
+            M = M[:, perm]
+            options = {**options, "permc_spec": "NATURAL"}
+    try:
+        lu = splinalg.splu(M, **options)
+    except RuntimeError as err:
+        if "singular" in str(err).lower():
+            raise ValueError("Matrix is singular") from None
+        raise
+    if perm is None and "permc_spec" not in options:
+        # ``A[:, argsort(perm_c)]`` is already in the order chosen by splu.
+        _orderings.put(key, np.argsort(lu.perm_c))
+    return Factorization(M.shape, "splu", lu.solve, perm)
+
+
+def _factorize_mkl(matrix, options):
+    if mkl_splu is None:
+        raise ValueError("mkl is not available")
+    lu = mkl_splu(_data.to(CSR, matrix).as_scipy(), **options)
+    return Factorization(matrix.shape, "mkl_splu", lu.solve)
+
+
+def _factorize_lu(matrix, options):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            lu = scipy.linalg.lu_factor(matrix.to_array(), **options)
+        except (scipy.linalg.LinAlgWarning, np.linalg.LinAlgError):
+            raise ValueError("Matrix is singular") from None
+    return Factorization(
+        matrix.shape, "lu", lambda b: scipy.linalg.lu_solve(lu, b)
+    )
+
+
+_factorizers = {
+    "splu": _factorize_splu,
+    "mkl_splu": _factorize_mkl,
+    "mkl_spsolve": _factorize_mkl,
+    "lu": _factorize_lu,
+}
+
+
+def factorize(matrix: Data, method: str = None, options: dict = {},
+              cache: bool = False) -> Factorization:
+    """
+    Factorise the square matrix ``A`` to solve ``Ax=b`` for many ``b``.
+
+    Parameters
+    ----------
+    matrix : Data
+        The matrix ``A``.
+
+    method : str {"splu", "mkl_splu", "lu"}, optional
+        Factorisation to use. "splu" uses the sparse LU decomposition of
+        ``scipy.sparse.linalg``, "mkl_splu" the one from mkl's pardiso and
+        "lu" the dense one of ``scipy.linalg``. Default to "lu" for
+        ``Dense`` matrices and "splu" otherwise.
+
+    options : dict
+        Keyword options to pass to the factorisation function.
+
+    cache : bool, default: False
+        Whether to keep the factorisation in a small least recently used
+        cache keyed by the identity of ``matrix``. Calling ``factorize`` again
+        on the same object then returns the cached factorisation. The matrix
+        must not be modified in place while in the cache.
+
+    Returns
+    -------
+    lu : Factorization
+        Object with a ``solve(b)`` method returning the solution of
+        ``Ax=b`` as a ``Dense``.
+
+    Notes
+    -----
+    The fill-in reducing ordering computed by "splu" is kept for each
+    sparsity pattern. Factorising another matrix with the same structure,
+    such as ``L - i w`` for many frequencies ``w``, reuses it.
+    """
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("can only solve using square matrix")
+    if method is None:
+        method = "lu" if isinstance(matrix, Dense) else "splu"
+    if method not in _factorizers:
+        raise ValueError(
+            f"Unknown factorization {method}, supported methods are: "
+            + ", ".join(_factorizers)
+        )
+    if method == "splu" and not isinstance(matrix, (CSR, Dia)):
+        matrix = _data.to(CSR, matrix)
+    if cache:
+        key = (id(matrix), method, repr(sorted(options.items())))
+        cached = _factorizations.get(key)
+        if cached is not None and cached[0] is matrix:
+            return cached[1]
+    lu = _factorizers[method](matrix, options)
+    if cache:
+        _factorizations.put(key, (matrix, lu))
+    return lu
 
 
 def _splu(A, B, **kwargs):
-    lu = splinalg.splu(A, **kwargs)
-    return lu.solve(B)
+    # Reuse column orderings between matrices with the same sparsity pattern.
+    return _splu_scipy(A, kwargs)._solve(B)
 
 
 def solve_csr_dense(matrix: Union[CSR, Dia], target: Dense, method=None,
@@ -1,5 +1,5 @@
+from functools import cached_property
 from .dimensions import Space
-from .states import state_number_enumerate
 from . import data as _data
 from . import Qobj, qdiags
 import numpy as np
@@ -11,6 +11,171 @@ __all__ = ['enr_state_dictionaries', 'enr_fock',
            'enr_thermal_dm', 'enr_destroy', 'enr_identity']
 
 
+class EnrIndex:
+    """
+    Index of the states of a system with dimensions ``dims`` and at most
+    ``excitations`` excitations in total, in the order of
+    :func:`state_number_enumerate`.
+
+    States are ranked with a combinatorial number system instead of being
+    stored in dictionaries: the rank of a state and the state at a given
+    rank are both computed with ``O(len(dims))`` arithmetic from a table of
+    ``len(dims) * (excitations + 1)`` integers. The methods accept either a
+    single state (or index) or an array of them.
+
+    Parameters
+    ----------
+    dims : list of int
+        The number of states of each sub-system.
+
+    excitations : int, optional
+        The maximum number of excitations. By default the space is not
+        restricted.
+
+    Attributes
+    ----------
+    dims : tuple of int
+        The number of states of each sub-system.
+
+    excitations : int
+        The maximum number of excitations.
+
+    size : int
+        The number of states in the space.
+    """
+    def __init__(self, dims, excitations=None):
+        self.dims = tuple(int(d) for d in dims)
+        max_excitations = sum(d - 1 for d in self.dims)
+        if excitations is None or excitations > max_excitations:
+            excitations = max_excitations
+        self.excitations = int(excitations)
+        n_modes = len(self.dims)
+        budget = np.arange(self.excitations + 1)
+
+        # counts[i, e] is the number of states of the modes i, i+1, ...
+        # holding at most e excitations. cumulative[i, e + 1] is the sum of
+        # counts[i, :e + 1], which is the number of states that come before
+        # the first state with e excitations left for mode i - 1.
+        counts = np.zeros((n_modes + 1, self.excitations + 1), dtype=np.int64)
+        counts[n_modes] = 1
+        cumulative = np.zeros(
+            (n_modes + 1, self.excitations + 2), dtype=np.int64
+        )
+        cumulative[n_modes, 1:] = np.cumsum(counts[n_modes])
+        for i in reversed(range(n_modes)):
+            lower = np.maximum(budget - self.dims[i] + 1, 0)
+            counts[i] = (
+                cumulative[i + 1, budget + 1] - cumulative[i + 1, lower]
+            )
+            cumulative[i, 1:] = np.cumsum(counts[i])
+        self.size = int(counts[0, self.excitations])
+        self._cumulative = cumulative
+        self._table = cumulative.tolist()
+
+    def __len__(self):
+        return self.size
+
+    def rank(self, states):
+        """
+        Return the index of the given states.
+
+        Parameters
+        ----------
+        states : tuple of int or array_like of int
+            A single state or an array of shape ``(n, len(dims))`` of states.
+
+        Returns
+        -------
+        int or ndarray of int
+            The index of each state. States that are not in the space have
+            index ``-1``.
+        """
+        if np.ndim(states) == 1:
+            return self._rank_one(states)
+        states = np.asarray(states, dtype=np.int64)
+        states = states.reshape((-1, len(self.dims)))
+        left = self.excitations - (np.cumsum(states, axis=1) - states)
+        valid = (
+            np.all(states >= 0, axis=1)
+            & np.all(states < np.array(self.dims), axis=1)
+            & (left[:, -1] >= states[:, -1] if self.dims else True)
+        )
+        modes = np.arange(1, len(self.dims) + 1)
+        left = np.where(valid[:, None], left, 0)
+        after = np.where(valid[:, None], left - states, 0)
+        out = np.sum(
+            self._cumulative[modes, left + 1]
+            - self._cumulative[modes, after + 1],
+            axis=1,
+        )
+        return np.where(valid, out, -1)
+
+    def _rank_one(self, state):
+        """ Pure Python ``rank`` of a single state. """
+        if len(state) != len(self.dims):
+            return -1
+        table = self._table
+        left = self.excitations
+        out = 0
+        for i, n in enumerate(state):
+            if n < 0 or n >= self.dims[i] or n > left:
+                return -1
+            out += table[i + 1][left + 1] - table[i + 1][left - n + 1]
+            left -= n
+        return out
+
+    def unrank(self, idx):
+        """
+        Return the states at the given indices.
+
+        Parameters
+        ----------
+        idx : int or array_like of int
+            A single index or an array of indices.
+
+        Returns
+        -------
+        tuple of int or ndarray of int
+            The state as a tuple for a single index, otherwise an array of
+            shape ``(len(idx), len(dims))``.
+        """
+        if np.ndim(idx) == 0:
+            return tuple(self.unrank(np.array([idx]))[0].tolist())
+        idx = np.array(idx, dtype=np.int64).ravel()
+        if np.any((idx < 0) | (idx >= self.size)):
+            raise IndexError("Index out of range")
+        left = np.full(idx.shape, self.excitations)
+        out = np.zeros((len(idx), len(self.dims)), dtype=np.int64)
+        for i, dim in enumerate(self.dims):
+            table = self._cumulative[i + 1]
+            start = table[left + 1]
+            for n in range(1, dim):
+                out[:, i] += (n <= left) & (
+                    start - table[np.maximum(left - n, -1) + 1] <= idx
+                )
+            idx = idx - (start - table[left - out[:, i] + 1])
+            left = left - out[:, i]
+        return out
+
+    def states(self):
+        """
+        Return all the states of the space, in order, as an array of shape
+        ``(size, len(dims))``.
+        """
+        out = np.zeros((1, 0), dtype=np.int64)
+        left = np.array([self.excitations])
+        for dim in self.dims:
+            # Each state is followed by the states with 0, 1, ... more
+            # excitations in the next mode, which keeps them in order.
+            counts = np.minimum(dim - 1, left) + 1
+            parent = np.repeat(np.arange(len(out)), counts)
+            starts = np.cumsum(counts) - counts
+            n = np.arange(len(parent)) - starts[parent]
+            out = np.column_stack([out[parent], n])
+            left = left[parent] - n
+        return out
+
+
 def enr_state_dictionaries(dims, excitations):
     """
     Return the number of states, and lookup-dictionaries for translating
@@ -34,16 +199,10 @@ def enr_state_dictionaries(dims, excitations):
         of each other, i.e., ``state2idx[idx2state[idx]] = idx`` and
         ``idx2state[state2idx[state]] = state``.
     """
-    nstates = 0
-    state2idx = {}
-    idx2state = {}
-
-    for state in state_number_enumerate(dims, excitations):
-        state2idx[state] = nstates
-        idx2state[nstates] = state
-        nstates += 1
-
-    return nstates, state2idx, idx2state
+    states = map(tuple, EnrIndex(dims, excitations).states().tolist())
+    idx2state = dict(enumerate(states))
+    state2idx = {state: idx for idx, state in idx2state.items()}
+    return len(idx2state), state2idx, idx2state
 
 
 class EnrSpace(Space):
@@ -52,8 +211,8 @@ class EnrSpace(Space):
     def __init__(self, dims, excitations):
         self.dims = tuple(dims)
         self.n_excitations = excitations
-        enr_dicts = enr_state_dictionaries(dims, excitations)
-        self.size, self.state2idx, self.idx2state = enr_dicts
+        self._index = EnrIndex(dims, excitations)
+        self.size = self._index.size
         self.issuper = False
         self.superrep = None
         self._pure_dims = False
@@ -77,11 +236,28 @@ class EnrSpace(Space):
     def as_list(self):
         return list(self.dims)
 
+    @cached_property
+    def state2idx(self):
+        return {
+            state: idx for idx, state in self.idx2state.items()
+        }
+
+    @cached_property
+    def idx2state(self):
+        return dict(enumerate(
+            map(tuple, self._index.states().tolist())
+        ))
+
     def dims2idx(self, dims):
-        return self.state2idx[tuple(dims)]
+        idx = self._index.rank(tuple(dims))
+        if idx < 0:
+            raise KeyError(tuple(dims))
+        return idx
 
     def idx2dims(self, idx):
-        return self.idx2state[idx]
+        if not (0 <= idx < self.size):
+            raise KeyError(idx)
+        return self._index.unrank(idx)
 
 
 def enr_fock(dims, excitations, state, *, dtype=None):
@@ -119,21 +295,16 @@ def enr_fock(dims, excitations, state, *, dtype=None):
 
     """
     dtype = dtype or settings.core["default_dtype"] or _data.Dense
-    nstates, state2idx, _ = enr_state_dictionaries(dims, excitations)
-    try:
-        data = _data.one_element[dtype](
-            (nstates, 1),
-            (state2idx[tuple(state)], 0),
-            1
-        )
-    except KeyError:
+    space = EnrSpace(dims, excitations)
+    idx = space._index.rank(tuple(state))
+    if idx < 0:
         msg = (
             "state tuple " + str(tuple(state))
             + " is not in the restricted state space."
         )
-        raise ValueError(msg) from None
-    return Qobj(data, dims=[EnrSpace(dims, excitations), [1]*len(dims)],
-                copy=False)
+        raise ValueError(msg)
+    data = _data.one_element[dtype]((space.size, 1), (idx, 0), 1)
+    return Qobj(data, dims=[space, [1]*len(dims)], copy=False)
 
 
 def enr_thermal_dm(dims, excitations, n, *, dtype=None):
@@ -170,15 +341,15 @@ def enr_thermal_dm(dims, excitations, n, *, dtype=None):
         Thermal state density matrix.
     """
     dtype = dtype or settings.core["default_dtype"] or _data.CSR
-    nstates, _, idx2state = enr_state_dictionaries(dims, excitations)
-    enr_dims = [EnrSpace(dims, excitations)] * 2
+    space = EnrSpace(dims, excitations)
+    nstates = space.size
+    enr_dims = [space] * 2
     if not isinstance(n, (list, np.ndarray)):
         n = np.ones(len(dims)) * n
     else:
         n = np.asarray(n)
 
-    diags = [np.prod((n / (n + 1)) ** np.array(state))
-             for idx, state in idx2state.items()]
+    diags = np.prod((n / (n + 1)) ** space._index.states(), axis=1)
     diags /= np.sum(diags)
     out = qdiags(diags, 0, dims=enr_dims,
                  shape=(nstates, nstates), dtype=dtype)
@@ -232,20 +403,25 @@ def enr_destroy(dims, excitations, *, dtype=None):
         quantum system described by dims.
     """
     dtype = dtype or settings.core["default_dtype"] or _data.CSR
-    nstates, state2idx, idx2state = enr_state_dictionaries(dims, excitations)
-    enr_dims = [EnrSpace(dims, excitations)] * 2
-
-    a_ops = [scipy.sparse.lil_matrix((nstates, nstates), dtype=np.complex128)
-             for _ in dims]
-
-    for n1, state1 in idx2state.items():
-        for idx, s in enumerate(state1):
-            # if s > 0, the annihilation operator of mode idx has a non-zero
-            # entry with one less excitation in mode idx in the final state
-            if s > 0:
-                state2 = state1[:idx] + (s-1,) + state1[idx+1:]
-                n2 = state2idx[state2]
-                a_ops[idx][n2, n1] = np.sqrt(s)
+    space = EnrSpace(dims, excitations)
+    nstates = space.size
+    enr_dims = [space] * 2
+    states = space._index.states()
+
+    a_ops = []
+    for idx in range(len(dims)):
+        # the annihilation operator of mode idx has a non-zero entry for
+        # each state with s > 0, towards the state with one less
+        # excitation in mode idx.
+        n1 = np.flatnonzero(states[:, idx] > 0)
+        s = states[n1, idx]
+        state2 = states[n1]
+        state2[:, idx] -= 1
+        n2 = space._index.rank(state2)
+        a_ops.append(scipy.sparse.csr_matrix(
+            (np.sqrt(s).astype(np.complex128), (n2, n1)),
+            shape=(nstates, nstates),
+        ))
 
     return [
         Qobj(a, dims=enr_dims, isunitary=False, isherm=False).to(dtype)
@@ -106,6 +106,12 @@ class CoreOptions(QutipOptions):
         :func:"rand_herm", will use the specified data type. Any data-layer
         known to ``qutip.data.to`` is accepted. When ``None``, these functions
         will default to a sensible data type.
+
+    openmp_thresh : int {10000}
+        Number of stored elements above which the product of a ``CSR`` matrix
+        with a ``Dense`` vector is split between ``settings.num_cpus``
+        threads.  Only used when qutip was built with OpenMP support (see
+        ``qutip.settings.has_openmp``) and never inside the parallel maps.
     """
     _options = {
         # use auto tidyup
@@ -124,6 +130,8 @@ class CoreOptions(QutipOptions):
         "function_coefficient_style": "auto",
         # Default Qobj dtype for Qobj create function
         "default_dtype": None,
+        # Minimum nnz for the OpenMP CSR @ Dense kernel
+        "openmp_thresh": 10000,
     }
     _settings_name = "core"
 
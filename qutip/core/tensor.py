@@ -439,7 +439,9 @@ def expand_operator(oper, dims, targets, dtype=None):
     dtype : str, optional
         Data type of the output :class:`.Qobj`. By default it uses the data
         type specified in settings. If no data type is specified
-        in settings it uses the ``CSR`` data type.
+        in settings it uses the ``CSR`` data type. With ``"KronOp"``, the
+        Kronecker product is not computed: ``oper`` and ``targets`` are
+        stored in a :class:`~qutip.core.data.KronOp`.
 
     Returns
     -------
@@ -447,9 +449,16 @@ def expand_operator(oper, dims, targets, dtype=None):
         The expanded operator acting on a system with the desired dimension.
     """
     from .operators import identity
-    dtype = dtype or settings.core["default_dtype"] or _data.CSR
-    oper = oper.to(dtype)
+    dtype = _data.to.parse(dtype or settings.core["default_dtype"] or "CSR")
     N = len(dims)
+    if dtype is _data.KronOp:
+        targets = _targets_to_list(targets, oper=oper, N=N)
+        _check_oper_dims(oper, dims=dims, targets=targets)
+        return Qobj(
+            _data.KronOp(dims, [oper.data], [targets]),
+            dims=[dims, dims], isherm=oper._isherm, copy=False,
+        )
+    oper = oper.to(dtype)
     targets = _targets_to_list(targets, oper=oper, N=N)
     _check_oper_dims(oper, dims=dims, targets=targets)
 
@@ -213,9 +213,15 @@ class Settings:
 
     @property
     def has_openmp(self):
-        return False
-        # We keep this as a reminder for when openmp is restored: see Pull #652
-        # os.environ['KMP_DUPLICATE_LIB_OK'] = 'True'
+        """
+        Whether qutip was built with OpenMP support (``--with-openmp``).
+        When it was, large sparse matrix-vector products are threaded; see
+        ``settings.core["openmp_thresh"]``.
+        """
+        # `qutip.core.data.matmul` is shadowed by the dispatcher of the same
+        # name, so the module has to be fetched by its full name.
+        import importlib
+        return importlib.import_module("qutip.core.data.matmul").openmp_enabled
 
     @property
     def idxint_size(self):
@@ -115,6 +115,12 @@ def brmesolve(H, psi0, tlist, a_ops=(), e_ops=(), c_ops=(),
             With a cutoff 'sparse' is usually the most efficient.
         - | sparse_eigensolver : bool {False}
             Whether to use the sparse eigensolver
+        - | tensor_cache_size : int {1}
+          | Number of time-dependent brtensors kept for reuse.
+        - | tensor_grid : array_like, None
+          | Times at which to compute time-dependent brtensors. The brtensor
+            at other times is linearly interpolated from these. ``tlist`` must
+            be within the grid.
         - | method : str ["adams", "bdf", "lsoda", "dop853", "vern9", etc.]
             Which differential equation integration method to use.
         - | atol, rtol : float
@@ -234,6 +240,8 @@ class BRSolver(Solver):
         'method': 'adams',
         'tensor_type': 'sparse',
         'sparse_eigensolver': False,
+        'tensor_cache_size': 1,
+        'tensor_grid': None,
     }
     _avail_integrators = {}
 
@@ -294,11 +302,36 @@ class BRSolver(Solver):
             fock_basis=True,
             sec_cutoff=self.sec_cutoff,
             sparse_eigensolver=self.options['sparse_eigensolver'],
-            br_dtype=self.options['tensor_type']
+            br_dtype=self.options['tensor_type'],
+            br_cache_size=self.options['tensor_cache_size'],
+            br_grid=self.options['tensor_grid'],
         )
         self._init_rhs_time = time() - _time_start
         return rhs
 
+    def _check_tensor_grid(self, times):
+        grid = self.options['tensor_grid']
+        if grid is None or self.rhs.isconstant:
+            return
+        times = np.atleast_1d(times)
+        if np.min(times) < grid[0] or np.max(times) > grid[-1]:
+            raise ValueError(
+                "The evolution times must be within the tensor grid "
+                f"[{grid[0]}, {grid[-1]}]."
+            )
+
+    def run(self, state0, tlist, *, e_ops=None, args=None):
+        self._check_tensor_grid(tlist)
+        return super().run(state0, tlist, e_ops=e_ops, args=args)
+
+    run.__doc__ = Solver.run.__doc__
+
+    def step(self, t, *, args=None, copy=True):
+        self._check_tensor_grid(t)
+        return super().step(t, args=args, copy=copy)
+
+    step.__doc__ = Solver.step.__doc__
+
     @property
     def options(self):
         """
@@ -332,6 +365,17 @@ class BRSolver(Solver):
         sparse_eigensolver: bool, default: False
             Whether to use the sparse eigensolver
 
+        tensor_cache_size: int, default: 1
+            Number of time-dependent brtensors kept for reuse when the
+            evolution is evaluated again at the same time.
+
+        tensor_grid: array_like, default: None
+            Times at which to compute time-dependent brtensors. When given,
+            the brtensor at other times is linearly interpolated from these
+            instead of being computed at every step. The evolution times must
+            be within the grid: past its ends, the brtensor is kept constant
+            only so integrators can overshoot the last time.
+
         method: str, default: "adams"
             Which ODE integrator methods are supported.
         """
@@ -345,6 +389,7 @@ class BRSolver(Solver):
         need_new_rhs = self.rhs is not None and not self.rhs.isconstant
         need_new_rhs &= (
             'sparse_eigensolver' in keys or 'tensor_type' in keys
+            or 'tensor_cache_size' in keys or 'tensor_grid' in keys
         )
         if need_new_rhs:
             self.rhs = self._prepare_rhs()
@@ -9,11 +9,13 @@ import scipy.sparse as sp
 
 from itertools import product
 from ..core import (
-    sprepost, spre, qeye, tensor, expect, Qobj,
+    sprepost, spre, qeye, qeye_like, tensor, expect, Qobj,
     operator_to_vector, vector_to_operator, CoreOptions
 )
 from ..core import data as _data
-from .steadystate import pseudo_inverse, steadystate
+from .steadystate import (
+    pseudo_inverse, steadystate, _pseudo_inverse_sweep
+)
 from ..settings import settings
 
 # Load MKL spsolve if avaiable
@@ -74,50 +76,24 @@ def countstat_current(L, c_ops=None, rhoss=None, J_ops=None):
     return current
 
 
-def _solve(A, V):
-    try:
-        return _data.solve(A, V)
-    except ValueError:
-        return _data.solve(A, V, "lstsq")
-
-
-def _noise_direct(L, wlist, rhoss, J_ops):
-    J_ops = [op.data for op in J_ops]
-    rhoss_vec = operator_to_vector(rhoss).data
-
+def _noise_direct(L, wlist, rhoss, J_ops, sparse=True):
     N_j_ops = len(J_ops)
-    current = np.zeros(N_j_ops)
-    noise = np.zeros((N_j_ops, N_j_ops, len(wlist)))
-
-    tr_op = qeye(L.dims[0][0])
-    tr_op_vec = operator_to_vector(tr_op)
-
-    Pop = _data.kron(rhoss_vec, tr_op_vec.data.transpose())
-    Iop = _data.identity(np.prod(L.dims[0][0])**2)
-    Q = _data.sub(Iop, Pop)
-    Q_ops = [_data.matmul(Q, _data.matmul(op, rhoss_vec)) for op in J_ops]
-
-    for k, w in enumerate(wlist):
-        if w != 0.0:
-            L_temp = 1.0j * w * spre(tr_op) + L
-        else:
-            # At zero frequency some solvers fail for small systems.
-            # Adding a small finite frequency of order 1e-15
-            # helps prevent the solvers from throwing an exception.
-            with CoreOptions(auto_tidyup=False):
-                L_temp = 1e-15j * spre(tr_op) + L
-
-        X_rho = [_solve(L_temp.data, op) for op in Q_ops]
-
-        for i, j in product(range(N_j_ops), repeat=2):
-            if i == j:
-                current[i] = _data.expect_super(J_ops[i], rhoss_vec).real
-                noise[j, i, k] = current[i]
-            noise[j, i, k] -= (
-                _data.expect_super(_data.matmul(J_ops[j], Q), X_rho[i]) +
-                _data.expect_super(_data.matmul(J_ops[i], Q), X_rho[j])
-            ).real
+    rhoss_vec = operator_to_vector(rhoss)
+    tr_vec = operator_to_vector(qeye_like(rhoss))
+
+    current = np.array([
+        _data.expect_super(op.data, rhoss_vec.data).real for op in J_ops
+    ])
+    # <<1| J_i and J_j |rho>>, the pseudo inverse is computed between them
+    # for all frequencies at once.
+    lefts = np.vstack([(op.trans() @ tr_vec).full().T for op in J_ops])
+    rights = np.hstack([(op @ rhoss_vec).full() for op in J_ops])
+    G = _pseudo_inverse_sweep(L, rhoss, wlist, lefts, rights, sparse=sparse)
+    G = G.real.transpose(1, 2, 0)
 
+    noise = np.zeros((N_j_ops, N_j_ops, len(wlist)))
+    noise[np.arange(N_j_ops), np.arange(N_j_ops), :] = current[:, None]
+    noise -= G + G.transpose(1, 0, 2)
     return current, noise
 
 
@@ -179,12 +155,15 @@ def countstat_current_noise(L, c_ops, wlist=None, rhoss=None, J_ops=None,
         are recommended.
 
     method : str, ['direct']
-        Method used to compute the noise. The default, 'direct' with
-        ``sparse=True``, compute the noise directly. It is the recommended
-        method for larger systems. Otherwise, the pseudo inverse is computed
-        using the given method. Pseudo inverse supports 'splu' and 'spilu' for
-        sparse matrices and 'direct', 'scipy' and 'numpy' methods for
-        ``sparse=False``.
+        Method used to compute the noise. The default, 'direct', computes the
+        noise for all frequencies in ``wlist`` from a single reduction of
+        ``L``: a Schur decomposition with ``sparse=False``, after which each
+        frequency costs ``O(N^2)`` operations, or the factorisation of a
+        sparse system sharing its structure between frequencies otherwise.
+        It is the recommended method. Otherwise, the pseudo inverse is
+        computed for each frequency using the given method. Pseudo inverse
+        supports 'splu' and 'spilu' for sparse matrices and 'scipy' and
+        'numpy' methods for ``sparse=False``.
 
     .. note::
         The algoryth is described in page 67 of "Electrons in nanostructures"
@@ -207,9 +186,8 @@ def countstat_current_noise(L, c_ops, wlist=None, rhoss=None, J_ops=None,
     if wlist is None:
         wlist = [0.]
 
-    if sparse and method == 'direct':
-        # rhoss_vec = operator_to_vector(rhoss).data
-        current, noise = _noise_direct(L, wlist, rhoss, J_ops)
+    if method == 'direct':
+        current, noise = _noise_direct(L, wlist, rhoss, J_ops, sparse)
     else:
         current, noise = _noise_pseudoinv(L, wlist, rhoss, J_ops,
                                           sparse, method)
@@ -9,8 +9,10 @@ __all__ = [
 import numpy as np
 from qutip.core import data as _data
 from qutip.core.data import Data
-from qutip import Qobj, QobjEvo
+from qutip import Qobj, QobjEvo, qeye
+from qutip.settings import available_cpu_count
 from .propagator import Propagator
+from .parallel import _get_map
 from .mesolve import MESolver
 from .solver_base import Solver
 from .integrator import Integrator
@@ -44,6 +46,8 @@ class FloquetBasis:
         sparse=False,
         sort=True,
         precompute=None,
+        map="serial",
+        num_segments=None,
     ):
         """
         Parameters
@@ -73,6 +77,16 @@ class FloquetBasis:
             for later use when computing modes and states. Default is
             ``linspace(0, T, 101)`` corresponding to the default integration
             steps used for the floquet tensor computation.
+
+        map : str {"serial", "parallel", "loky", "mpi"} ["serial"]
+            How to run the integration of the segments of the period when
+            ``num_segments`` is more than 1.
+
+        num_segments : int [None]
+            Number of segments of the period to integrate independently. The
+            propagators over the period are then obtained from the products of
+            the propagators of each segments. Default is one segment for a
+            serial map and one per cpu otherwise.
         """
         if not T > 0:
             raise ValueError("The period need to be a positive number.")
@@ -93,10 +107,19 @@ class FloquetBasis:
             and (H._feedback_functions or H._solver_only_feedback)
         ):
             raise NotImplementedError("FloquetBasis does not support feedback")
-        self.U = Propagator(H, args=args, options=options, memoize=memoize)
-        for t in tlist:
-            # Do the evolution by steps to save the intermediate results.
-            self.U(t)
+        self.U = Propagator(
+            H, args=args, options=options, memoize=memoize, period=T
+        )
+        map_func, map_kw = _get_map({"map": map, "mpi_options": {}})
+        if num_segments is None:
+            serial = map in ["serial", "serial_map"]
+            num_segments = 1 if serial else available_cpu_count()
+        if num_segments > 1:
+            self._precompute_segments(tlist, num_segments, map_func, map_kw)
+        else:
+            for t in tlist:
+                # Do the evolution by steps to save the intermediate results.
+                self.U(t)
         U_T = self.U(self.T)
         if not sparse and isinstance(U_T.data, _data.CSR):
             U_T = U_T.to("Dense")
@@ -110,6 +133,29 @@ class FloquetBasis:
             self.evecs = evecs
             self.e_quasi = e_quasi
 
+    def _precompute_segments(self, tlist, num_segments, map_func, map_kw):
+        """
+        Integrate segments of the period in parallel and store the propagators
+        from ``0`` obtained by their cumulative products.
+        """
+        times = np.unique(np.concatenate([[0.], tlist, [self.T]]))
+        segments = [
+            times[idx[0] - 1: idx[-1] + 1]
+            for idx in np.array_split(np.arange(1, len(times)), num_segments)
+            if len(idx)
+        ]
+        map_kw = {**map_kw, "num_cpus": min(num_segments, len(segments))}
+        results = map_func(
+            _segment_propagators, segments,
+            task_args=(self.U.solver,), map_kw=map_kw,
+        )
+        props = [self.U.props[0]]
+        for segment_props in results:
+            U_start = props[-1]
+            props += [U @ U_start for U in segment_props]
+        self.U.times = list(times)
+        self.U.props = props
+
     def _as_ketlist(self, kets_mat):
         """
         Split the Data array in a list of kets.
@@ -256,6 +302,14 @@ class FloquetBasis:
         return floquet_basis
 
 
+def _segment_propagators(times, solver):
+    """
+    Propagators from ``times[0]`` to each of ``times[1:]``.
+    """
+    solver.start(qeye(solver.sys_dims), times[0])
+    return [solver.step(t) for t in times[1:]]
+
+
 def _floquet_delta_tensor(f_energies, kmax, T):
     """
     Floquet-Markov master equation X matrices.
@@ -300,25 +354,29 @@ def _floquet_X_matrices(floquet_basis, c_ops, kmax, ntimes=100):
 
     Returns
     -------
-    X : list of dict of :class:`.Data`
-        A dict of the sidebands ``k`` for the X matrices of each c_ops
+    X : np.ndarray
+        The X matrices of each c_ops, ``X[i, :, :, k + kmax]`` is the sideband
+        ``k`` of the i-th c_ops. The sidebands are the last axis as in the
+        Floquet delta tensor.
     """
     T = floquet_basis.T
     N = floquet_basis.U(0).shape[0]
-    omega = (2 * np.pi) / T
     tlist = np.linspace(T / ntimes, T, ntimes)
     ks = np.arange(-kmax, kmax + 1)
-    out = {k: [_data.csr.zeros(N, N)] * len(c_ops) for k in ks}
-
-    for t in tlist:
-        mode = floquet_basis.mode(t, data=True)
-        FFs = [mode.adjoint() @ c_op.data @ mode for c_op in c_ops]
-        for k, phi in zip(ks, np.exp(-1j * ks * omega * t) / ntimes):
-            out[k] = [
-                _data.add(prev, new, phi) for prev, new in zip(out[k], FFs)
-            ]
-
-    return [{k: out[k][i] for k in ks} for i in range(len(c_ops))]
+    modes = np.stack([
+        floquet_basis.mode(t, data=True).to_array() for t in tlist
+    ])
+    modes_dag = modes.conj().transpose(0, 2, 1)
+    # X_k = sum_j F(t_j) exp(-i k w t_j) / ntimes with w t_j = 2 pi (j+1) / n,
+    # which is the discrete Fourier transform along the time axis.
+    phases = np.exp(-2j * np.pi * ks / ntimes) / ntimes
+    out = np.empty((len(c_ops), N, N, len(ks)), dtype=complex)
+    for i, c_op in enumerate(c_ops):
+        FFs = modes_dag @ c_op.full() @ modes
+        sidebands = np.fft.fft(FFs, axis=0)[ks % ntimes]
+        sidebands *= phases[:, None, None]
+        out[i] = np.moveaxis(sidebands, 0, -1)
+    return out
 
 
 def _floquet_gamma_matrices(X, delta, J_cb):
@@ -327,7 +385,7 @@ def _floquet_gamma_matrices(X, delta, J_cb):
 
     Parameters
     ----------
-    X : list of dict of :class:`.Data`
+    X : np.ndarray
         Floquet X matrices created by :func:`_floquet_X_matrices`.
 
     delta : np.ndarray
@@ -342,28 +400,14 @@ def _floquet_gamma_matrices(X, delta, J_cb):
 
     Returns
     -------
-    gammas : dict of :class:`.Data`
-        A dict mapping the sidebands ``k`` to their gamma matrices.
+    gamma : np.ndarray
+        The gamma matrices, with the sidebands as the last axis as in the
+        Floquet delta tensor.
     """
-    N = delta.shape[0]
-    kmax = (delta.shape[2] - 1) // 2
-    gamma = {k: _data.csr.zeros(N, N) for k in range(-kmax, kmax + 1, 1)}
-
+    gamma = np.zeros(delta.shape, dtype=complex)
     for X_c_op, sp in zip(X, J_cb):
-        response = sp(delta) * ((2 + 0j) * np.pi)
-        response = [
-            _data.Dense(response[:, :, k], copy=False)
-            for k in range(2 * kmax + 1)
-        ]
-        for k in range(-kmax, kmax + 1, 1):
-            gamma[k] = _data.add(
-                gamma[k],
-                _data.multiply(
-                    _data.multiply(X_c_op[k].conj(), X_c_op[k]),
-                    response[k + kmax],
-                ),
-            )
-    return gamma
+        gamma += sp(delta) * (X_c_op.conj() * X_c_op)
+    return gamma * (2 * np.pi)
 
 
 def _floquet_A_matrix(delta, gamma, w_th):
@@ -375,37 +419,24 @@ def _floquet_A_matrix(delta, gamma, w_th):
     delta : np.ndarray
         Floquet delta tensor created by :func:`_floquet_delta_tensor`.
 
-    gamma : dict of :class:`.Data`
+    gamma : np.ndarray
         Floquet gamma matrices created by :func:`_floquet_gamma_matrices`.
 
     w_th : float
         The temperature in units of frequency.
     """
-    kmax = (delta.shape[2] - 1) // 2
-
     if w_th > 0.0:
         deltap = np.copy(delta)
         deltap[deltap == 0.0] = np.inf
         thermal = 1.0 / (np.exp(np.abs(deltap) / w_th) - 1.0)
-        thermal = [_data.Dense(thermal[:, :, k]) for k in range(2 * kmax + 1)]
-
-        gamma_kk = _data.add(gamma[0], gamma[0].transpose())
-        A = _data.add(gamma[0], _data.multiply(thermal[kmax], gamma_kk))
-
-        for k in range(1, kmax + 1):
-            g_kk = _data.add(gamma[k], gamma[-k].transpose())
-            thermal_kk = _data.multiply(thermal[kmax + k], g_kk)
-            A = _data.add(A, _data.add(gamma[k], thermal_kk))
-            thermal_kk = _data.multiply(thermal[kmax - k], g_kk.transpose())
-            A = _data.add(A, _data.add(gamma[-k], thermal_kk))
+        # gamma[j, i, -k] for each gamma[i, j, k]
+        gamma_T = gamma[:, :, ::-1].transpose(1, 0, 2)
+        A = np.sum(gamma + thermal * (gamma + gamma_T), axis=2)
     else:
         # w_th is 0, thermal = 0s
-        A = gamma[0]
-        for k in range(1, kmax + 1):
-            A = _data.add(gamma[k], A)
-            A = _data.add(gamma[-k], A)
+        A = np.sum(gamma, axis=2)
 
-    return A
+    return _data.to(_data.CSR, _data.Dense(A, copy=False))
 
 
 def _floquet_master_equation_tensor(A):
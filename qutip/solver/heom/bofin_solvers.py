@@ -10,14 +10,16 @@ https://github.com/tehruhn/bofin) which was itself derived from an earlier
 implementation in QuTiP itself.
 """
 
+import hashlib
+import os
 from time import time
 
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import LinearOperator, spsolve, splu
 
 from qutip.settings import settings
-from qutip import state_number_enumerate
+from qutip.core.energy_restricted import EnrIndex
 from qutip.core import data as _data
 from qutip.core.data import csr as _csr
 from qutip.core import Qobj, QobjEvo
@@ -74,6 +76,16 @@ class HierarchyADOs:
         The maximum depth of the hierarchy (i.e. the maximum sum of
         "excitations" in the hierarchy ADO labels or maximum ADO level).
 
+    tol : float, optional
+        If given, ADOs whose estimated magnitude falls below ``tol`` are
+        dropped from the hierarchy. The magnitude of an ADO is estimated as
+        the product over the exponents of ``(|ck| / |vk|)**n / sqrt(n!)``,
+        where ``n`` is the number of excitations of the exponent within
+        the label (for "RI" exponents the larger of ``ck`` and ``ck2`` is
+        used). ADOs whose predecessors have all been dropped are dropped
+        too, so that every retained ADO remains coupled to the system
+        density matrix. By default all ADOs up to ``max_depth`` are kept.
+
     Attributes
     ----------
     exponents : list of BathExponent
@@ -104,10 +116,14 @@ class HierarchyADOs:
 
     labels: list of tuples
         A list of the ADO labels within the hierarchy.
+
+    tol : float or None
+        The magnitude below which ADOs were dropped from the hierarchy.
     """
-    def __init__(self, exponents, max_depth):
+    def __init__(self, exponents, max_depth, tol=None):
         self.exponents = exponents
         self.max_depth = max_depth
+        self.tol = tol
 
         self.dims = [exp.dim or (max_depth + 1) for exp in self.exponents]
         self.vk = [exp.vk for exp in self.exponents]
@@ -117,9 +133,75 @@ class HierarchyADOs:
             exp.sigma_bar_k_offset for exp in self.exponents
         ]
 
-        self.labels = list(state_number_enumerate(self.dims, max_depth))
-        self._label_idx = {s: i for i, s in enumerate(self.labels)}
-        self.idx = self._label_idx.__getitem__
+        self._index = EnrIndex(self.dims, max_depth)
+        label_array = self._index.states()
+        self._positions = None
+        if tol is not None:
+            kept = self._truncate_labels(label_array, tol)
+            self._positions = np.full(self._index.size, -1, dtype=np.int64)
+            self._positions[kept] = np.arange(np.count_nonzero(kept))
+            label_array = label_array[kept]
+        self._label_array = label_array
+        self.labels = list(map(tuple, label_array.tolist()))
+
+    def _truncate_labels(self, labels, tol):
+        """
+        Return a mask of the labels whose estimated magnitude is at least
+        ``tol`` and which can be reached from the system density matrix by
+        a chain of retained labels.
+        """
+        weights = np.array([
+            abs(exp.ck) if exp.ck2 is None
+            else max(abs(exp.ck), abs(exp.ck2))
+            for exp in self.exponents
+        ], dtype=float)
+        rates = np.array([abs(vk) for vk in self.vk], dtype=float)
+        with np.errstate(divide="ignore"):
+            log_ratio = np.log(weights) - np.log(rates)
+        log_ratio[rates == 0] = np.inf
+        log_factorial = np.cumsum(
+            np.log(np.arange(1, max(self.dims) + 1))
+        )
+        log_factorial = np.concatenate([[0.], log_factorial])
+        log_tol = np.log(tol) if tol > 0 else -np.inf
+
+        with np.errstate(invalid="ignore"):
+            log_mag = np.sum(
+                np.where(labels > 0, labels * log_ratio, 0.)
+                - 0.5 * log_factorial[labels],
+                axis=1,
+            )
+        levels = labels.sum(axis=1)
+        kept = levels == 0
+        for level in range(1, self.max_depth + 1):
+            candidates = np.flatnonzero(
+                (levels == level) & (log_mag >= log_tol)
+            )
+            reachable = np.zeros(len(candidates), dtype=bool)
+            for k in range(len(self.dims)):
+                excited = labels[candidates, k] > 0
+                prev = labels[candidates[excited]]
+                prev[:, k] -= 1
+                reachable[excited] |= kept[self._index.rank(prev)]
+            kept[candidates[reachable]] = True
+        return kept
+
+    def _indices(self, labels):
+        """
+        Return the index of each row of an array of labels, or ``-1`` for
+        labels which are not in the hierarchy.
+        """
+        idx = self._index.rank(labels)
+        if self._positions is not None:
+            idx = np.where(idx >= 0, self._positions[idx], -1)
+        return idx
+
+    def _contains(self, label):
+        """ Return whether the label is in the hierarchy. """
+        idx = self._index.rank(label)
+        if idx >= 0 and self._positions is not None:
+            idx = self._positions[idx]
+        return idx >= 0
 
     def idx(self, label):
         """
@@ -138,18 +220,23 @@ class HierarchyADOs:
 
         Notes
         -----
-        This implementation of the ``.idx(...)`` method is just for
-        reference and documentation. To avoid the cost of a Python
-        function call, it is replaced with
-        ``self._label_idx.__getitem__`` when the instance is created.
+        The index is computed from the label with a combinatorial number
+        system, see :class:`~qutip.core.energy_restricted.EnrIndex`,
+        instead of being looked up in a dictionary of all the labels.
         """
-        return self._label_idx[label]
+        idx = self._index.rank(label)
+        if idx >= 0 and self._positions is not None:
+            idx = int(self._positions[idx])
+        if idx < 0:
+            raise KeyError(label)
+        return idx
 
     def next(self, label, k):
         """
         Return the ADO label with one more excitation in the k'th exponent
         dimension or ``None`` if adding the excitation would exceed the
-        dimension or maximum depth of the hierarchy.
+        dimension or maximum depth of the hierarchy, or if the resulting
+        ADO was dropped by the ``tol`` truncation.
 
         Parameters
         ----------
@@ -167,13 +254,17 @@ class HierarchyADOs:
             return None
         if sum(label) >= self.max_depth:
             return None
-        return label[:k] + (label[k] + 1,) + label[k + 1:]
+        label = label[:k] + (label[k] + 1,) + label[k + 1:]
+        if self.tol is not None and not self._contains(label):
+            return None
+        return label
 
     def prev(self, label, k):
         """
         Return the ADO label with one fewer excitation in the k'th
         exponent dimension or ``None`` if the label has no exciations in the
-        k'th exponent.
+        k'th exponent or if the resulting ADO was dropped by the ``tol``
+        truncation.
 
         Parameters
         ----------
@@ -189,7 +280,10 @@ class HierarchyADOs:
         """
         if label[k] <= 0:
             return None
-        return label[:k] + (label[k] - 1,) + label[k + 1:]
+        label = label[:k] + (label[k] - 1,) + label[k + 1:]
+        if self.tol is not None and not self._contains(label):
+            return None
+        return label
 
     def exps(self, label):
         """
@@ -314,8 +408,10 @@ class HierarchyADOs:
                 filtered_dims[j] = min(self.dims[j], filtered_dims[j])
 
         return [
-            label for label in state_number_enumerate(filtered_dims, n)
-            if sum(label) == n
+            label for label in map(
+                tuple, EnrIndex(filtered_dims, n).states().tolist()
+            )
+            if sum(label) == n and self._contains(label)
         ]
 
 
@@ -422,6 +518,7 @@ class HEOMResult(Result):
 
 def heomsolve(
     H, bath, max_depth, state0, tlist, *, e_ops=None, args=None, options=None,
+    ado_tol=None,
 ):
     """
     Hierarchical Equations of Motion (HEOM) solver that supports multiple
@@ -521,6 +618,11 @@ def heomsolve(
           | Maximum lenght of one internal step. When using pulses, it should
             be less than half the width of the thinnest pulse.
 
+    ado_tol : float, optional
+        Drop ADOs whose estimated magnitude is below this tolerance from the
+        hierarchy. See ``tol`` in :class:`HierarchyADOs` for how the
+        magnitude is estimated. Default: None (keep all ADOs).
+
     Returns
     -------
     :class:`~HEOMResult`
@@ -550,7 +652,9 @@ def heomsolve(
         list of attributes.
     """
     H = QobjEvo(H, args=args, tlist=tlist)
-    solver = HEOMSolver(H, bath=bath, max_depth=max_depth, options=options)
+    solver = HEOMSolver(
+        H, bath=bath, max_depth=max_depth, options=options, ado_tol=ado_tol,
+    )
     return solver.run(state0, tlist, e_ops=e_ops)
 
 
@@ -584,6 +688,11 @@ class HEOMSolver(Solver):
         If set to None the default options will be used. Keyword only.
         Default: None.
 
+    ado_tol : float, optional
+        Drop ADOs whose estimated magnitude is below this tolerance from the
+        hierarchy. See ``tol`` in :class:`HierarchyADOs` for how the
+        magnitude is estimated. Keyword only. Default: None (keep all ADOs).
+
     Attributes
     ----------
     ados : :obj:`HierarchyADOs`
@@ -609,9 +718,11 @@ class HEOMSolver(Solver):
         "method": "adams",
         "store_ados": False,
         "state_data_type": "dense",
+        "matrix_free": False,
+        "rhs_cache_dir": None,
     }
 
-    def __init__(self, H, bath, max_depth, *, options=None):
+    def __init__(self, H, bath, max_depth, *, options=None, ado_tol=None):
         _time_start = time()
 
         if not isinstance(H, (Qobj, QobjEvo)):
@@ -628,7 +739,7 @@ class HEOMSolver(Solver):
         self._sys_dims = self.L_sys.dims[0]
 
         self.ados = HierarchyADOs(
-            self._combine_bath_exponents(bath), max_depth,
+            self._combine_bath_exponents(bath), max_depth, tol=ado_tol,
         )
         self._n_ados = len(self.ados.labels)
         self._n_exponents = len(self.ados.exponents)
@@ -636,10 +747,10 @@ class HEOMSolver(Solver):
         self._init_ados_time = time() - _time_start
         _time_start = time()
 
-        # pre-calculate identity matrix required by _grad_n
+        # pre-calculate identity matrix required by the diagonal blocks
         self._sId = _data.identity(self._sup_shape, dtype="csr")
 
-        # pre-calculate superoperators required by _grad_prev and _grad_next:
+        # pre-calculate superoperators required by the ADO couplings:
         Qs = [exp.Q.to("csr") for exp in self.ados.exponents]
         self._spreQ = [spre(op).data for op in Qs]
         self._spostQ = [spost(op).data for op in Qs]
@@ -665,7 +776,13 @@ class HEOMSolver(Solver):
         self._init_superop_cache_time = time() - _time_start
         _time_start = time()
 
-        rhs = self._calculate_rhs()
+        matrix_free = (options or {}).get("matrix_free", None)
+        if matrix_free is None:
+            matrix_free = self.solver_options["matrix_free"]
+        self._rhs_cache_dir = (options or {}).get("rhs_cache_dir", None)
+        if self._rhs_cache_dir is None:
+            self._rhs_cache_dir = self.solver_options["rhs_cache_dir"]
+        rhs = self._calculate_rhs(matrix_free)
 
         self._init_rhs_time = time() - _time_start
 
@@ -712,124 +829,124 @@ class HEOMSolver(Solver):
             )
         return exponents
 
-    def _grad_n(self, he_n):
-        """ Get the gradient for the hierarchy ADO at level n. """
-        vk = self.ados.vk
-        vk_sum = sum(he_n[i] * vk[i] for i in range(len(vk)))
-        op = _data.mul(self._sId, -vk_sum)
-        return op
-
-    def _grad_prev(self, he_n, k):
-        """ Get the previous gradient. """
-        if self.ados.exponents[k].fermionic:
-            return self._grad_prev_fermionic(he_n, k)
-        else:
-            return self._grad_prev_bosonic(he_n, k)
+    def _grad_n_coeffs(self):
+        """ Get the gradient coefficient of each ADO of the hierarchy. """
+        return -(self._label_array() @ np.array(self.ados.vk, dtype=complex))
 
-    def _grad_prev_bosonic(self, he_n, k):
-        if self.ados.exponents[k].type == BathExponent.types.R:
-            op = _data.mul(
-                self._s_pre_minus_post_Q[k],
-                -1j * he_n[k] * self.ados.ck[k],
-            )
-        elif self.ados.exponents[k].type == BathExponent.types.I:
-            op = _data.mul(
-                self._s_pre_plus_post_Q[k],
-                -1j * he_n[k] * 1j * self.ados.ck[k],
-            )
-        elif self.ados.exponents[k].type == BathExponent.types.RI:
-            term1 = _data.mul(
-                self._s_pre_minus_post_Q[k],
-                he_n[k] * -1j * self.ados.ck[k],
-            )
-            term2 = _data.mul(
-                self._s_pre_plus_post_Q[k],
-                he_n[k] * self.ados.ck2[k],
-            )
-            op = _data.add(term1, term2)
-        else:
-            raise ValueError(
-                f"Unsupported type {self.ados.exponents[k].type}"
-                f" for exponent {k}"
-            )
+    def _grad_op(self, terms, k):
+        """
+        Build a gradient from its terms, a list of the name of the list of
+        superoperators used and the coefficient multiplying its ``k``-th
+        element.
+        """
+        op = None
+        for name, coeff in terms:
+            term = _data.mul(getattr(self, name)[k], coeff)
+            op = term if op is None else _data.add(op, term)
         return op
 
-    def _grad_prev_fermionic(self, he_n, k):
-        ck = self.ados.ck
-        he_fermionic_n = [
-            i * int(exp.fermionic)
-            for i, exp in zip(he_n, self.ados.exponents)
-        ]
-
-        n_excite = sum(he_fermionic_n)
-        sign1 = (-1) ** (n_excite + 1)
+    def _label_array(self):
+        """ Return the ADO labels as an integer array. """
+        return self.ados._label_array
 
-        n_excite_before_m = sum(he_fermionic_n[:k])
-        sign2 = (-1) ** (n_excite_before_m)
+    def _neighbours(self, labels, k, step):
+        """
+        Return the indices of the ADOs which have ``step`` more excitations
+        of the ``k``-th exponent than ``labels`` and the indices of those
+        neighbours within the hierarchy.
+        """
+        neighbours = labels.copy()
+        neighbours[:, k] += step
+        cols = self.ados._indices(neighbours)
+        rows = np.flatnonzero(cols >= 0)
+        return rows, cols[rows]
 
-        sigma_bar_k = k + self.ados.sigma_bar_k_offset[k]
+    def _rhs_couplings(self):
+        """
+        Return the couplings between ADOs of the hierarchy.
 
-        if self.ados.exponents[k].type == BathExponent.types["+"]:
-            op = _data.sub(
-                _data.mul(self._spreQdag[k], -1j * sign2 * ck[k]),
-                _data.mul(
-                    self._spostQdag[k],
-                    -1j * sign2 * sign1 * np.conj(ck[sigma_bar_k]),
-                ),
+        Each entry is ``(k, names, rows, cols, coeffs)``: the ADOs ``rows``
+        are coupled to the ADOs ``cols`` by the sum over ``i`` of
+        ``coeffs[i]`` times the ``k``-th superoperator in the list
+        ``getattr(self, names[i])``.
+        """
+        labels = self._label_array()
+        fermionic = np.array(
+            [exp.fermionic for exp in self.ados.exponents], dtype=bool
+        )
+        excitations = labels * fermionic
+        # sign1 = (-1) ** (n_excite + 1), sign2 = (-1) ** n_excite_before_k
+        sign1 = 1 - 2 * ((excitations.sum(axis=1) + 1) % 2)
+        before = np.cumsum(excitations, axis=1) - excitations
+        sign2 = 1 - 2 * (before % 2)
+
+        couplings = []
+        for k, exp in enumerate(self.ados.exponents):
+            rows, cols = self._neighbours(labels, k, 1)
+            names, coeffs = self._grad_next_coeffs(
+                exp, k, labels[rows], sign1[rows], sign2[rows, k]
             )
-        elif self.ados.exponents[k].type == BathExponent.types["-"]:
-            op = _data.sub(
-                _data.mul(self._spreQ[k], -1j * sign2 * ck[k]),
-                _data.mul(
-                    self._spostQ[k],
-                    -1j * sign2 * sign1 * np.conj(ck[sigma_bar_k]),
-                ),
+            couplings.append((k, names, rows, cols, coeffs))
+            rows, cols = self._neighbours(labels, k, -1)
+            names, coeffs = self._grad_prev_coeffs(
+                exp, k, labels[rows], sign1[rows], sign2[rows, k]
             )
+            couplings.append((k, names, rows, cols, coeffs))
+        return couplings
+
+    def _grad_next_coeffs(self, exp, k, labels, sign1, sign2):
+        """
+        Return the names of the superoperators and their coefficients in
+        the gradient coupling each of ``labels`` to the ADO with one more
+        excitation in the ``k``-th exponent.
+        """
+        ones = np.ones(len(labels), dtype=complex)
+        if not exp.fermionic:
+            return ["_s_pre_minus_post_Q"], [-1j * ones]
+        if exp.type == BathExponent.types["+"]:
+            names = ["_s_pre_minus_post_Q", "_s_pre_plus_post_Q"]
+        elif exp.type == BathExponent.types["-"]:
+            names = ["_s_pre_minus_post_Qdag", "_s_pre_plus_post_Qdag"]
         else:
             raise ValueError(
-                f"Unsupported type {self.ados.exponents[k].type}"
-                f" for exponent {k}"
+                f"Unsupported type {exp.type} for exponent {k}"
             )
-        return op
-
-    def _grad_next(self, he_n, k):
-        """ Get the previous gradient. """
-        if self.ados.exponents[k].fermionic:
-            return self._grad_next_fermionic(he_n, k)
-        else:
-            return self._grad_next_bosonic(he_n, k)
-
-    def _grad_next_bosonic(self, he_n, k):
-        op = _data.mul(self._s_pre_minus_post_Q[k], -1j)
-        return op
-
-    def _grad_next_fermionic(self, he_n, k):
-        he_fermionic_n = [
-            i * int(exp.fermionic)
-            for i, exp in zip(he_n, self.ados.exponents)
+        coeff = -1j * sign2 * ones
+        return names, [
+            np.where(sign1 == -1, coeff, 0), np.where(sign1 == -1, 0, coeff),
         ]
-        n_excite = sum(he_fermionic_n)
-        sign1 = (-1) ** (n_excite + 1)
 
-        n_excite_before_m = sum(he_fermionic_n[:k])
-        sign2 = (-1) ** (n_excite_before_m)
-
-        if self.ados.exponents[k].type == BathExponent.types["+"]:
-            if sign1 == -1:
-                op = _data.mul(self._s_pre_minus_post_Q[k], -1j * sign2)
-            else:
-                op = _data.mul(self._s_pre_plus_post_Q[k], -1j * sign2)
-        elif self.ados.exponents[k].type == BathExponent.types["-"]:
-            if sign1 == -1:
-                op = _data.mul(self._s_pre_minus_post_Qdag[k], -1j * sign2)
+    def _grad_prev_coeffs(self, exp, k, labels, sign1, sign2):
+        """
+        Return the names of the superoperators and their coefficients in
+        the gradient coupling each of ``labels`` to the ADO with one fewer
+        excitation in the ``k``-th exponent.
+        """
+        ck = self.ados.ck
+        n_k = labels[:, k]
+        if exp.fermionic:
+            sigma_bar_k = k + self.ados.sigma_bar_k_offset[k]
+            if exp.type == BathExponent.types["+"]:
+                names = ["_spreQdag", "_spostQdag"]
+            elif exp.type == BathExponent.types["-"]:
+                names = ["_spreQ", "_spostQ"]
             else:
-                op = _data.mul(self._s_pre_plus_post_Qdag[k], -1j * sign2)
-        else:
-            raise ValueError(
-                f"Unsupported type {self.ados.exponents[k].type}"
-                f" for exponent {k}"
-            )
-        return op
+                raise ValueError(
+                    f"Unsupported type {exp.type} for exponent {k}"
+                )
+            return names, [
+                -1j * sign2 * ck[k],
+                1j * sign2 * sign1 * np.conj(ck[sigma_bar_k]),
+            ]
+        if exp.type == BathExponent.types.R:
+            return ["_s_pre_minus_post_Q"], [-1j * n_k * ck[k]]
+        if exp.type == BathExponent.types.I:
+            return ["_s_pre_plus_post_Q"], [-1j * n_k * 1j * ck[k]]
+        if exp.type == BathExponent.types.RI:
+            return ["_s_pre_minus_post_Q", "_s_pre_plus_post_Q"], [
+                n_k * -1j * ck[k], n_k * self.ados.ck2[k],
+            ]
+        raise ValueError(f"Unsupported type {exp.type} for exponent {k}")
 
     def _rhs(self):
         """ Make the RHS for the HEOM. """
@@ -837,27 +954,137 @@ class HEOMSolver(Solver):
             self.ados.idx, block=self._sup_shape, nhe=self._n_ados
         )
 
-        for he_n in self.ados.labels:
-            op = self._grad_n(he_n)
-            ops.add_op(he_n, he_n, op)
-            for k in range(len(self.ados.dims)):
-                next_he = self.ados.next(he_n, k)
-                if next_he is not None:
-                    op = self._grad_next(he_n, k)
-                    ops.add_op(he_n, next_he, op)
-                prev_he = self.ados.prev(he_n, k)
-                if prev_he is not None:
-                    op = self._grad_prev(he_n, k)
-                    ops.add_op(he_n, prev_he, op)
+        # Blocks are only built once for each distinct coefficient and
+        # shared between all the ADOs that use them.
+        diag = self._grad_n_coeffs()
+        diag, inverse = np.unique(diag, return_inverse=True)
+        blocks = [_data.mul(self._sId, coeff) for coeff in diag]
+        idx = np.arange(self._n_ados)
+        ops.add_ops(idx, idx, blocks, inverse.ravel())
+
+        for k, names, rows, cols, coeffs in self._rhs_couplings():
+            if not len(rows):
+                continue
+            coeffs = np.array(coeffs, dtype=complex).reshape(len(names), -1)
+            coeffs, inverse = np.unique(
+                coeffs.T, axis=0, return_inverse=True
+            )
+            blocks = [
+                self._grad_op([
+                    (name, coeff) for name, coeff in zip(names, row)
+                    if coeff != 0
+                ], k)
+                for row in coeffs
+            ]
+            ops.add_ops(rows, cols, blocks, inverse.ravel())
 
         return ops.gather()
 
-    def _calculate_rhs(self):
-        """ Make the full RHS required by the solver. """
+    def _rhs_matrix_free(self):
+        """
+        Make the RHS for the HEOM as a list of lazy Kronecker products of a
+        coupling between the ADOs and a superoperator acting on each of them.
+
+        Each bath superoperator is stored once and applied to all ADOs with
+        one product, instead of being copied in each block of the RHS.
+        """
+        n_ados = self._n_ados
+        dims = [n_ados, self._sup_shape]
+        diag = self._grad_n_coeffs()
+        couplings = {}
+
+        for k, names, rows, cols, coeffs in self._rhs_couplings():
+            for name, coeff in zip(names, coeffs):
+                coeff = np.broadcast_to(coeff, rows.shape)
+                nonzero = coeff != 0
+                entry = couplings.setdefault((name, k), ([], [], []))
+                entry[0].append(rows[nonzero])
+                entry[1].append(cols[nonzero])
+                entry[2].append(coeff[nonzero])
+
+        ops = [_data.KronOp(dims, [_data.diag(diag, 0, dtype="csr")], [0])]
+        for (name, k), (rows, cols, coeffs) in couplings.items():
+            coupling = _csr.CSR(sp.csr_matrix(
+                (
+                    np.concatenate(coeffs),
+                    (np.concatenate(rows), np.concatenate(cols)),
+                ),
+                shape=(n_ados, n_ados), dtype=complex,
+            ))
+            if not coupling.as_scipy().nnz:
+                continue
+            ops.append(_data.KronOp(
+                dims, [coupling, getattr(self, name)[k]], [0, 1]
+            ))
+        return ops
+
+    def _rhs_cache_path(self):
+        """
+        Return the file in which the RHS is cached in ``rhs_cache_dir``.
+
+        The RHS returned by ``_rhs`` only depends on the bath exponents,
+        their coupling operators and the ADOs of the hierarchy, not on the
+        system Liouvillian, so it is keyed on those.
+        """
+        labels = self._label_array()
+        key = hashlib.sha256()
+        key.update(np.array([self._sup_shape, *labels.shape]).tobytes())
+        key.update(labels.tobytes())
+        for exp in self.ados.exponents:
+            key.update(repr((
+                exp.type.name, exp.ck, exp.ck2, exp.vk,
+                exp.sigma_bar_k_offset,
+            )).encode())
+            key.update(exp.Q.full().tobytes())
+        return os.path.join(
+            self._rhs_cache_dir, f"heom_rhs_{key.hexdigest()}.npz"
+        )
+
+    def _rhs_cached(self):
+        """
+        Make the RHS for the HEOM, loading it from and saving it to
+        ``rhs_cache_dir`` if that option is set.
+        """
+        if not self._rhs_cache_dir:
+            return self._rhs()
+        path = self._rhs_cache_path()
+        if os.path.exists(path):
+            return _csr.CSR(sp.load_npz(path))
         rhs_mat = self._rhs()
+        os.makedirs(self._rhs_cache_dir, exist_ok=True)
+        # Write to a temporary file first so that solvers created in
+        # parallel never read a partially written file.
+        tmp_path = f"{path[:-len('.npz')]}.{os.getpid()}.npz"
+        sp.save_npz(tmp_path, rhs_mat.as_scipy(), compressed=False)
+        os.replace(tmp_path, path)
+        return rhs_mat
+
+    def _calculate_rhs(self, matrix_free=False):
+        """ Make the full RHS required by the solver. """
         rhs_dims = [
             [self._sup_shape * self._n_ados], [self._sup_shape * self._n_ados]
         ]
+        self._matrix_free = bool(matrix_free)
+        if matrix_free:
+            # The system Liouvillian acts on each ADOs, it is applied to all
+            # of them with one product, whether it is time-dependent or not.
+            def _lift(x):
+                return Qobj(
+                    _data.KronOp(
+                        [self._n_ados, self._sup_shape],
+                        [_data.to(_csr.CSR, x.data)], [1]
+                    ),
+                    dims=rhs_dims,
+                )
+
+            rhs = QobjEvo([
+                Qobj(op, dims=rhs_dims) for op in self._rhs_matrix_free()
+            ])
+            rhs += self.L_sys.linear_map(_lift)
+            assert rhs.dims == rhs_dims
+            return rhs
+
+        rhs_mat = self._rhs_cached()
         h_identity = _data.identity(self._n_ados, dtype="csr")
 
         if self.L_sys.isconstant:
@@ -872,9 +1099,9 @@ class HEOMSolver(Solver):
             # RHSmat(t) = RHSmat + time dependent terms that only affect the
             # diagonal blocks of the RHS matrix.
             #
-            # This assumption holds because only _grad_n dependents on
-            # the system Liouvillian (and not _grad_prev or _grad_next) and
-            # the bath coupling operators are not time-dependent.
+            # This assumption holds because only the diagonal blocks depend
+            # on the system Liouvillian (and not the couplings between ADOs)
+            # and the bath coupling operators are not time-dependent.
             rhs = QobjEvo(Qobj(rhs_mat, dims=rhs_dims))
 
             def _kron(x):
@@ -897,7 +1124,8 @@ class HEOMSolver(Solver):
 
     def steady_state(
         self,
-        use_mkl=True, mkl_max_iter_refine=100, mkl_weighted_matching=False
+        use_mkl=True, mkl_max_iter_refine=100, mkl_weighted_matching=False,
+        *, solver=None, x0=None, use_precond=True, **kwargs
     ):
         """
         Compute the steady state of the system.
@@ -923,6 +1151,28 @@ class HEOMSolver(Solver):
             For a complete description, see iparm(12) in
             https://www.intel.com/content/www/us/en/docs/onemkl/developer-reference-c/2023-0/pardiso-iparm-parameter.html
 
+        solver : str, optional
+            Name of an iterative solver from ``scipy.sparse.linalg`` (e.g.
+            "gmres", "lgmres" or "bicgstab") to use instead of the direct
+            sparse solve. The iterative solvers avoid the fill-in of the
+            factorization of the full hierarchy, which dominates the memory
+            use of large hierarchies. Keyword only.
+
+        x0 : :obj:`.Qobj` or :class:`~HierarchyADOsState` or array-like
+            Initial guess for the iterative solver, e.g. the final ADO state
+            of a previous ``.run(...)``. See ``state0`` in ``.run(...)`` for
+            the accepted formats. Keyword only.
+
+        use_precond : bool, default: True
+            Whether to precondition the iterative solver with the inverse of
+            the block diagonal of the hierarchy, i.e. of
+            ``L_sys - sum(n_k * vk)`` for each ADO. ADOs with the same
+            ``sum(n_k * vk)`` share a single factorization. Keyword only.
+
+        **kwargs :
+            Extra options to pass to the iterative solver, such as ``atol``
+            or ``maxiter``.
+
         Returns
         -------
         steady_state : Qobj
@@ -943,7 +1193,7 @@ class HEOMSolver(Solver):
         b_mat = np.zeros(n ** 2 * self._n_ados, dtype=complex)
         b_mat[0] = 1.0
 
-        L = self.rhs(0).data.copy().as_scipy()
+        L = _data.to(_csr.CSR, self.rhs(0).data).copy().as_scipy()
         L = L.tolil()
         L[0, 0: n ** 2 * self._n_ados] = 0.0
         L = L.tocsr()
@@ -952,7 +1202,17 @@ class HEOMSolver(Solver):
             (np.zeros(n), [num * (n + 1) for num in range(n)])
         ), shape=(n ** 2 * self._n_ados, n ** 2 * self._n_ados))
 
-        if mkl_spsolve is not None and use_mkl:
+        if solver is not None:
+            if use_precond:
+                kwargs["M"] = self._steady_state_precond(L)
+            if x0 is not None:
+                kwargs["x0"] = _data.to(
+                    _data.Dense, self._prepare_state(x0)
+                ).as_ndarray().ravel()
+            solution = _data.solve(
+                _csr.CSR(L), _data.Dense(b_mat), solver, options=kwargs,
+            ).as_ndarray().ravel()
+        elif mkl_spsolve is not None and use_mkl:
             L.sort_indices()
             solution = mkl_spsolve(
                 L,
@@ -976,6 +1236,43 @@ class HEOMSolver(Solver):
 
         return steady_state, steady_ados
 
+    def _steady_state_precond(self, L):
+        """
+        Return the inverse of the block diagonal of the steady state
+        equations, ``L``, as a ``LinearOperator``.
+
+        The diagonal block of each ADO is ``L_sys - sum(n_k * vk)``, except
+        for the system density matrix whose first row holds the trace
+        condition. Blocks are factorized once per distinct diagonal
+        coefficient. Singular blocks are shifted by the smallest bath
+        rate so that they can be factorized.
+        """
+        sup = self._sup_shape
+        groups = {}
+        for i, coeff in enumerate(self._grad_n_coeffs()):
+            groups.setdefault(None if i == 0 else coeff, []).append(i)
+
+        shift = min((abs(vk) for vk in self.ados.vk if vk), default=1.)
+        blocks = []
+        for idx in groups.values():
+            i = idx[0]
+            block = L[i * sup:(i + 1) * sup, i * sup:(i + 1) * sup].tocsc()
+            try:
+                lu = splu(block)
+            except RuntimeError:
+                # e.g. the system block of a purely unitary system
+                lu = splu((block - shift * sp.identity(sup)).tocsc())
+            blocks.append((lu, np.array(idx)))
+
+        def _solve_blocks(x):
+            x = x.reshape((self._n_ados, sup))
+            out = np.empty_like(x, dtype=complex)
+            for lu, idx in blocks:
+                out[idx] = lu.solve(x[idx].T.astype(complex)).T
+            return out.ravel()
+
+        return LinearOperator(L.shape, matvec=_solve_blocks, dtype=complex)
+
     def run(self, state0, tlist, *, args=None, e_ops=None):
         """
         Solve for the time evolution of the system.
@@ -1155,6 +1452,21 @@ class HEOMSolver(Solver):
         store_ados : bool, default: False
             Whether or not to store the HEOM ADOs. Only relevant when using
             the HEOM solver.
+
+        matrix_free: bool, default: False
+            Apply the RHS without building the full hierarchy matrix. The
+            system Liouvillian and each bath superoperator are stored once and
+            applied to all ADOs at once, with sparse couplings between the
+            ADOs. It saves the ``n_ados`` copies of the system Liouvillian
+            stored in the full matrix, at the cost of more products per step.
+
+        rhs_cache_dir: str, default: None
+            Directory in which to save the assembled hierarchy couplings.
+            Solvers created later with the same bath exponents, coupling
+            operators and ADOs load them from there instead of assembling
+            them again, e.g. when sweeping over parameters of the system
+            Hamiltonian. Only used when the RHS is built, i.e. when the
+            solver is created or ``matrix_free`` is changed.
         """
         return self._options
 
@@ -1162,6 +1474,20 @@ class HEOMSolver(Solver):
     def options(self, new_options):
         Solver.options.fset(self, new_options)
 
+    def _apply_options(self, keys):
+        changed = keys if isinstance(keys, set) else {keys}
+        if "rhs_cache_dir" in changed:
+            self._rhs_cache_dir = self.options["rhs_cache_dir"]
+        if (
+            self._integrator is not None
+            and "matrix_free" in changed
+            and bool(self.options["matrix_free"]) != self._matrix_free
+        ):
+            self.rhs = self._calculate_rhs(self.options["matrix_free"])
+            self.rhs._register_feedback({}, solver=self.name)
+            self._integrator = self._get_integrator()
+        super()._apply_options(keys)
+
 
 class HSolverDL(HEOMSolver):
     """
@@ -1294,24 +1620,37 @@ class _GatherHEOMRHS:
         self._block_size = block
         self._n_blocks = nhe
         self._f_idx = f_idx
-        self._ops = []
+        self._rows = []
+        self._cols = []
+        self._blocks = []
+        self._index = []
 
     def add_op(self, row_he, col_he, op):
         """ Add an block operator to the list. """
-        self._ops.append(
-            (self._f_idx(row_he), self._f_idx(col_he), op)
+        self.add_ops(
+            [self._f_idx(row_he)], [self._f_idx(col_he)], [op], [0]
         )
 
+    def add_ops(self, rows, cols, blocks, index):
+        """
+        Add block operators given by their block row and column. The
+        operator at ``(rows[i], cols[i])`` is ``blocks[index[i]]``, so that
+        a block shared by many ADOs is only stored once.
+        """
+        self._rows.append(np.asarray(rows))
+        self._cols.append(np.asarray(cols))
+        self._blocks.append(blocks)
+        self._index.append(np.asarray(index))
+
     def gather(self):
         """ Create the HEOM liouvillian from a sorted list of smaller sparse
             matrices.
 
             .. note::
 
-                The list of operators contains tuples of the form
-                ``(row_idx, col_idx, op)``. The row_idx and col_idx give the
-                *block* row and column for each op. An operator with
-                block indices ``(N, M)`` is placed at position
+                The operators are given with the block row and column in
+                which they are placed. An operator with block indices
+                ``(N, M)`` is placed at position
                 ``[N * block: (N + 1) * block, M * block: (M + 1) * block]``
                 in the output matrix.
 
@@ -1320,13 +1659,20 @@ class _GatherHEOMRHS:
             rhs : :obj:`Data`
                 A combined matrix of shape ``(block * nhe, block * ne)``.
         """
-        self._ops.sort()
-        ops = np.array(self._ops, dtype=[
-            ("row", _data.base.idxint_dtype),
-            ("col", _data.base.idxint_dtype),
-            ("op", _data.CSR),
-        ])
+        blocks = np.empty(sum(map(len, self._blocks)), dtype=_data.CSR)
+        index = []
+        offset = 0
+        for call_blocks, call_index in zip(self._blocks, self._index):
+            for i, op in enumerate(call_blocks):
+                blocks[offset + i] = op
+            index.append(call_index + offset)
+            offset += len(call_blocks)
+        rows = np.concatenate(self._rows).astype(_data.base.idxint_dtype)
+        cols = np.concatenate(self._cols).astype(_data.base.idxint_dtype)
+        order = np.lexsort((cols, rows))
+        ops = blocks[np.concatenate(index)[order]]
+        rows = np.ascontiguousarray(rows[order])
+        cols = np.ascontiguousarray(cols[order])
         return _csr._from_csr_blocks(
-            ops["row"], ops["col"], ops["op"],
-            self._n_blocks, self._block_size,
+            rows, cols, ops, self._n_blocks, self._block_size,
         )
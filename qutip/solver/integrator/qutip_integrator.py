@@ -132,7 +132,9 @@ class IntegratorDiag(Integrator):
     """
     Integrator solving the ODE by diagonalizing the system and solving
     analytically. It can only solve constant system and has a long preparation
-    time, but the integration is fast.
+    time, but the integration is fast. When the system can not be reliably
+    diagonalized, the exponential of the system is applied to the state with
+    :func:`qutip.core.data.expm_multiply` instead.
 
     Usable with ``method="diag"``
     """
@@ -140,6 +142,9 @@ class IntegratorDiag(Integrator):
     support_time_dependant = False
     supports_blackbox = False
     method = 'diag'
+    # Condition number of the eigenvectors above which the evolution is
+    # computed with ``expm_multiply`` instead.
+    _max_condition = 1e8
 
     def __init__(self, system, options):
         if not system.isconstant:
@@ -150,20 +155,34 @@ class IntegratorDiag(Integrator):
     def _prepare(self):
         self._dt = 0.
         self._expH = None
+        self._system = None
         H0 = self.system(0).to(self.options["eigensolver_dtype"])
         self.diag, self.U = _data.eigs(H0.data, False)
         self.diag = self.diag.reshape((-1, 1))
-        self.Uinv = _data.inv(self.U)
+        try:
+            self.Uinv = _data.inv(self.U)
+            condition = _data.norm.one(self.U) * _data.norm.one(self.Uinv)
+        except ValueError:
+            condition = np.inf
         self.name = "qutip diagonalized"
+        if not condition < self._max_condition:
+            # The system is defective or close to it: the eigenvectors do not
+            # form a good basis. Apply the exponential of the system on the
+            # state instead.
+            self._system = self.system(0).data
+            self.name = "qutip expm_multiply"
 
     def integrate(self, t, copy=True):
         dt = t - self._t
         if dt == 0:
             return self.get_state()
-        elif self._dt != dt:
-            self._expH = np.exp(self.diag * dt)
-            self._dt = dt
-        self._y *= self._expH
+        elif self._system is not None:
+            self._y = _data.expm_multiply(self._system, self._y, dt)
+        else:
+            if self._dt != dt:
+                self._expH = np.exp(self.diag * dt)
+                self._dt = dt
+            self._y *= self._expH
         self._t = t
         return self.get_state(copy)
 
@@ -171,11 +190,16 @@ class IntegratorDiag(Integrator):
         return self.integrate(t, copy=copy)
 
     def get_state(self, copy=True):
+        if self._system is not None:
+            return self._t, self._y.copy() if copy else self._y
         return self._t, _data.matmul(self.U, _data.dense.Dense(self._y))
 
     def set_state(self, t, state0):
         self._t = t
-        self._y = _data.matmul(self.Uinv, state0).to_array()
+        if self._system is not None:
+            self._y = _data.to(_data.Dense, state0)
+        else:
+            self._y = _data.matmul(self.Uinv, state0).to_array()
         self._is_set = True
 
     @property
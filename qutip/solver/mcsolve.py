@@ -118,6 +118,9 @@ def mcsolve(
         - | improved_sampling : Bool
           | Whether to use the improved sampling algorithm from Abdelhafez et
             al. PRA (2019)
+        - | batch_size : int
+          | Number of trajectories evolved together as the columns of a single
+            matrix state.
 
         Additional options are listed under
         `options <./classes.html#qutip.solver.mcsolve.MCSolver.options>`__.
@@ -394,6 +397,189 @@ class MCIntegrator:
         return self._integrator.integrator_options
 
 
+class MCBatchIntegrator(MCIntegrator):
+    """
+    Integrator like object for a batch of mcsolve trajectories.
+
+    The trajectories are evolved together as the columns of a single
+    ``Dense`` state, so that the ODE solver computes the right hand side of
+    the whole batch with one matrix-matrix product. Each column keeps its own
+    random number generator, target norm and collapse list.
+    """
+    name = "mcsolve batch"
+
+    def set_state(self, t, state0, generators,
+                  no_jump=False, jump_prob_floor=0.0):
+        """
+        Set the state of the ODE solver.
+
+        Parameters
+        ----------
+        t : float
+            Initial time
+
+        state0 : qutip.data.Dense
+            Initial states, one trajectory per column.
+
+        generators : list of numpy.random.generator
+            Random number generators, one for each column.
+
+        no_jump: Bool
+            Not supported for batches, must be ``False``.
+
+        jump_prob_floor: float
+            Lower bound on the random numbers used as the target norm of the
+            first jump of each trajectory.
+        """
+        if no_jump:
+            raise ValueError(
+                "The no-jump trajectory can't be computed in a batch."
+            )
+        self.collapses = [[] for _ in generators]
+        self._generators = generators
+        self.target_norm = np.array([
+            generator.random() * (1 - jump_prob_floor) + jump_prob_floor
+            for generator in generators
+        ])
+        self._integrator.set_state(t, _data.to(_data.Dense, state0))
+        self._is_set = True
+
+    def get_state(self, copy=True):
+        return *self._integrator.get_state(copy), self._generators
+
+    def integrate(self, t, copy=False):
+        t_old, y_old = self._integrator.get_state(copy=False)
+        norm_old = self._prob_func(y_old)
+        while t_old < t:
+            t_step, state = self._integrator.mcstep(t, copy=False)
+            norm = self._prob_func(state)
+            collapsed = np.flatnonzero(norm <= self.target_norm)
+            while collapsed.size:
+                # Multiple trajectories can cross their target norm in the
+                # same step. Look for the earliest collapse: if others
+                # trajectories are already below their target at that time,
+                # they collapsed first and we search again on the shorter
+                # interval.
+                col = collapsed[np.argmin(self._guess_collapse_time(
+                    norm_old[collapsed], norm[collapsed],
+                    self.target_norm[collapsed], t_old, t_step
+                ))]
+                t_col, state = self._find_collapse_time(
+                    col, norm_old[col], norm[col], t_old, t_step
+                )
+                norm_col = self._prob_func(state)
+                others = np.flatnonzero(norm_col <= self.target_norm)
+                others = others[others != col]
+                if others.size and t_col < t_step:
+                    t_step, norm, collapsed = t_col, norm_col, others
+                else:
+                    break
+            if collapsed.size:
+                self._do_collapse([col, *others], t_col, state)
+                t_old, y_old = self._integrator.get_state(copy=False)
+                norm_old = self._prob_func(y_old)
+            else:
+                t_old, y_old = t_step, state
+                norm_old = norm
+
+        array = y_old.to_array()
+        return t_old, _data.Dense(array / self._norm_func(y_old), copy=False)
+
+    def _prob_func(self, state):
+        array = state.as_ndarray()
+        if self.issuper:
+            size = int(np.sqrt(array.shape[0]))
+            return np.sum(array[::size + 1], axis=0).real
+        return np.sum(np.abs(array)**2, axis=0)
+
+    def _norm_func(self, state):
+        if self.issuper:
+            return self._prob_func(state)
+        return np.sqrt(self._prob_func(state))
+
+    @staticmethod
+    def _guess_collapse_time(norm_old, norm, target_norm, t_prev, t_final):
+        return t_prev + (
+            (t_final - t_prev)
+            * np.log(norm_old / target_norm)
+            / np.log(norm_old / norm)
+        )
+
+    def _find_collapse_time(self, col, norm_old, norm, t_prev, t_final):
+        """
+        Find the time of the collapse of the trajectory in column ``col`` and
+        the batch state just before it.
+        """
+        target_norm = self.target_norm[col]
+        tries = 0
+        while tries < self.options['norm_steps']:
+            tries += 1
+            if (t_final - t_prev) < self.options['norm_t_tol']:
+                t_guess = t_final
+                _, state = self._integrator.mcstep(t_guess, copy=False)
+                break
+            t_guess = self._guess_collapse_time(
+                norm_old, norm, target_norm, t_prev, t_final
+            )
+            if (t_guess - t_prev) < self.options['norm_t_tol']:
+                t_guess = t_prev + self.options['norm_t_tol']
+            _, state = self._integrator.mcstep(t_guess, copy=False)
+            norm2_guess = self._prob_func(state)[col]
+            if (
+                np.abs(target_norm - norm2_guess) <
+                self.options['norm_tol'] * target_norm
+            ):
+                break
+            elif (norm2_guess < target_norm):
+                # t_guess is still > t_jump
+                t_final = t_guess
+                norm = norm2_guess
+            else:
+                # t_guess < t_jump
+                t_prev = t_guess
+                norm_old = norm2_guess
+
+        if tries >= self.options['norm_steps']:
+            raise RuntimeError(
+                "Could not find the collapse time within desired tolerance. "
+                "Increase accuracy of the ODE solver or lower the tolerance "
+                "with the options 'norm_steps', 'norm_tol', 'norm_t_tol'.")
+
+        return t_guess, state
+
+    def _do_collapse(self, cols, collapse_time, state):
+        """
+        Do the collapse of the trajectories in the columns ``cols`` and
+        restart the ODE solver with the updated batch.
+        """
+        array = state.to_array()
+        for col in cols:
+            column = _data.Dense(array[:, col:col+1])
+            generator = self._generators[col]
+            if len(self._n_ops) == 1:
+                which = 0
+            else:
+                probs = np.zeros(len(self._n_ops))
+                for i, n_op in enumerate(self._n_ops):
+                    probs[i] = n_op.expect_data(collapse_time, column).real
+                probs = np.cumsum(probs)
+                which = np.searchsorted(probs,
+                                        probs[-1] * generator.random())
+
+            column_new = self._c_ops[which].matmul_data(collapse_time, column)
+            new_norm = self._norm_func(column_new)[0]
+            if new_norm < self.options['mc_corr_eps']:
+                # This happen when the collapse is caused by numerical error
+                array[:, col] /= self._norm_func(column)[0]
+            else:
+                array[:, col] = column_new.to_array()[:, 0] / new_norm
+                self.collapses[col].append((collapse_time, which))
+                self.target_norm[col] = generator.random()
+        self._integrator.set_state(
+            collapse_time, _data.Dense(array, copy=False)
+        )
+
+
 # -----------------------------------------------------------------------------
 # MONTE CARLO CLASS
 # -----------------------------------------------------------------------------
@@ -431,6 +617,10 @@ class MCSolver(MultiTrajSolver):
         "map": "serial",
         "mpi_options": {},
         "num_cpus": None,
+        "chunksize": 1,
+        "prefetch": 0,
+        "cache_task": False,
+        "shared_memory": False,
         "bitgenerator": None,
         "method": "adams",
         "mc_corr_eps": 1e-10,
@@ -438,6 +628,7 @@ class MCSolver(MultiTrajSolver):
         "norm_t_tol": 1e-6,
         "norm_tol": 1e-4,
         "improved_sampling": False,
+        "batch_size": 1,
     }
 
     def __init__(
@@ -526,7 +717,8 @@ class MCSolver(MultiTrajSolver):
         # Overridden to sample the no-jump trajectory first. Then, the no-jump
         # probability is used as a lower-bound for random numbers in future
         # monte carlo runs
-        if not self.options["improved_sampling"]:
+        batch_size = self.options.get("batch_size", 1)
+        if not self.options["improved_sampling"] and batch_size <= 1:
             return super().run(state, tlist, ntraj=ntraj, args=args,
                                e_ops=e_ops, timeout=timeout,
                                target_tol=target_tol, seeds=seeds)
@@ -536,32 +728,98 @@ class MCSolver(MultiTrajSolver):
             timeout=timeout, target_tol=target_tol, seeds=seeds
         )
 
-        # first run the no-jump trajectory
-        start_time = time()
-        seed0, no_jump_result = self._run_one_traj(seeds[0], state0, tlist,
-                                                   e_ops, no_jump=True)
-        _, state, _ = self._integrator.get_state(copy=False)
-        no_jump_prob = self._integrator._prob_func(state)
-        no_jump_result.add_absolute_weight(no_jump_prob)
-        result.add((seed0, no_jump_result))
-        result.stats['no jump run time'] = time() - start_time
-
-        # run the remaining trajectories with the random number floor
-        # set to the no jump probability such that we only sample
-        # trajectories with jumps
+        task_kwargs = {}
+        if self.options["improved_sampling"]:
+            # first run the no-jump trajectory
+            start_time = time()
+            seed0, no_jump_result = self._run_one_traj(seeds[0], state0, tlist,
+                                                       e_ops, no_jump=True)
+            _, state, _ = self._integrator.get_state(copy=False)
+            no_jump_prob = self._integrator._prob_func(state)
+            no_jump_result.add_absolute_weight(no_jump_prob)
+            result.add((seed0, no_jump_result))
+            result.stats['no jump run time'] = time() - start_time
+
+            # run the remaining trajectories with the random number floor
+            # set to the no jump probability such that we only sample
+            # trajectories with jumps
+            seeds = seeds[1:]
+            task_kwargs = {'no_jump': False, 'jump_prob_floor': no_jump_prob}
+
         start_time = time()
+        if batch_size > 1:
+            self._batch_integrator = self._get_batch_integrator()
+            task = self._run_traj_batch
+            values = [
+                seeds[i:i + batch_size]
+                for i in range(0, len(seeds), batch_size)
+            ]
+
+            def reduce_func(batch):
+                for trajectory_info in batch:
+                    remaining = result.add(trajectory_info)
+                return remaining
+        else:
+            task = self._run_one_traj
+            values = seeds
+            reduce_func = result.add
+
         map_func(
-            self._run_one_traj, seeds[1:],
+            task, values,
             task_args=(state0, tlist, e_ops),
-            task_kwargs={'no_jump': False, 'jump_prob_floor': no_jump_prob},
-            reduce_func=result.add, map_kw=map_kw,
+            task_kwargs=task_kwargs,
+            reduce_func=reduce_func, map_kw=map_kw,
             progress_bar=self.options["progress_bar"],
             progress_bar_kwargs=self.options["progress_kwargs"]
         )
         result.stats['run time'] = time() - start_time
         return result
 
-    def _get_integrator(self):
+    def _run_traj_batch(self, seeds, state, tlist, e_ops,
+                        **integrator_kwargs):
+        """
+        Run a batch of trajectories together and return the list of results.
+        """
+        results = [
+            self._trajectory_resultclass(e_ops, self.options) for _ in seeds
+        ]
+        generators = [self._get_generator(seed) for seed in seeds]
+        states = _data.Dense(np.repeat(state.to_array(), len(seeds), axis=1))
+        self._batch_integrator.set_state(
+            tlist[0], states, generators, **integrator_kwargs
+        )
+        for result in results:
+            result.add(tlist[0], self._restore_state(state, copy=False))
+        for t, states in self._batch_integrator.run(tlist):
+            array = states.as_ndarray()
+            for col, result in enumerate(results):
+                result.add(t, self._restore_state(
+                    _data.Dense(array[:, col:col+1]), copy=False
+                ))
+
+        jump_prob_floor = integrator_kwargs.get('jump_prob_floor', 0)
+        for result, collapses in zip(
+            results, self._batch_integrator.collapses
+        ):
+            if jump_prob_floor > 0:
+                result.add_relative_weight(1 - jump_prob_floor)
+            result.collapse = collapses
+        return list(zip(seeds, results))
+
+    def _get_batch_integrator(self):
+        """
+        Return a new integrator evolving multiple trajectories at once.
+        """
+        for op in [self.rhs.rhs, *self._c_ops, *self._n_ops]:
+            if op._feedback_functions or op._solver_only_feedback:
+                raise ValueError(
+                    "Feedback arguments are not supported when evolving "
+                    "trajectories in batches, set the 'batch_size' option "
+                    "to 1."
+                )
+        return self._get_integrator(mc_integrator_class=MCBatchIntegrator)
+
+    def _get_integrator(self, mc_integrator_class=None):
         _time_start = time()
         method = self.options["method"]
         if method in self.avail_integrators():
@@ -571,7 +829,8 @@ class MCSolver(MultiTrajSolver):
         else:
             raise ValueError("Integrator method not supported.")
         integrator_instance = integrator(self.rhs(), self.options)
-        mc_integrator = self._mc_integrator_class(
+        mc_integrator_class = mc_integrator_class or self._mc_integrator_class
+        mc_integrator = mc_integrator_class(
             integrator_instance, self.rhs, self.options
         )
         self._init_integrator_time = time() - _time_start
@@ -622,6 +881,23 @@ class MCSolver(MultiTrajSolver):
             Number of cpus to use when running in parallel. ``None`` detect the
             number of available cpus.
 
+        chunksize: int, default: 1
+            Number of trajectories sent to a worker in one task when running
+            in parallel.
+
+        prefetch: int, default: 0
+            Number of tasks queued for each worker in addition to the one being
+            run, so workers do not wait for the next task.
+
+        cache_task: bool, default: False
+            Whether to send the solver to each worker only once, when the
+            worker starts. Following tasks only send the seeds.
+
+        shared_memory: bool, default: False
+            Whether to place the large sparse and dense matrices of the system
+            in shared memory when running in parallel. The workers then use
+            views onto the same arrays instead of each having its own copy.
+
         bitgenerator: {None, "MT19937", "PCG64", "PCG64DXSM", ...}
             Which of numpy.random's bitgenerator to use. With ``None``, your
             numpy version's default is used.
@@ -642,6 +918,15 @@ class MCSolver(MultiTrajSolver):
         improved_sampling: Bool, default: False
             Whether to use the improved sampling algorithm
             of Abdelhafez et al. PRA (2019)
+
+        batch_size: int, default: 1
+            Number of trajectories evolved together. When larger than 1, the
+            trajectories of a batch are integrated as the columns of a single
+            dense state so that the right hand side is computed with one
+            matrix-matrix product for the whole batch. Each collapse restarts
+            the ODE solver for the whole batch, so it is most efficient when
+            collapses are rare compared to the integrator steps. Feedback
+            arguments are not supported in batches.
         """
         return self._options
 
@@ -11,9 +11,11 @@ __all__ = ['mesolve', 'MESolver']
 from numpy.typing import ArrayLike
 from typing import Any, Callable
 from time import time
-from .. import (Qobj, QobjEvo, liouvillian, lindblad_dissipator)
+import numpy as np
+from .. import (Qobj, QobjEvo, liouvillian, lindblad_dissipator, ket2dm)
 from ..typing import QobjEvoLike
 from ..core import data as _data
+from .. import settings
 from .solver_base import Solver, _solver_deprecation
 from .sesolve import sesolve, SESolver
 from ._feedback import _QobjFeedback, _DataFeedback
@@ -126,6 +128,12 @@ def mesolve(
         - | max_step : float
           | Maximum lenght of one internal step. When using pulses, it should be
             less than half the width of the thinnest pulse.
+        - | matrix_free : bool
+          | Evolve the density matrix as a ``N x N`` matrix without building
+            the Liouvillian superoperator. See :obj:`MESolver.options`.
+        - | tabulate_coefficients : bool, float
+          | Replace function coefficients by cubic splines over the span of
+            ``tlist`` before the evolution. A float sets the tolerance.
 
         Other options could be supported depending on the integration method,
         see `Integrator <./classes.html#classes-ode>`_.
@@ -160,6 +168,48 @@ def mesolve(
     return solver.run(rho0, tlist, e_ops=e_ops)
 
 
+class _LindbladRHS(QobjEvo):
+    """
+    Right hand side of the Lindblad master equation acting on the density
+    matrix as a ``N x N`` matrix instead of a column stacked vector::
+
+        d rho / dt = H_eff @ rho + rho @ H_eff.dag()
+                     + sum_k L_k @ rho @ L_k.dag()
+
+    with ``H_eff = -1j * H - 0.5 * sum_k L_k.dag() @ L_k``. The Liouvillian
+    superoperator is never built: only the operator ``H_eff`` and the
+    collapse operators are stored.
+
+    As a ``QobjEvo``, it represents ``H_eff``. Only ``matmul_data`` and
+    ``arguments`` include the collapse operators, so it can only be used by
+    integrators which use the system as a black box.
+    """
+    def __init__(self, H, c_ops):
+        H_eff = -1j * QobjEvo(H)
+        for c_op in c_ops:
+            H_eff -= 0.5 * (c_op.dag() @ c_op)
+        super().__init__(H_eff)
+        self._c_ops = c_ops
+
+    def arguments(self, args=None, **kwargs):
+        super().arguments(args, **kwargs)
+        for c_op in self._c_ops:
+            c_op.arguments(args, **kwargs)
+
+    def matmul_data(self, t, state, out=None):
+        # ``adjoint`` flips the order of Dense matrices, taking it twice gives
+        # terms in the same order as ``state`` and ``out``.
+        state_dag = _data.adjoint(state)
+        out = QobjEvo.matmul_data(self, t, state, out)
+        out = _data.add(
+            out, _data.adjoint(QobjEvo.matmul_data(self, t, state_dag))
+        )
+        for c_op in self._c_ops:
+            rho_L_dag = _data.adjoint(c_op.matmul_data(t, state_dag))
+            out = c_op.matmul_data(t, rho_L_dag, out)
+        return out
+
+
 class MESolver(SESolver):
     """
     Master equation evolution of a density matrix for a given Hamiltonian and
@@ -204,6 +254,8 @@ class MESolver(SESolver):
         "store_states": None,
         "normalize_output": True,
         'method': 'adams',
+        "matrix_free": False,
+        "tabulate_coefficients": False,
     }
 
     def __init__(
@@ -224,13 +276,92 @@ class MESolver(SESolver):
                 raise TypeError("All `c_ops` must be a Qobj or QobjEvo")
 
         self._num_collapse = len(c_ops)
+        self._H = H
+        self._c_ops = c_ops
 
-        rhs = H if H.issuper else liouvillian(H)
-        rhs += sum(c_op if c_op.issuper else lindblad_dissipator(c_op)
-                   for c_op in c_ops)
+        matrix_free = (options or {}).get("matrix_free", None)
+        if matrix_free is None:
+            matrix_free = self.solver_options["matrix_free"]
+        rhs = self._build_rhs(matrix_free)
 
         Solver.__init__(self, rhs, options=options)
 
+    def _build_rhs(self, matrix_free):
+        """
+        Build the right hand side of the evolution: the Liouvillian as a
+        superoperator or, when ``matrix_free``, a :class:`_LindbladRHS`.
+        """
+        H, c_ops = self._H, self._c_ops
+        if not matrix_free:
+            rhs = H if H.issuper else liouvillian(H)
+            rhs += sum(c_op if c_op.issuper else lindblad_dissipator(c_op)
+                       for c_op in c_ops)
+            return QobjEvo(rhs)
+
+        if H.issuper or any(c_op.issuper for c_op in c_ops):
+            raise ValueError(
+                "The 'matrix_free' option requires a Hamiltonian and collapse "
+                "operators, not superoperators."
+            )
+        c_ops = [QobjEvo(c_op) for c_op in c_ops]
+        for op in [QobjEvo(H), *c_ops]:
+            if op._feedback_functions or op._solver_only_feedback:
+                raise ValueError(
+                    "Feedback arguments are not supported with the "
+                    "'matrix_free' option."
+                )
+        return _LindbladRHS(H, c_ops)
+
+    def _get_integrator(self):
+        # Subclasses, such as FMESolver, do not have the option.
+        if self.options.get("matrix_free", False):
+            method = self.options["method"]
+            integrator = self.avail_integrators().get(method, method)
+            if not getattr(integrator, "supports_blackbox", False):
+                raise ValueError(
+                    f"The integration method {method} can not be used with "
+                    "the 'matrix_free' option."
+                )
+        return super()._get_integrator()
+
+    def _apply_options(self, keys):
+        changed = keys if isinstance(keys, set) else {keys}
+        if (
+            self._integrator is not None
+            and "matrix_free" in changed
+            and isinstance(self.rhs, _LindbladRHS)
+                != bool(self.options.get("matrix_free", False))
+        ):
+            self.rhs = self._build_rhs(self.options["matrix_free"])
+            self.rhs._register_feedback({}, solver=self.name)
+            self._integrator = self._get_integrator()
+        super()._apply_options(keys)
+
+    def _prepare_state(self, state):
+        if not isinstance(self.rhs, _LindbladRHS):
+            return super()._prepare_state(state)
+        if state.isket:
+            state = ket2dm(state)
+        if state.dims != self.rhs.dims:
+            raise TypeError(
+                "The 'matrix_free' option can only evolve density matrices "
+                f"with dimensions {self.rhs.dims}, not {state.dims}."
+            )
+        self._state_metadata = {
+            'dims': state._dims,
+            'isherm': state.isherm,
+        }
+        self._normalized = np.abs(state.tr() - 1) <= settings.core["atol"]
+        return _data.to(_data.Dense, state.data)
+
+    def _restore_state(self, data, *, copy=True):
+        if not isinstance(self.rhs, _LindbladRHS):
+            return super()._restore_state(data, copy=copy)
+        state = Qobj(data, **self._state_metadata, copy=copy)
+        if self._options['normalize_output'] and self._normalized:
+            state = state * (1 / state.tr())
+        return state
+
     def _initialize_stats(self):
         stats = super()._initialize_stats()
         stats.update({
@@ -239,6 +370,62 @@ class MESolver(SESolver):
         })
         return stats
 
+    @property
+    def options(self) -> dict:
+        """
+        Solver's options:
+
+        store_final_state: bool, default: False
+            Whether or not to store the final state of the evolution in the
+            result class.
+
+        store_states: bool, default: None
+            Whether or not to store the state vectors or density matrices.
+            On `None` the states will be saved if no expectation operators are
+            given.
+
+        normalize_output: bool, default: True
+            Normalize output state to hide ODE numerical errors.
+
+        progress_bar: str {"text", "enhanced", "tqdm", ""}, default: ""
+            How to present the solver progress.
+            'tqdm' uses the python module of the same name and raise an error
+            if not installed. Empty string or False will disable the bar.
+
+        progress_kwargs: dict, default: {"chunk_size": 10}
+            Arguments to pass to the progress_bar. Qutip's bars use
+            ``chunk_size``.
+
+        method: str, default: "adams"
+            Which ordinary differential equation integration method to use.
+
+        matrix_free: bool, default: False
+            Evolve the density matrix as a ``N x N`` matrix, computing
+            ``-i[H, rho] + sum_k (L_k rho L_k^dag - {L_k^dag L_k, rho} / 2)``
+            with operator-matrix products instead of building the ``N^2 x
+            N^2`` Liouvillian. It uses ``O(nnz(H) + N^2)`` memory instead of
+            the ``O(N nnz(H))`` needed by the superoperator, at the cost of
+            more products per step. The Hamiltonian and collapse operators
+            must not be superoperators, feedback arguments are not supported
+            and only integrators using the system as a black box can be used.
+
+        tabulate_coefficients: bool or float, default: False
+            Replace the coefficients given as python functions by cubic
+            splines over the span of ``tlist`` before the evolution, so they
+            are not called at every step of the integration. The grid is
+            refined until the spline is within this tolerance, relative to
+            the largest value of the coefficient (``1e-8`` for ``True``).
+            Functions which cannot be tabulated, such as discontinuous or
+            non-finite ones, are kept as is. The splines are constant past
+            the ends of ``tlist``. Only used by ``run``, and not with
+            ``matrix_free``.
+        """
+        return self._options
+
+    @options.setter
+    def options(self, new_options: dict[str, Any]):
+        Solver.options.fset(self, new_options)
+
     @classmethod
     def StateFeedback(
         cls,
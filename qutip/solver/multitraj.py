@@ -74,6 +74,10 @@ class MultiTrajSolver(Solver):
         "map": "serial",
         "mpi_options": {},
         "num_cpus": None,
+        "chunksize": 1,
+        "prefetch": 0,
+        "cache_task": False,
+        "shared_memory": False,
         "bitgenerator": None,
     }
 
@@ -156,6 +160,10 @@ class MultiTrajSolver(Solver):
         map_kw.update({
             'timeout': timeout,
             'num_cpus': self.options['num_cpus'],
+            'chunksize': self.options['chunksize'],
+            'prefetch': self.options['prefetch'],
+            'cache_task': self.options['cache_task'],
+            'shared_memory': self.options['shared_memory'],
         })
         state0 = self._prepare_state(state)
         stats['preparation time'] += time() - start_time
@@ -6,14 +6,19 @@ execution library.
 __all__ = ['parallel_map', 'serial_map', 'loky_pmap', 'mpi_pmap']
 
 import multiprocessing
+from multiprocessing import shared_memory as _shm, resource_tracker
+import io
 import os
+import pickle
 import sys
 import time
 import threading
 import concurrent.futures
 import warnings
+import numpy as np
 from qutip.ui.progressbar import progress_bars
 from qutip.settings import available_cpu_count
+from qutip.core.data import CSR, Dense
 
 if sys.platform == 'darwin':
     mp_context = multiprocessing.get_context('fork')
@@ -29,8 +34,15 @@ default_map_kw = {
     'timeout': threading.TIMEOUT_MAX,
     'num_cpus': available_cpu_count(),
     'fail_fast': True,
+    'chunksize': 1,
+    'prefetch': 0,
+    'cache_task': False,
+    'shared_memory': False,
 }
 
+# Arrays smaller than this are pickled as usual when using shared memory.
+_SHARED_MEMORY_MIN_BYTES = 2**16
+
 
 def _read_map_kw(options):
     options = options or {}
@@ -46,6 +58,202 @@ class MapExceptions(Exception):
         self.results = results
 
 
+class _TaskPayload:
+    """
+    Task and its fixed arguments, sent once to each worker when using the
+    ``cache_task`` map option.
+
+    Comparison is by identity so that executors, such as loky's reusable
+    executor, can check if the initializer arguments changed without
+    comparing the arguments themselves.
+    """
+    def __init__(self, task, task_args, task_kwargs):
+        self.task = task
+        self.task_args = task_args
+        self.task_kwargs = task_kwargs
+
+
+def _attach_shared_memory(name):
+    """
+    Attach to an existing shared memory block without registering it to the
+    resource tracker: the process which created the block is responsible for
+    unlinking it. Otherwise the tracker of a worker could unlink the block when
+    the worker exits, see python/cpython#82300.
+    """
+    try:
+        return _shm.SharedMemory(name=name, track=False)
+    except TypeError:
+        # ``track`` was added in python 3.13
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return _shm.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+# Shared memory blocks attached by the worker. The blocks must remain open
+# while data views onto them.
+_attached_memory = []
+
+
+def _release_attached_memory():
+    """Close the attached blocks which are no longer used by any data."""
+    in_use = []
+    for block in _attached_memory:
+        try:
+            block.close()
+        except BufferError:
+            in_use.append(block)
+    _attached_memory[:] = in_use
+
+
+def _load_shared_payload(pickled):
+    _release_attached_memory()
+    return pickle.loads(pickled)
+
+
+def _shared_arrays(name, layout):
+    """
+    Return views on the arrays described by ``layout``, a list of
+    ``(offset, shape, dtype, order)``, in the shared memory block ``name``.
+    """
+    block = _attach_shared_memory(name)
+    _attached_memory.append(block)
+    return [
+        np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset,
+                   order=order)
+        for offset, shape, dtype, order in layout
+    ]
+
+
+def _rebuild_shared_csr(name, layout, shape):
+    data, col_index, row_index = _shared_arrays(name, layout)
+    return CSR((data, col_index, row_index), shape=shape, copy=False)
+
+
+def _rebuild_shared_dense(name, layout):
+    array, = _shared_arrays(name, layout)
+    return Dense(array, copy=False)
+
+
+class _SharedDataPickler(pickle.Pickler):
+    """
+    Pickler which copies the arrays of large ``CSR`` and ``Dense`` data into
+    shared memory blocks and only pickles the reference to the blocks. When
+    unpickled, the data are rebuilt as views onto the shared memory without
+    copy.
+    """
+    def __init__(self, file, blocks):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._blocks = blocks
+
+    def _share(self, arrays):
+        arrays = [np.asarray(array) for array in arrays]
+        offsets = []
+        size = 0
+        for array in arrays:
+            # Keep the arrays aligned for complex128 access.
+            size = -(-size // 16) * 16
+            offsets.append(size)
+            size += array.nbytes
+        block = _shm.SharedMemory(create=True, size=max(size, 1))
+        self._blocks.append(block)
+        layout = []
+        for offset, array in zip(offsets, arrays):
+            order = 'F' if (
+                array.flags.f_contiguous and not array.flags.c_contiguous
+            ) else 'C'
+            view = np.ndarray(array.shape, dtype=array.dtype,
+                              buffer=block.buf, offset=offset, order=order)
+            view[...] = array
+            layout.append((offset, array.shape, array.dtype.str, order))
+        return block.name, layout
+
+    def reducer_override(self, obj):
+        if type(obj) is CSR:
+            scipy = obj.as_scipy()
+            nnz = scipy.indptr[-1]
+            arrays = (scipy.data[:nnz], scipy.indices[:nnz], scipy.indptr)
+            nbytes = sum(array.nbytes for array in arrays)
+            if nbytes >= _SHARED_MEMORY_MIN_BYTES:
+                return _rebuild_shared_csr, (*self._share(arrays), obj.shape)
+        elif type(obj) is Dense:
+            array = obj.as_ndarray()
+            if array.nbytes >= _SHARED_MEMORY_MIN_BYTES:
+                return _rebuild_shared_dense, self._share([array])
+        return NotImplemented
+
+
+class _SharedPayload:
+    """
+    Task payload pickled with its large data stored in shared memory.
+
+    Every worker unpickling it builds its ``CSR`` and ``Dense`` data as views
+    onto the same memory instead of having its own copy. The blocks are owned
+    by the process which created the payload and must be freed with
+    :meth:`release` once the map is done.
+    """
+    def __init__(self, payload):
+        self._blocks = []
+        buffer = io.BytesIO()
+        try:
+            _SharedDataPickler(buffer, self._blocks).dump(payload)
+        except Exception:
+            self.release()
+            raise
+        self._pickled = buffer.getvalue()
+
+    def load(self):
+        return _load_shared_payload(self._pickled)
+
+    def __reduce__(self):
+        return (_load_shared_payload, (self._pickled,))
+
+    def release(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+
+# Payload set by the worker initializer in each worker process.
+_worker_payload = None
+
+
+def _init_worker(payload):
+    global _worker_payload
+    if isinstance(payload, _SharedPayload):
+        # With the `fork` start method, the payload is not pickled.
+        payload = payload.load()
+    _worker_payload = payload
+
+
+def _run_chunk(chunk, payload=None):
+    """
+    Run the task on every value of ``chunk`` inside a worker.
+
+    When ``payload`` is not given, the one cached by the worker initializer
+    is used. Return a list of ``(result, exception)`` pairs, one per value,
+    so that one failure does not discard the results of the whole chunk.
+    """
+    payload = payload or _worker_payload
+    if isinstance(payload, _SharedPayload):
+        payload = payload.load()
+    out = []
+    for value in chunk:
+        try:
+            result = payload.task(
+                value, *payload.task_args, **payload.task_kwargs
+            )
+        except Exception as err:
+            out.append((None, err))
+        else:
+            out.append((result, None))
+    return out
+
+
 def serial_map(task, values, task_args=None, task_kwargs=None,
                reduce_func=None, map_kw=None,
                progress_bar=None, progress_bar_kwargs={}):
@@ -135,13 +343,17 @@ def serial_map(task, values, task_args=None, task_kwargs=None,
 def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
                   timeout, fail_fast, num_workers,
                   progress_bar, progress_bar_kwargs,
-                  setup_executor, extract_result, shutdown_executor):
+                  setup_executor, extract_result, shutdown_executor,
+                  chunksize=1, prefetch=0, cache_task=False,
+                  shared_memory=False):
     """
     Common functionality for parallel_map, loky_pmap and mpi_pmap.
     The parameters `setup_executor`, `extract_result` and `shutdown_executor`
     are callback functions with the following signatures:
 
-    setup_executor: () -> ProcessPoolExecutor
+    setup_executor: (payload: _TaskPayload | None) -> ProcessPoolExecutor
+        When ``payload`` is not ``None``, the executor must call
+        ``_init_worker(payload)`` when starting each worker.
 
     extract_result: Future -> (Any, BaseException)
         If there was an exception e, returns (None, e).
@@ -152,6 +364,13 @@ def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
         executor: The ProcessPoolExecutor that was created in setup_executor
         active_tasks: A set of Futures that are currently still being executed
             (non-empty if: timeout, error, or reduce_func requesting exit)
+
+    With ``chunksize > 1`` or ``cache_task``, the values are sent to the
+    workers in chunks which are run by ``_run_chunk``. With ``cache_task``,
+    the task and its arguments are sent once per worker by the executor's
+    initializer and only the values are sent afterward. With
+    ``shared_memory``, the large ``CSR`` and ``Dense`` data of the task and
+    its arguments are placed in shared memory and viewed by all workers.
     """
 
     if task_args is None:
@@ -159,6 +378,13 @@ def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
     if task_kwargs is None:
         task_kwargs = {}
     end_time = timeout + time.time()
+    chunksize = max(int(chunksize), 1)
+    chunked = chunksize > 1 or cache_task or shared_memory
+    payload = _TaskPayload(task, task_args, task_kwargs)
+    if shared_memory:
+        payload = _SharedPayload(payload)
+    # Number of tasks that can be submitted to the executor at once.
+    max_waiting = num_workers * (1 + max(int(prefetch), 0))
 
     progress_bar = progress_bars[progress_bar](
         len(values), **progress_bar_kwargs
@@ -175,6 +401,14 @@ def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
         results = [None] * len(values)
         result_func = results.__setitem__
 
+    def _add_result(i, result, exception):
+        if exception is not None:
+            errors[i] = exception
+            return
+        remaining_ntraj = result_func(i, result)
+        if remaining_ntraj is not None and remaining_ntraj <= 0:
+            finished.append(True)
+
     def _done_callback(future):
         if not future.cancelled():
             result, exception = extract_result(future)
@@ -190,25 +424,29 @@ def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
                     errors[future._i] = exception
                 else:
                     raise exception
+            elif chunked:
+                for i, (value_result, value_exception) in enumerate(
+                    result or (), future._i
+                ):
+                    _add_result(i, value_result, value_exception)
             else:
-                remaining_ntraj = result_func(future._i, result)
-                if remaining_ntraj is not None and remaining_ntraj <= 0:
-                    finished.append(True)
-        progress_bar.update()
+                _add_result(future._i, result, None)
+        for _ in range(future._n):
+            progress_bar.update()
 
     os.environ['QUTIP_IN_PARALLEL'] = 'TRUE'
     try:
-        with setup_executor() as executor:
+        with setup_executor(payload if cache_task else None) as executor:
             waiting = set()
             i = 0
             aborted = False
 
             while i < len(values):
                 # feed values to the executor, ensuring that there is at
-                # most one task per worker at any moment in time so that
-                # we can shutdown without waiting for greater than the time
-                # taken by the longest task
-                if len(waiting) >= num_workers:
+                # most `1 + prefetch` tasks per worker at any moment in time
+                # so that we can shutdown without waiting for greater than
+                # the time taken by the longest tasks
+                if len(waiting) >= max_waiting:
                     # no space left, wait for a task to complete or
                     # the time to run out
                     timeout = max(0, end_time - time.time())
@@ -225,19 +463,27 @@ def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
                     # no time left, exit the loop
                     aborted = True
                     break
-                while len(waiting) < num_workers and i < len(values):
+                while len(waiting) < max_waiting and i < len(values):
                     # space and time available, add tasks
-                    value = values[i]
-                    future = executor.submit(
-                        task, *((value,) + task_args), **task_kwargs,
-                    )
+                    if cache_task:
+                        chunk = values[i:i + chunksize]
+                        future = executor.submit(_run_chunk, chunk)
+                    elif chunked:
+                        chunk = values[i:i + chunksize]
+                        future = executor.submit(_run_chunk, chunk, payload)
+                    else:
+                        chunk = values[i:i + 1]
+                        future = executor.submit(
+                            task, *((values[i],) + task_args), **task_kwargs,
+                        )
                     # small hack to avoid add_done_callback not supporting
                     # extra arguments and closures inside loops retaining
                     # a reference not a value:
                     future._i = i
+                    future._n = len(chunk)
                     future.add_done_callback(_done_callback)
                     waiting.add(future)
-                    i += 1
+                    i += len(chunk)
 
             if not aborted:
                 # all tasks have been submitted, timeout has not been reaches
@@ -251,6 +497,8 @@ def _generic_pmap(task, values, task_args, task_kwargs, reduce_func,
             shutdown_executor(executor, waiting)
     finally:
         os.environ['QUTIP_IN_PARALLEL'] = 'FALSE'
+        if shared_memory:
+            payload.release()
 
     progress_bar.finished()
     if errors and fail_fast:
@@ -299,6 +547,14 @@ def parallel_map(task, values, task_args=None, task_kwargs=None,
         - timeout: float, Maximum time (sec) for the whole map.
         - num_cpus: int, Number of jobs to run at once.
         - fail_fast: bool, Abort at the first error.
+        - chunksize: int, Number of values sent to a worker in one task.
+        - prefetch: int, Number of tasks queued for each worker in addition
+          to the one being run.
+        - cache_task: bool, Send ``task``, ``task_args`` and ``task_kwargs``
+          once to each worker when it starts instead of with every task.
+        - shared_memory: bool, Place the large ``CSR`` and ``Dense`` data of
+          ``task``, ``task_args`` and ``task_kwargs`` in shared memory so that
+          all workers view the same arrays instead of having their own copy.
 
     Returns
     -------
@@ -317,7 +573,9 @@ def parallel_map(task, values, task_args=None, task_kwargs=None,
     else:
         ctx_kw = {}
 
-    def setup_executor():
+    def setup_executor(payload):
+        if payload is not None:
+            ctx_kw.update(initializer=_init_worker, initargs=(payload,))
         return concurrent.futures.ProcessPoolExecutor(
             max_workers=map_kw['num_cpus'], **ctx_kw,
         )
@@ -337,7 +595,9 @@ def parallel_map(task, values, task_args=None, task_kwargs=None,
         task, values, task_args, task_kwargs, reduce_func,
         map_kw['timeout'], map_kw['fail_fast'], map_kw['num_cpus'],
         progress_bar, progress_bar_kwargs,
-        setup_executor, extract_result, shutdown_executor
+        setup_executor, extract_result, shutdown_executor,
+        map_kw['chunksize'], map_kw['prefetch'], map_kw['cache_task'],
+        map_kw['shared_memory'],
     )
 
 
@@ -378,6 +638,14 @@ def loky_pmap(task, values, task_args=None, task_kwargs=None,
         - timeout: float, Maximum time (sec) for the whole map.
         - num_cpus: int, Number of jobs to run at once.
         - fail_fast: bool, Abort at the first error.
+        - chunksize: int, Number of values sent to a worker in one task.
+        - prefetch: int, Number of tasks queued for each worker in addition
+          to the one being run.
+        - cache_task: bool, Send ``task``, ``task_args`` and ``task_kwargs``
+          once to each worker when it starts instead of with every task.
+        - shared_memory: bool, Place the large ``CSR`` and ``Dense`` data of
+          ``task``, ``task_args`` and ``task_kwargs`` in shared memory so that
+          all workers view the same arrays instead of having their own copy.
 
     Returns
     -------
@@ -393,7 +661,12 @@ def loky_pmap(task, values, task_args=None, task_kwargs=None,
     from loky.process_executor import ShutdownExecutorError
     map_kw = _read_map_kw(map_kw)
 
-    def setup_executor():
+    def setup_executor(payload):
+        if payload is not None:
+            return get_reusable_executor(
+                max_workers=map_kw['num_cpus'],
+                initializer=_init_worker, initargs=(payload,),
+            )
         return get_reusable_executor(max_workers=map_kw['num_cpus'])
 
     def extract_result(future: concurrent.futures.Future):
@@ -416,7 +689,9 @@ def loky_pmap(task, values, task_args=None, task_kwargs=None,
         task, values, task_args, task_kwargs, reduce_func,
         map_kw['timeout'], map_kw['fail_fast'], map_kw['num_cpus'],
         progress_bar, progress_bar_kwargs,
-        setup_executor, extract_result, shutdown_executor
+        setup_executor, extract_result, shutdown_executor,
+        map_kw['chunksize'], map_kw['prefetch'], map_kw['cache_task'],
+        map_kw['shared_memory'],
     )
 
 
@@ -468,6 +743,11 @@ def mpi_pmap(task, values, task_args=None, task_kwargs=None,
         - timeout: float, Maximum time (sec) for the whole map.
         - num_cpus: int, Number of jobs to run at once.
         - fail_fast: bool, Abort at the first error.
+        - chunksize: int, Number of values sent to a worker in one task.
+        - prefetch: int, Number of tasks queued for each worker in addition
+          to the one being run.
+        - cache_task: bool, Send ``task``, ``task_args`` and ``task_kwargs``
+          once to each worker when it starts instead of with every task.
         All remaining entries of map_kw will be passed to the
         mpi4py.MPIPoolExecutor constructor.
 
@@ -481,6 +761,11 @@ def mpi_pmap(task, values, task_args=None, task_kwargs=None,
 
     """
 
+    if map_kw is not None and map_kw.get('shared_memory', False):
+        # MPI workers can run on other nodes, where shared memory blocks
+        # created here cannot be attached.
+        raise ValueError("shared_memory is not supported by mpi_pmap")
+
     from mpi4py.futures import MPIPoolExecutor
 
     # If the provided num_cpus is None, we use the default value instead.
@@ -497,12 +782,22 @@ def mpi_pmap(task, values, task_args=None, task_kwargs=None,
     timeout = map_kw.pop('timeout')
     num_workers = map_kw.pop('num_cpus')
     fail_fast = map_kw.pop('fail_fast')
+    chunk_kw = {
+        key: map_kw.pop(key)
+        for key in ['chunksize', 'prefetch', 'cache_task', 'shared_memory']
+    }
 
     if not worker_number_provided:
         warnings.warn(f'mpi_pmap was called without specifying the number of '
                       f'worker processes, using the default {num_workers}')
 
-    def setup_executor():
+    def setup_executor(payload):
+        if payload is not None:
+            return MPIPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_worker, initargs=(payload,),
+                **map_kw
+            )
         return MPIPoolExecutor(max_workers=num_workers, **map_kw)
 
     def extract_result(future):
@@ -518,7 +813,8 @@ def mpi_pmap(task, values, task_args=None, task_kwargs=None,
         task, values, task_args, task_kwargs, reduce_func,
         timeout, fail_fast, num_workers,
         progress_bar, progress_bar_kwargs,
-        setup_executor, extract_result, shutdown_executor
+        setup_executor, extract_result, shutdown_executor,
+        **chunk_kw
     )
 
 
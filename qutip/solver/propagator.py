@@ -4,7 +4,9 @@ from __future__ import annotations
 __all__ = ['Propagator', 'propagator', 'propagator_steadystate']
 
 import numbers
+from collections import OrderedDict
 import numpy as np
+import scipy.linalg
 
 from .. import Qobj, qeye, qeye_like, unstack_columns, QobjEvo, liouvillian
 from ..core import data as _data
@@ -81,6 +83,12 @@ def propagator(
     if c_ops:
         H = liouvillian(H, c_ops)
 
+    if isinstance(H, Qobj) or H.isconstant:
+        # No need to integrate, see ``Propagator``.
+        U = Propagator(H, options=options, memoize=len(tlist))
+        out = [U(t, tlist[0]) for t in tlist]
+        return out if list_output else out[-1]
+
     U0 = qeye_like(H)
 
     if H.issuper:
@@ -155,14 +163,27 @@ class Propagator:
         Options for the solver.
 
     memoize : int, default: 10
-        Max number of propagator to save.
+        Max number of propagator to save.  For constant systems, the least
+        recently used propagator is discarded first.
 
     tol : float, default: 1e-14
         Absolute tolerance for the time. If a previous propagator was computed
         at a time within tolerance, that propagator will be returned.
 
+    period : float, optional
+        Period of the system, if periodic. Propagators are then only computed
+        over one period and, for any other time, ``U(t + nT) = U(t) U(T)^n``
+        is obtained from the power of ``U(T)``, computed by squaring.
+
     Notes
     -----
+    When the system is constant and given as a :obj:`.Qobj` or
+    :obj:`.QobjEvo`, or a :class:`.SESolver` or :class:`.MESolver` with
+    constant system, the generator of the evolution is diagonalised once and
+    ``U(t)`` is computed for any ``t`` without integrating the evolution. If it
+    can not be reliably diagonalised, ``U(t)`` is computed as a matrix
+    exponential instead.
+
     The :class:`Propagator` is not a :obj:`.QobjEvo` so
     it cannot be used for operations with :obj:`.Qobj` or
     :obj:`.QobjEvo`. It can be made into a
@@ -180,6 +201,7 @@ class Propagator:
         options: dict[str, Any] = None,
         memoize: int = 10,
         tol: float = 1e-14,
+        period: float = None,
     ):
         if isinstance(system, MultiTrajSolver):
             raise TypeError("Non-deterministic solvers cannot be used "
@@ -210,11 +232,80 @@ class Propagator:
         self.args = args
         self.memoize = max(3, int(memoize))
         self.tol = tol
+        if period is not None and not period > 0:
+            raise ValueError("The period need to be a positive number.")
+        self.period = period
+        # U(T)^(2^k) for periodic systems.
+        self._period_squares = []
+        self._constant = (
+            self.cte
+            and type(self.solver) in (SESolver, MESolver)
+            and type(self.solver.rhs) is QobjEvo
+        )
+        self._eigen = None
+        self._cache = OrderedDict()
+
+    # Condition number of the eigenvectors above which the propagator of
+    # constant systems are computed with ``expm`` instead.
+    _max_condition = 1e8
+
+    def _prepare_constant(self):
+        """
+        Diagonalise the generator ``G`` of the evolution,
+        ``dU/dt = G U``, once. ``U(t) = V exp(t D) V^-1`` for any ``t``.
+        """
+        G = self.solver.rhs(0)
+        if not G.issuper and (1j * G).isherm:
+            evals, evecs = scipy.linalg.eigh((1j * G).full())
+            self._eigen = (-1j * evals, evecs, evecs.conj().T)
+            return
+        G = G.full()
+        evals, evecs = scipy.linalg.eig(G)
+        try:
+            evecs_inv = scipy.linalg.inv(evecs)
+        except (np.linalg.LinAlgError, ValueError):
+            condition = np.inf
+        else:
+            condition = (
+                np.linalg.norm(evecs, 1) * np.linalg.norm(evecs_inv, 1)
+            )
+        if condition < self._max_condition:
+            self._eigen = (evals, evecs, evecs_inv)
+        else:
+            self._eigen = G
+
+    def _compute_constant(self, t):
+        if self._eigen is None:
+            self._prepare_constant()
+        if isinstance(self._eigen, tuple):
+            evals, evecs, evecs_inv = self._eigen
+            U = (evecs * np.exp(evals * t)) @ evecs_inv
+        else:
+            U = scipy.linalg.expm(self._eigen * t)
+        return Qobj(U, dims=self.props[0].dims, copy=False)
+
+    def _lookup_or_compute_constant(self, t):
+        """
+        Get U(t) from the least recently used cache or compute it.
+        """
+        for t_cached in self._cache:
+            if abs(t - t_cached) <= self.tol:
+                self._cache.move_to_end(t_cached)
+                return self._cache[t_cached]
+        U = self._compute_constant(t)
+        self._cache[t] = U
+        while len(self._cache) > self.memoize:
+            self._cache.popitem(last=False)
+        return U
 
     def _lookup_or_compute(self, t):
         """
         Get U(t) from cache or compute it.
         """
+        if self._constant:
+            return self._lookup_or_compute_constant(t)
+        if self.period is not None and not 0 <= t <= self.period:
+            return self._lookup_or_compute_periodic(t)
         idx = np.searchsorted(self.times, t)
         if idx < len(self.times) and abs(t-self.times[idx]) <= self.tol:
             U = self.props[idx]
@@ -225,6 +316,35 @@ class Propagator:
             self._insert(t, U, idx)
         return U
 
+    def _lookup_or_compute_periodic(self, t):
+        """
+        Get ``U(t) = U(r) U(T)^n`` with ``t = n T + r`` and ``0 <= r < T``.
+        """
+        n, r = divmod(t, self.period)
+        if self.period - r <= self.tol:
+            n, r = n + 1, 0.
+        return self._lookup_or_compute(r) @ self._period_power(int(n))
+
+    def _period_power(self, n):
+        """
+        Compute ``U(T)^n`` by squaring, keeping ``U(T)^(2^k)`` for reuse.
+        """
+        if n < 0:
+            return self._inv(self._period_power(-n))
+        if not self._period_squares:
+            self._period_squares.append(self._lookup_or_compute(self.period))
+        U = qeye_like(self.props[0])
+        k = 0
+        while n:
+            if k == len(self._period_squares):
+                U_k = self._period_squares[-1]
+                self._period_squares.append(U_k @ U_k)
+            if n & 1:
+                U = U @ self._period_squares[k]
+            n >>= 1
+            k += 1
+        return U
+
     def __call__(self, t: float, t_start: float = 0, **args):
         """
         Get the propagator from ``t_start`` to ``t``.
@@ -241,12 +361,12 @@ class Propagator:
             Updating ``args`` take effect since ``t=0`` and the new ``args``
             will be used in future call.
         """
-        # We could improve it when the system is constant using U(2t) = U(t)**2
         if not self.cte and args and args != self.args:
             self.args = args
             self.solver._argument(args)
             self.times = [0]
             self.props = [qeye_like(self.props[0])]
+            self._period_squares = []
             self.solver.start(self.props[0], self.times[0])
 
         if t_start:
@@ -102,6 +102,9 @@ def sesolve(
         - | max_step : float
           | Maximum lenght of one internal step. When using pulses, it should be
             less than half the width of the thinnest pulse.
+        - | tabulate_coefficients : bool, float
+          | Replace function coefficients by cubic splines over the span of
+            ``tlist`` before the evolution. A float sets the tolerance.
 
         Other options could be supported depending on the integration method,
         see `Integrator <./classes.html#classes-ode>`_.
@@ -152,6 +155,7 @@ class SESolver(Solver):
         "store_states": None,
         "normalize_output": True,
         'method': 'adams',
+        "tabulate_coefficients": False,
     }
 
     def __init__(self, H: Qobj | QobjEvo, *, options: dict[str, Any] = None):
@@ -200,6 +204,16 @@ class SESolver(Solver):
 
         method: str, default: "adams"
             Which ordinary differential equation integration method to use.
+
+        tabulate_coefficients: bool or float, default: False
+            Replace the coefficients given as python functions by cubic
+            splines over the span of ``tlist`` before the evolution, so they
+            are not called at every step of the integration. The grid is
+            refined until the spline is within this tolerance, relative to
+            the largest value of the coefficient (``1e-8`` for ``True``).
+            Functions which cannot be tabulated, such as discontinuous or
+            non-finite ones, are kept as is. The splines are constant past
+            the ends of ``tlist``. Only used by ``run``.
         """
         return self._options
 
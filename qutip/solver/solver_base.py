@@ -7,6 +7,7 @@ from numpy.typing import ArrayLike
 from numbers import Number
 from typing import Any, Callable
 from .. import Qobj, QobjEvo, ket2dm
+from ..core.coefficient import FunctionCoefficient, _tabulate
 from .options import _SolverOptions
 from ..core import stack_columns, unstack_columns
 from .. import settings
@@ -48,11 +49,16 @@ class Solver:
         "store_states": None,
         "normalize_output": True,
         "method": "adams",
+        "tabulate_coefficients": False,
     }
     _resultclass = Result
 
     def __init__(self, rhs, *, options=None):
-        if isinstance(rhs, (QobjEvo, Qobj)):
+        if isinstance(rhs, QobjEvo) and type(rhs) is not QobjEvo:
+            # Specialised right hand side built by the solver, copying it
+            # would turn it back into a plain QobjEvo.
+            self.rhs = rhs
+        elif isinstance(rhs, (QobjEvo, Qobj)):
             self.rhs = QobjEvo(rhs)
         else:
             TypeError("The rhs must be a QobjEvo")
@@ -176,6 +182,10 @@ class Solver:
         _data0 = self._prepare_state(state0)
         self._integrator.set_state(tlist[0], _data0)
         self._argument(args)
+        system = self._tabulated_system(tlist)
+        if system is not None:
+            self._integrator.system = system
+            self._integrator.reset(hard=True)
         stats = self._initialize_stats()
         results = self._resultclass(
             e_ops, self.options,
@@ -187,9 +197,14 @@ class Solver:
         progress_bar = progress_bars[self.options['progress_bar']](
             len(tlist)-1, **self.options['progress_kwargs']
         )
-        for t, state in self._integrator.run(tlist):
-            progress_bar.update()
-            results.add(t, self._restore_state(state, copy=False))
+        try:
+            for t, state in self._integrator.run(tlist):
+                progress_bar.update()
+                results.add(t, self._restore_state(state, copy=False))
+        finally:
+            if system is not None:
+                self._integrator.system = self.rhs
+                self._integrator.reset(hard=True)
         progress_bar.finished()
 
         stats['run time'] = progress_bar.total_time()
@@ -197,6 +212,45 @@ class Solver:
         # stats.update(_integrator.stats)
         return results
 
+    def _tabulated_system(self, tlist):
+        """
+        Return the ``rhs`` with its function coefficients replaced by splines
+        over the span of ``tlist``, as set by the ``tabulate_coefficients``
+        option, or ``None`` if no coefficient is replaced.
+        """
+        tol = self.options.get("tabulate_coefficients", False)
+        if (
+            not tol
+            or len(tlist) < 2
+            or type(self.rhs) is not QobjEvo
+            or self.rhs._feedback_functions
+            or self.rhs._solver_only_feedback
+        ):
+            return None
+        if tol is True:
+            tol = 1e-8
+        t0 = min(tlist[0], tlist[-1])
+        t1 = max(tlist[0], tlist[-1])
+        replaced = []
+
+        def tabulate(coeff):
+            if type(coeff) is not FunctionCoefficient:
+                return coeff
+            # The function is only sampled inside the span of ``tlist``, the
+            # spline being constant past its ends where integrators can
+            # overshoot. Functions which cannot be sampled are kept.
+            try:
+                spline = _tabulate(coeff, t0, t1, tol)
+            except Exception:
+                spline = None
+            if spline is None:
+                return coeff
+            replaced.append(coeff)
+            return spline
+
+        system = self.rhs._map_coefficients(tabulate)
+        return system if replaced else None
+
     def start(self, state0: Qobj, t0: Number) -> None:
         """
         Set the initial state and time for a step evolution.
@@ -3,8 +3,10 @@ __all__ = ['spectrum', 'spectrum_correlation_fft']
 import numpy as np
 import scipy.fftpack
 
-from .steadystate import steadystate
-from ..core import liouvillian, spre, expect
+from .steadystate import steadystate, _pseudo_inverse_sweep
+from ..core import (
+    liouvillian, lindblad_dissipator, expect, operator_to_vector,
+)
 from ..core import data as _data
 from qutip.settings import settings
 
@@ -142,30 +144,18 @@ def _spectrum_pi(L, wlist, a_op, b_op, use_pinv=False):
     Internal function for calculating the spectrum of the correlation function
     :math:`\left<A(\tau)B(0)\right>`.
     """
-    dtype = type(L.data)
     rho_ss = steadystate(L)
-    tr_mat = _data.identity[dtype](rho_ss.shape[0])
-    tr_vec = _data.column_stack(tr_mat).transpose()
-    rho = _data.column_stack(rho_ss.data)
-
-    A = L.data
-    ket = spre(b_op).data @ rho
-    bra = tr_vec @ spre(a_op).data
-
-    I = _data.identity[dtype](L.shape[0])
-    P = _data.kron(rho, tr_vec)
-    Q = I - P
-
-    spectrum = np.zeros(len(wlist))
-    for idx, w in enumerate(wlist):
-        if use_pinv and np.abs(w) > settings.core["atol"]:
-            # At w == 0., "L - iw" is singular
-            MMR = _data.inv(-1.0j * w * I + A)
-        else:
-            MMR = Q @ _data.solve(-1.0j * w * I + A, Q)
-
-        spectrum[idx] = -2 * _data.inner_op(bra, MMR, ket).real
-    return spectrum
+    # ket = spre(B) |rho>> and bra = <<1| spre(A)
+    ket = operator_to_vector(b_op @ rho_ss).full()
+    bra = operator_to_vector(a_op.trans()).full().T
+
+    # S(w) = -2 Re[<<1| A Q (L - iw)^-1 Q B |rho>>], evaluated for all
+    # frequencies from a single reduction of L.
+    sparse = isinstance(L.data, (_data.CSR, _data.Dia)) and not use_pinv
+    out = _pseudo_inverse_sweep(
+        L, rho_ss, -np.asarray(wlist), bra, ket, sparse=sparse
+    )
+    return -2 * out[:, 0, 0].real
 
 
 def _diagonal_evolution(L, rho0, sparse=False):
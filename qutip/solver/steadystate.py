@@ -3,9 +3,12 @@ from qutip import vector_to_operator, operator_to_vector
 from qutip import settings
 import qutip.core.data as _data
 import numpy as np
+import scipy.linalg
+import scipy.sparse
 import scipy.sparse.csgraph
 import scipy.sparse.linalg
 from warnings import warn
+from packaging.version import parse as parse_version
 
 
 __all__ = ["steadystate", "steadystate_floquet", "pseudo_inverse"]
@@ -295,8 +298,24 @@ def _steadystate_power(A, **kw):
     maxiter = kw.pop("power_maxiter", 10)
     tol = kw.pop("power_tol", 1e-12)
     method = kw.pop("method", None)
+    # Direct solvers factorise ``L`` once for all the iterations.
+    factorization = {
+        None: "lu" if isinstance(L, _data.Dense) else "splu",
+        "solve": "lu", "spsolve": "splu", "splu": "splu",
+        "mkl_spsolve": "mkl_splu",
+    }.get(method)
+    if (
+        factorization is not None
+        and isinstance(L, (_data.CSR, _data.Dense, _data.Dia))
+        and set(kw) <= ({"permc_spec"} if factorization == "splu" else set())
+    ):
+        lu = _data.factorize(L, factorization, options=kw)
+        solve = lu.solve
+    else:
+        def solve(y):
+            return _data.solve(L, y, method, options=kw)
     while it < maxiter and _data.norm.max(L @ y) > tol:
-        y = _data.solve(L, y, method, options=kw)
+        y = solve(y)
         y = y / _data.norm.max(y)
         it += 1
 
@@ -533,6 +552,139 @@ def pseudo_inverse(L, rhoss=None, w=None, method='splu', *, use_rcm=False,
     return Qobj(R, dims=L.dims)
 
 
+# Relative residual and maximum number of gmres iterations used in the sparse
+# frequency sweep before factorising the system again.
+_SWEEP_TOL = 1e-13
+_SWEEP_MAXITER = 10
+# From scipy 1.12, the tol keyword of iterative solvers is renamed to rtol.
+_GMRES_RTOL = (
+    "rtol" if parse_version(scipy.__version__) >= parse_version("1.12")
+    else "tol"
+)
+
+
+def _pseudo_inverse_sweep(L, rhoss, wlist, lefts, rights, sparse=None):
+    """
+    Compute ``lefts @ R(w) @ rights`` for each frequency ``w`` of ``wlist``,
+    where ``R(w)`` is the pseudo inverse of ``L`` as computed by
+    :func:`pseudo_inverse` at frequency ``w``: ``Q (L + iw)^-1 Q``.
+
+    The work on ``L`` is done once for the whole sweep. The dense version
+    reduces ``L`` to Schur form, after which each frequency only needs
+    triangular solves. The sparse version factorises a bordered system
+    which is regular at all frequencies. The factorisation is used as a
+    preconditioner of gmres for the following frequencies, which then only
+    need a few sparse products and triangular solves. When this does not converge,
+    as for frequencies far apart, the system is factorised again at the new
+    frequency, reusing the fill-in reducing ordering.
+
+    Parameters
+    ----------
+    L : Qobj
+        Liouvillian superoperator.
+
+    rhoss : Qobj
+        Steady state of ``L``.
+
+    wlist : array_like
+        Frequencies.
+
+    lefts : np.ndarray
+        Row vectors, shape ``(m, N)``.
+
+    rights : np.ndarray
+        Column vectors, shape ``(N, r)``.
+
+    sparse : bool, optional
+        Whether to use the sparse version. Default to ``True`` when ``L`` is
+        stored as a sparse matrix.
+
+    Returns
+    -------
+    out : np.ndarray
+        ``out[k]`` is ``lefts @ R(wlist[k]) @ rights``.
+    """
+    if sparse is None:
+        sparse = isinstance(L.data, (_data.CSR, _data.Dia))
+    wlist = np.asarray(wlist, dtype=float).ravel()
+    N = L.shape[0]
+    rho_vec = operator_to_vector(rhoss).full().ravel()
+    tr_vec = operator_to_vector(qeye_like(rhoss)).full().ravel()
+    # Project on the complement of the steady state: Q = 1 - |rho>><<1|.
+    lefts = lefts - np.outer(lefts @ rho_vec, tr_vec)
+    rights = rights - np.outer(rho_vec, tr_vec @ rights)
+    out = np.zeros((len(wlist), lefts.shape[0], rights.shape[1]),
+                   dtype=complex)
+
+    if not sparse:
+        # L and P = |rho>><<1| commute and P is a projector, so on the range
+        # of Q, (L + iw)^-1 = (L - P + iw)^-1 which is regular at w = 0.
+        A = L.full() - np.outer(rho_vec, tr_vec)
+        T, Z = scipy.linalg.schur(A, output="complex")
+        lefts = lefts @ Z
+        rights = Z.conj().T @ rights
+        diag = np.diag_indices(N)
+        T_diag = T[diag]
+        for k, w in enumerate(wlist):
+            T[diag] = T_diag + 1j * w
+            out[k] = lefts @ scipy.linalg.solve_triangular(T, rights)
+        return out
+
+    # The bordered system
+    #     [[L + iw, |rho>>], [<<1|, 0]] [x, mu] = [b, 0]
+    # has the solution x = (L + iw)^-1 b, mu = 0, for b in the range of Q and
+    # is regular for all w.
+    L = _data.to(_data.CSR, L.data).as_scipy()
+    M = scipy.sparse.bmat([
+        [L, rho_vec.reshape(-1, 1)],
+        [tr_vec.reshape(1, -1), None],
+    ], format="csr")
+    shift = scipy.sparse.diags(np.r_[np.ones(N), 0.], format="csr")
+    b = np.vstack([rights, np.zeros((1, rights.shape[1]))])
+    lu = None
+    # After gmres fails, it is not tried for the next ``skip`` frequencies,
+    # doubling each time it fails again, so that sweeps of frequencies too far
+    # apart to use it do not pay for it at each frequency.
+    skip = wait = 0
+    for k, w in enumerate(wlist):
+        A = M + 1j * w * shift
+        x = None
+        if lu is not None and wait == 0:
+            x = _sweep_gmres(A, b, lu)
+            skip = 0 if x is not None else max(2 * skip, 1)
+            wait = skip
+        elif wait:
+            wait -= 1
+        if x is None:
+            lu = _data.factorize(_data.CSR(A), "splu")
+            x = lu.solve(_data.Dense(b)).as_ndarray()
+        out[k] = lefts @ x[:N]
+    return out
+
+
+def _sweep_gmres(A, b, lu):
+    """
+    Solve ``A x = b`` with gmres, preconditioned by the factorisation ``lu``
+    of ``A`` at another frequency. Return ``None`` if it does not converge
+    in ``_SWEEP_MAXITER`` iterations.
+    """
+    precond = scipy.sparse.linalg.LinearOperator(
+        A.shape, dtype=complex,
+        matvec=lambda v: lu.solve(_data.Dense(v.reshape(-1, 1))).as_ndarray()
+    )
+    x = np.zeros(b.shape, dtype=complex)
+    for j in range(b.shape[1]):
+        tol = _SWEEP_TOL * np.linalg.norm(b[:, j])
+        x[:, j], _ = scipy.sparse.linalg.gmres(
+            A, b[:, j], M=precond, restart=_SWEEP_MAXITER, maxiter=1,
+            atol=tol, **{_GMRES_RTOL: 0.}
+        )
+        # Check the true residual, not the preconditioned one.
+        if np.linalg.norm(b[:, j] - A @ x[:, j]) > tol:
+            return None
+    return x
+
+
 def _compute_precond(L, args):
     spilu_keys = {
         'permc_spec',
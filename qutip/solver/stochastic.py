@@ -548,6 +548,10 @@ class StochasticSolver(MultiTrajSolver):
         "map": "serial",
         "mpi_options": {},
         "num_cpus": None,
+        "chunksize": 1,
+        "prefetch": 0,
+        "cache_task": False,
+        "shared_memory": False,
         "bitgenerator": None,
         "method": "platen",
         "store_measurement": "",
@@ -817,6 +821,23 @@ class StochasticSolver(MultiTrajSolver):
             Number of cpus to use when running in parallel. ``None`` detect the
             number of available cpus.
 
+        chunksize: int, default: 1
+            Number of trajectories sent to a worker in one task when running
+            in parallel.
+
+        prefetch: int, default: 0
+            Number of tasks queued for each worker in addition to the one being
+            run, so workers do not wait for the next task.
+
+        cache_task: bool, default: False
+            Whether to send the solver to each worker only once, when the
+            worker starts. Following tasks only send the seeds.
+
+        shared_memory: bool, default: False
+            Whether to place the large sparse and dense matrices of the system
+            in shared memory when running in parallel. The workers then use
+            views onto the same arrays instead of each having its own copy.
+
         bitgenerator: {None, "MT19937", "PCG64DXSM", ...}, default: None
             Which of numpy.random's bitgenerator to use. With ``None``, your
             numpy version's default is used.
@@ -922,6 +943,10 @@ class SMESolver(StochasticSolver):
         "map": "serial",
         "mpi_options": {},
         "num_cpus": None,
+        "chunksize": 1,
+        "prefetch": 0,
+        "cache_task": False,
+        "shared_memory": False,
         "bitgenerator": None,
         "method": "platen",
         "store_measurement": "",
@@ -966,6 +991,10 @@ class SSESolver(StochasticSolver):
         "map": "serial",
         "mpi_options": {},
         "num_cpus": None,
+        "chunksize": 1,
+        "prefetch": 0,
+        "cache_task": False,
+        "shared_memory": False,
         "bitgenerator": None,
         "method": "platen",
         "store_measurement": "",
@@ -4,7 +4,7 @@ import pytest
 
 from qutip.core import data
 from qutip.core.data import csr
-from qutip import qeye, CoreOptions
+from qutip import qeye, rand_herm, CoreOptions
 
 from . import conftest
 
@@ -452,3 +452,22 @@ def test_tidyup():
         assert (small + small).tr() == 0
     with CoreOptions(auto_tidyup_atol=1e-3, auto_tidyup=False):
         assert (small + small).tr() == 2e-5
+
+
+@pytest.mark.parametrize("fortran", [True, False])
+@pytest.mark.parametrize("ncols", [1, 3])
+def test_matmul_dense_openmp_threshold(fortran, ncols):
+    # With the threshold at zero, the threaded kernel is used whenever qutip
+    # was built with OpenMP; the result must match the serial one either way.
+    matrix = rand_herm(50, density=0.3, dtype="csr").data
+    array = np.random.rand(50, ncols) + 1j * np.random.rand(50, ncols)
+    order = "F" if fortran else "C"
+    vectors = data.Dense(np.asarray(array, order=order))
+    expected = data.matmul_csr_dense_dense(matrix, vectors, scale=0.5j)
+    with CoreOptions(openmp_thresh=0):
+        out = data.matmul_csr_dense_dense(matrix, vectors, scale=0.5j)
+    np.testing.assert_allclose(out.to_array(), expected.to_array(), atol=1e-14)
+    np.testing.assert_allclose(
+        out.to_array(), 0.5j * matrix.to_array() @ vectors.to_array(),
+        atol=1e-12,
+    )
@@ -0,0 +1,180 @@
+import numpy as np
+import scipy.linalg
+import pytest
+
+import qutip
+from qutip.core import data
+from qutip.core.data import KronOp, CSR, Dense
+
+
+def _kronop():
+    dims = [2, 3, 2]
+    factors = [qutip.rand_herm(2).data, qutip.rand_unitary(6).data]
+    return KronOp(dims, factors, [0, [2, 1]], scale=0.5j)
+
+
+def _expected(kronop):
+    dims = list(kronop.dims[1])
+    out = kronop.scale * qutip.qeye(dims)
+    for factor, target in zip(kronop.factors, kronop.targets):
+        sub_dims = [dims[sub] for sub in target]
+        oper = qutip.Qobj(factor, dims=[sub_dims, sub_dims])
+        out = qutip.expand_operator(oper, dims, target) @ out
+    return out.full()
+
+
+def test_to_array():
+    kronop = _kronop()
+    assert kronop.shape == (12, 12)
+    np.testing.assert_allclose(kronop.to_array(), _expected(kronop))
+    np.testing.assert_allclose(
+        data.to(Dense, kronop).to_array(), _expected(kronop)
+    )
+
+
+@pytest.mark.parametrize("ncols", [1, 3])
+def test_matmul_dense(ncols):
+    kronop = _kronop()
+    state = data.Dense(np.random.rand(12, ncols) + 1j)
+    out = data.matmul(kronop, state, 2)
+    assert isinstance(out, Dense)
+    np.testing.assert_allclose(
+        out.to_array(), 2 * _expected(kronop) @ state.to_array()
+    )
+
+
+def test_matmul_kronop():
+    kronop = _kronop()
+    expected = _expected(kronop)
+    out = data.matmul(kronop, kronop)
+    assert isinstance(out, KronOp)
+    assert len(out.factors) == 2
+    np.testing.assert_allclose(out.to_array(), expected @ expected)
+    other = KronOp([2, 3, 2], [qutip.rand_herm(3).data], [1])
+    out = data.matmul(kronop, other)
+    assert isinstance(out, KronOp)
+    np.testing.assert_allclose(
+        out.to_array(), expected @ _expected(other)
+    )
+
+
+def test_lazy_operations():
+    kronop = _kronop()
+    expected = _expected(kronop)
+    for out, target in [
+        (data.mul(kronop, 3), 3 * expected),
+        (data.neg(kronop), -expected),
+        (data.pow(kronop, 3), np.linalg.matrix_power(expected, 3)),
+        (data.adjoint(kronop), expected.conj().T),
+        (data.transpose(kronop), expected.T),
+        (data.conj(kronop), expected.conj()),
+        (kronop.copy(), expected),
+    ]:
+        assert isinstance(out, KronOp)
+        np.testing.assert_allclose(out.to_array(), target)
+    np.testing.assert_allclose(data.trace(kronop), np.trace(expected))
+    single = KronOp([2, 3], [qutip.rand_herm(3).data], [1], scale=-1j)
+    out = data.expm(single)
+    assert isinstance(out, KronOp)
+    np.testing.assert_allclose(
+        out.to_array(), scipy.linalg.expm(single.to_array())
+    )
+    expected_kron = np.kron(expected, qutip.sigmay().full())
+    out = data.kron(kronop, qutip.sigmay().data)
+    assert isinstance(out, KronOp)
+    np.testing.assert_allclose(out.to_array(), expected_kron)
+
+
+def test_sum_is_csr():
+    kronop = _kronop()
+    other = KronOp([2, 3, 2], [qutip.rand_herm(3).data], [1])
+    out = data.add(kronop, other, 2)
+    assert isinstance(out, CSR)
+    np.testing.assert_allclose(
+        out.to_array(), _expected(kronop) + 2 * _expected(other)
+    )
+    out = data.sub(kronop, other)
+    assert isinstance(out, CSR)
+    np.testing.assert_allclose(
+        out.to_array(), _expected(kronop) - _expected(other)
+    )
+
+
+def test_special_purpose_dtype():
+    # Known to the data layer, but not listed with the general types.
+    assert KronOp not in data.to.dtypes
+    assert data.to.parse("KronOp") is KronOp
+    assert isinstance(data.to(KronOp, qutip.sigmax().data), KronOp)
+
+
+def test_expect():
+    kronop = _kronop()
+    ket = qutip.rand_ket(12).data
+    dm = qutip.rand_dm(12).data
+    np.testing.assert_allclose(
+        data.expect(kronop, ket),
+        data.expect(data.to(CSR, kronop), ket),
+    )
+    np.testing.assert_allclose(
+        data.expect(kronop, dm),
+        data.expect(data.to(CSR, kronop), dm),
+    )
+
+
+def test_rectangular():
+    ket = qutip.rand_ket(3).data
+    bra = qutip.rand_ket(2).data.adjoint()
+    kronop = KronOp([[2, 3, 1], [2, 1, 2]], [ket, bra], [1, 2])
+    expected = np.kron(np.kron(np.eye(2), ket.to_array()), bra.to_array())
+    assert kronop.shape == expected.shape
+    np.testing.assert_allclose(kronop.to_array(), expected)
+    state = data.Dense(np.random.rand(4, 2) + 0.5j)
+    np.testing.assert_allclose(
+        data.matmul(kronop, state).to_array(), expected @ state.to_array()
+    )
+    np.testing.assert_allclose(
+        data.adjoint(kronop).to_array(), expected.conj().T
+    )
+
+
+def test_bad_targets():
+    with pytest.raises(ValueError):
+        KronOp([2, 2], [qutip.sigmax().data] * 2, [0, 0])
+    with pytest.raises(ValueError):
+        KronOp([2, 2], [qutip.sigmax().data], [2])
+    with pytest.raises(ValueError):
+        KronOp([2, 3], [qutip.sigmax().data], [1])
+
+
+def test_expand_operator():
+    dims = [2, 3, 2, 2]
+    oper = qutip.tensor(qutip.rand_unitary(2), qutip.rand_unitary(2))
+    lazy = qutip.expand_operator(oper, dims, [3, 0], dtype="KronOp")
+    assert isinstance(lazy.data, KronOp)
+    assert lazy.dims == [dims, dims]
+    assert lazy == qutip.expand_operator(oper, dims, [3, 0])
+
+
+def test_sesolve_lazy_sum():
+    N = 4
+    dims = [2] * N
+    H = qutip.QobjEvo(
+        [
+            qutip.expand_operator(qutip.sigmaz(), dims, i, dtype="KronOp")
+            for i in range(N)
+        ] + [[
+            qutip.expand_operator(qutip.sigmax(), dims, 0, dtype="KronOp"),
+            lambda t: np.cos(t)
+        ]]
+    )
+    # Lazy terms are not summed together.
+    assert H.num_elements == N + 1
+    psi0 = qutip.basis(dims, [0] * N, dtype="dense")
+    e_op = qutip.expand_operator(qutip.sigmaz(), dims, 0)
+    result = qutip.sesolve(H, psi0, [0, 1], e_ops=[e_op])
+    H_csr = qutip.QobjEvo([
+        sum(qutip.expand_operator(qutip.sigmaz(), dims, i) for i in range(N)),
+        [qutip.expand_operator(qutip.sigmax(), dims, 0), lambda t: np.cos(t)]
+    ])
+    expected = qutip.sesolve(H_csr, psi0, [0, 1], e_ops=[e_op])
+    np.testing.assert_allclose(result.expect[0], expected.expect[0], atol=1e-6)
@@ -97,6 +97,63 @@ class TestSolve():
             test1 = _data.solve(A, b)
 
 
+class TestFactorize():
+    @pytest.mark.parametrize(['dtype', 'method'], [
+        (CSR, None),
+        (Dia, None),
+        (Dense, None),
+        (CSR, "lu"),
+        (Dense, "splu"),
+        pytest.param(CSR, "mkl_splu", marks=skip_no_mkl),
+    ])
+    def test_mathematically_correct(self, dtype, method):
+        A = qutip.rand_unitary(10, dtype=dtype).data
+        lu = _data.factorize(A, method)
+        for b in [
+            qutip.rand_ket(10, dtype=Dense).data,
+            qutip.rand_dm(10, dtype=CSR).data,
+        ]:
+            expected = np.linalg.solve(A.to_array(), b.to_array())
+            test = lu.solve(b)
+            assert isinstance(test, Dense)
+            np.testing.assert_allclose(test.to_array(), expected,
+                                       atol=1e-7, rtol=1e-7)
+
+    def test_reuse_ordering(self):
+        L = qutip.liouvillian(
+            qutip.rand_herm(5, density=0.5, dtype=CSR), [qutip.destroy(5)]
+        ).to(CSR).data
+        I = _data.identity[CSR](25)
+        b = qutip.rand_ket(25, dtype=Dense).data
+        for w in [1., 2.]:
+            A = _data.add(L, I, -1j * w)
+            expected = np.linalg.solve(A.to_array(), b.to_array())
+            lu = _data.factorize(A)
+            np.testing.assert_allclose(lu.solve(b).to_array(), expected,
+                                       atol=1e-7, rtol=1e-7)
+        assert lu._perm is not None
+
+    def test_cache(self):
+        A = qutip.rand_unitary(10, dtype=CSR).data
+        lu = _data.factorize(A, cache=True)
+        assert _data.factorize(A, cache=True) is lu
+        assert _data.factorize(A) is not lu
+        assert _data.factorize(A.copy(), cache=True) is not lu
+
+    def test_singular(self):
+        for dtype in [CSR, Dense]:
+            with pytest.raises(ValueError) as err:
+                _data.factorize(qutip.num(2, dtype=dtype).data)
+            assert "singular" in str(err.value).lower()
+
+    def test_incorrect_shape(self):
+        with pytest.raises(ValueError):
+            _data.factorize(qutip.Qobj(np.random.rand(5, 10)).data)
+        lu = _data.factorize(qutip.rand_unitary(10).data)
+        with pytest.raises(ValueError):
+            lu.solve(qutip.Qobj(np.random.rand(9, 1)).data)
+
+
 class TestSVD():
     def op_numpy(self, A):
         return scipy.linalg.svd(A)
@@ -155,3 +212,36 @@ class TestSVD():
             (test_U @ _data.diag(test_S1, 0) @ test_V).to_array(),
             atol=1e-7, rtol=1e-7
         )
+
+
+@pytest.mark.parametrize('dtype', [CSR, Dense, Dia])
+def test_expm_multiply_times(dtype):
+    matrix = qutip.rand_herm(10, dtype=dtype).data
+    state = qutip.rand_ket(10).data
+    times = [0, 0.5, 1, 0.5]
+    tests = _data.expm_multiply(matrix, state, times)
+    assert len(tests) == len(times)
+    for test, t in zip(tests, times):
+        np.testing.assert_allclose(
+            test.to_array(),
+            scipy.linalg.expm(t * matrix.to_array()) @ state.to_array(),
+            atol=1e-10,
+        )
+
+
+@pytest.mark.parametrize('times', [
+    pytest.param([20., 0., -0.5, 1.], id="unsorted"),
+    pytest.param([0.5j, 0.25 - 0.25j, 0.25j, 0.], id="complex"),
+])
+def test_expm_multiply_unsorted_times(times):
+    L = qutip.liouvillian(
+        qutip.rand_herm(3), [qutip.destroy(3), qutip.rand_dm(3)]
+    ).data
+    rho = qutip.operator_to_vector(qutip.rand_dm(3)).data
+    tests = _data.expm_multiply(L, rho, times)
+    for test, t in zip(tests, times):
+        np.testing.assert_allclose(
+            test.to_array(),
+            scipy.linalg.expm(t * L.to_array()) @ rho.to_array(),
+            atol=1e-8, rtol=1e-8,
+        )
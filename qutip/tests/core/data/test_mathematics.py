@@ -926,6 +926,43 @@ class TestExpm(UnaryOpMixin):
     ]
 
 
+class TestExpmMultiply(BinaryOpMixin):
+    def op_numpy(self, matrix, state, t):
+        return scipy.linalg.expm(t * matrix) @ state
+
+    shapes = [
+        (x, y)
+        for x, y in shapes_binary_matmul()
+        if x.values[0][0] == x.values[0][1]
+    ]
+    bad_shapes = shapes_binary_bad_matmul() + [
+        (x, y)
+        for x, y in shapes_binary_matmul()
+        if x.values[0][0] != x.values[0][1]
+    ]
+    specialisations = [
+        pytest.param(data.expm_multiply_csr_dense, CSR, Dense, Dense),
+        pytest.param(data.expm_multiply_csr_dense, Dia, Dense, Dense),
+        pytest.param(data.expm_multiply_dense, Dense, Dense, Dense),
+        pytest.param(data.expm_multiply_data, CSR, Dense, Dense),
+    ]
+
+    @pytest.mark.parametrize('t', [None, 0.1, -0.05j],
+                             ids=['default', 't[real]', 't[complex]'])
+    def test_mathematically_correct(self, op, data_l, data_r, out_type, t):
+        left, right = data_l(), data_r()
+        if t is None:
+            expected = self.op_numpy(left.to_array(), right.to_array(), 1)
+            test = op(left, right)
+        else:
+            expected = self.op_numpy(left.to_array(), right.to_array(), t)
+            test = op(left, right, t)
+        assert isinstance(test, out_type)
+        assert test.shape == expected.shape
+        np.testing.assert_allclose(test.to_array(), expected,
+                                   atol=self.atol, rtol=self.rtol)
+
+
 class TestLogm(UnaryOpMixin):
     def op_numpy(self, matrix):
         return scipy.linalg.logm(matrix)
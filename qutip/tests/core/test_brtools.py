@@ -173,6 +173,21 @@ def test_br_term(cutoff, spectra):
     np.testing.assert_allclose(R_dense, R_data, rtol=1e-14, atol=1e-14)
 
 
+@pytest.mark.parametrize('cutoff', [0, 0.1, 0.5, 1, 3])
+def test_br_term_secular_cutoff(cutoff):
+    N = 6
+    A_op = qutip.rand_herm(N, seed=1)
+    diag = np.array([0, 0.3, 0.3, 1.1, 1.5, 2.9])
+    skew = np.subtract.outer(diag, diag)
+    spectrum = (skew > 0) * 1. + 0.1
+    full = _br_term_data(A_op.data, spectrum, skew, np.inf).to_array()
+    mask = np.abs(np.subtract.outer(skew.ravel(), skew.ravel())) < cutoff
+    for func in [_br_term_dense, _br_term_sparse, _br_term_data]:
+        computed = func(A_op.data, spectrum, skew, cutoff).to_array()
+        np.testing.assert_allclose(computed, full * mask,
+                                   rtol=1e-14, atol=1e-14)
+
+
 @pytest.mark.parametrize('cutoff', [0, 0.1, 1, 3, -1])
 def test_brterm(cutoff):
     N = 5
@@ -220,6 +235,56 @@ def test_td_brterm(cutoff):
                                    rtol=1e-14, atol=1e-14)
 
 
+@pytest.mark.parametrize('spectra', [
+    pytest.param("(w>0) * exp(-t)", id="rescaled"),
+    pytest.param("(w>0) * exp(-t) + (w<0) * t", id="not rescaled"),
+])
+def test_brterm_td_spectra(spectra):
+    N = 5
+    H = qutip.num(N)
+    a = qutip.destroy(N)
+    A_op = qutip.QobjEvo(a + a.dag())
+    R = brterm(H, A_op, qutip.coefficient(spectra, args={'w': 0}), 0.1,
+               fock_basis=True)
+    assert isinstance(R, qutip.QobjEvo)
+    for t in [0, 0.5, 1.0, 0.5]:
+        spectra_t = qutip.coefficient(spectra, args={'w': 0, 't': t})
+        expected = brterm(H, a + a.dag(), spectra_t, 0.1, fock_basis=True)
+        np.testing.assert_allclose(R(t).full(), expected.full(),
+                                   rtol=1e-12, atol=1e-12)
+
+
+def test_brterm_grid():
+    N = 5
+    H = qutip.QobjEvo([qutip.num(N), "0.5+t**2"])
+    a = qutip.destroy(N)
+    A_op = qutip.QobjEvo([a + a.dag(), "t"])
+    spectra = qutip.coefficient("(w>0)*0.5", args={'w':0})
+    R = brterm(H, A_op, spectra, 0.1, fock_basis=True)
+    R_grid = brterm(H, A_op, spectra, 0.1, fock_basis=True,
+                    br_cache_size=0, br_grid=[0, 0.5, 1.0])
+    state = qutip.operator_to_vector(qutip.rand_dm(N))
+    for t in [0, 0.5, 1.0]:
+        np.testing.assert_allclose(R_grid(t).full(), R(t).full(), atol=1e-12)
+    np.testing.assert_allclose(
+        R_grid(0.75).full(), ((R(0.5) + R(1.0)) / 2).full(), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        R_grid.matmul(0.75, state).full(), (R_grid(0.75) @ state).full(),
+        atol=1e-12
+    )
+    with pytest.raises(ValueError):
+        brterm(H, A_op, spectra, 0.1, fock_basis=True, br_grid=[1.0, 0.])
+    with pytest.raises(ValueError):
+        brterm(H, A_op, spectra, 0.1, fock_basis=False, br_grid=[0, 1.0])
+    # With a constant Hamiltonian, the eigenbasis does not change.
+    H = qutip.num(N)
+    R = brterm(H, A_op, spectra, 0.1, fock_basis=False)[0]
+    R_grid = brterm(H, A_op, spectra, 0.1, fock_basis=False,
+                    br_cache_size=0, br_grid=[0, 0.5, 1.0])[0]
+    np.testing.assert_allclose(R_grid(0.5).full(), R(0.5).full(), atol=1e-12)
+
+
 @pytest.mark.parametrize('cutoff', [0, 0.1, 1, 3, -1])
 def test_bloch_redfield_tensor_basis(cutoff):
     N = 5
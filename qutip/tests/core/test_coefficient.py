@@ -1,5 +1,6 @@
 import pytest
 import pickle
+import sys
 import qutip
 import numpy as np
 import scipy.interpolate as interp
@@ -241,6 +242,43 @@ def test_CoeffOptions():
         assert not isinstance(coeff1, coeff2.__class__)
 
 
+@pytest.mark.requires_cython
+def test_background_compile():
+    import time
+    from qutip.core.cy.coefficient import (
+        DeferredCoefficient, StrFunctionCoefficient
+    )
+    opt = CompilationOptions(recompile=True, background_compile=True)
+    coeff = coefficient("cos(w * t) + 0.25", args={'w': 2.},
+                        compile_opt=opt)
+    assert isinstance(coeff, DeferredCoefficient)
+    assert coeff(0.5) == pytest.approx(np.cos(1.) + 0.25)
+    start = time.monotonic()
+    while not coeff.ready:
+        assert time.monotonic() - start < 300
+        time.sleep(0.1)
+    coeff(0.)
+    swapped = coeff.copy()
+    assert not isinstance(swapped, (DeferredCoefficient,
+                                    StrFunctionCoefficient))
+    assert coeff(0.5) == pytest.approx(np.cos(1.) + 0.25)
+    assert pickle.loads(pickle.dumps(coeff))(0.5) == coeff(0.5)
+    assert coeff(0.5, w=1.) == pytest.approx(np.cos(0.5) + 0.25)
+
+
+def test_background_compile_failed():
+    from concurrent.futures import Future
+    from qutip.core.cy.coefficient import DeferredCoefficient
+    future = Future()
+    fallback = coefficient(lambda t: t)
+    coeff = DeferredCoefficient(fallback, future, lambda args: None)
+    assert not coeff.ready
+    future.set_exception(RuntimeError("compilation failed"))
+    assert coeff(2.) == 2.
+    assert not coeff.ready
+    assert coeff.copy()(3.) == 3.
+
+
 def test_warn_no_cython():
     option = CompilationOptions(use_cython=False)
     WARN_MISSING_MODULE[0] = 1
@@ -314,6 +352,39 @@ def _mul(coeff):
     return coeff * coeff
 
 
+@pytest.mark.parametrize(['style'], [
+    pytest.param("func", id="func"),
+    pytest.param("array", id="array"),
+    pytest.param("arraylog", id="logarray"),
+    pytest.param("string", id="string"),
+    pytest.param("steparray", id="steparray"),
+    pytest.param("steparraylog", id="steparraylog"),
+    pytest.param("const", id="constant"),
+])
+@pytest.mark.parametrize(['transform'], [
+    pytest.param(_pass, id="single"),
+    pytest.param(_add, id="sum"),
+    pytest.param(_mul, id="prod"),
+    pytest.param(norm, id="norm"),
+    pytest.param(conj, id="conj"),
+])
+def test_CoeffEvaluate(style, transform):
+    coeff = transform(coeff_generator(style, "f"))
+    times = np.concatenate([[-0.1, 0, 1, 1.1], np.linspace(0.01, 1, 20)])
+    expected = np.array([coeff(t) for t in times])
+    np.testing.assert_allclose(coeff.evaluate(times), expected,
+                               rtol=1e-12, atol=1e-15)
+    assert coeff.evaluate(times.reshape(4, 6)).shape == (4, 6)
+    assert coeff.evaluate([]).shape == (0,)
+
+
+def test_CoeffEvaluate_scalar_function():
+    # Functions that do not support arrays are called for each time.
+    coeff = coefficient(lambda t: 1. if t < 0.5 else 2.)
+    np.testing.assert_allclose(coeff.evaluate([0, 0.25, 0.5, 1]),
+                               [1, 1, 2, 2])
+
+
 @pytest.mark.parametrize(['style'], [
     pytest.param("func", id="func"),
     pytest.param("array", id="array"),
@@ -420,6 +491,45 @@ def test_CoeffFromScipyBSpline(imag):
     _assert_eq_over_interval(coverted, raw_scipy, rtol=1e-8, inside=True)
 
 
+def test_simplify():
+    from qutip.core.coefficient import simplify
+    from qutip.core.cy.coefficient import (
+        FlatCoefficient, InterCoefficient, StrFunctionCoefficient
+    )
+    tlist = np.linspace(0, 1, 51)
+    opt = CompilationOptions(use_cython=False)
+    inter1 = coefficient(np.sin(tlist), tlist=tlist)
+    inter2 = coefficient(np.cos(tlist) * 1j, tlist=tlist)
+    func = coefficient(f, args={'w': 0.5})
+    str1 = coefficient("cos(w * t)", args={'w': 2}, compile_opt=opt)
+    str2 = coefficient("w * t", args={'w': 2}, compile_opt=opt)
+    tree = (
+        (inter1 * const(2) + inter2) * func + conj(inter1 * func)
+        + const(3) + str1 * str2 + norm(func * const(1j)) + inter1
+    )
+    for _ in range(50):
+        tree = tree + func * const(0.1)
+    flat = simplify(tree)
+    assert isinstance(flat, FlatCoefficient)
+    # Copies of ``func`` are merged and the strings fused.
+    assert len(flat.terms()) == 7
+    _assert_eq_over_interval(flat, tree)
+    _assert_eq_over_interval(pickle.loads(pickle.dumps(flat)), tree)
+    _assert_eq_over_interval(flat.copy(), tree)
+    _assert_eq_over_interval(
+        flat.replace_arguments(w=1.5), tree.replace_arguments(w=1.5)
+    )
+
+    merged = simplify(inter1 * const(2) + inter2 + const(1))
+    assert isinstance(merged, InterCoefficient)
+    _assert_eq_over_interval(merged, inter1 * const(2) + inter2 + const(1))
+    fused = simplify(str1 + str2 * const(2))
+    assert isinstance(fused, StrFunctionCoefficient)
+    _assert_eq_over_interval(fused, str1 + str2 * const(2))
+    assert simplify(func) is func
+    assert simplify(func * const(0))(0.5) == 0
+
+
 @pytest.mark.parametrize('map_func', [
     pytest.param(qutip.solver.parallel.parallel_map, id='parallel_map'),
     pytest.param(qutip.solver.parallel.loky_pmap, id='loky_pmap'),
@@ -438,3 +548,55 @@ def test_coefficient_parallel(map_func):
     for coeff in coeffs:
         assert isinstance(coeff, Coefficient)
         _assert_eq_over_interval(coeff, expected)
+
+
+@pytest.mark.requires_cython
+def test_coefficient_parallel_compile_once(tmp_path, monkeypatch):
+    import glob
+    import importlib.machinery
+    from qutip.core.cy.coefficient import StrFunctionCoefficient
+    monkeypatch.setattr(qutip.settings, "coeffroot", str(tmp_path))
+    code = "np.log(np.exp(t * t + t * t))"
+    coeffs = qutip.solver.parallel.parallel_map(
+        coefficient, [code] * 8, map_kw={"num_cpus": 4}
+    )
+    expected = coefficient(lambda t: 2 * t * t)
+    for coeff in coeffs:
+        assert not isinstance(coeff, StrFunctionCoefficient)
+        _assert_eq_over_interval(coeff, expected)
+    modules = [
+        file for file in glob.glob(str(tmp_path / "qtcoeff_*"))
+        if file.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+    ]
+    assert len(modules) == 1
+
+
+@pytest.mark.requires_cython
+def test_compiled_cache_eviction(tmp_path, monkeypatch):
+    import json
+    monkeypatch.setattr(qutip.settings, "coeffroot", str(tmp_path))
+    opt = CompilationOptions(max_cache_files=2)
+    codes = ["sin(t) * t", "sin(t) * t * t", "sin(t) * t * t * t"]
+    coeffs = [coefficient(code, compile_opt=opt) for code in codes]
+    for n, coeff in enumerate(coeffs):
+        assert coeff(2) == pytest.approx(np.sin(2) * 2**(n + 1))
+    with open(tmp_path / "manifest.json") as file:
+        manifest = json.load(file)
+    assert len(manifest) == 2
+    assert all(entry["size"] > 0 for entry in manifest.values())
+    assert len(list(tmp_path.glob("qtcoeff_*.pyx"))) == 2
+    # Coefficients used again are recorded again once the refresh interval
+    # has passed.
+    module = sys.modules["qutip.core.coefficient"]
+    monkeypatch.setattr(module, "_ACCESS_REFRESH", 0.)
+    oldest = min(manifest, key=lambda name: manifest[name]["access"])
+    coefficient(codes[1], compile_opt=opt)
+    with open(tmp_path / "manifest.json") as file:
+        assert json.load(file)[oldest]["access"] > manifest[oldest]["access"]
+    # Without a budget, using a compiled coefficient does not touch the
+    # manifest.
+    (tmp_path / "manifest.json").unlink()
+    monkeypatch.setattr(module, "_recorded_access", {})
+    coeff = coefficient(codes[-1], compile_opt=CompilationOptions())
+    assert coeff(2) == pytest.approx(np.sin(2) * 8)
+    assert not (tmp_path / "manifest.json").exists()
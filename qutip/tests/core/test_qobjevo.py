@@ -442,6 +442,24 @@ def test_expect_rho(all_qevo):
                    - op.expect(t, qobj)) < 1e-14
 
 
+def test_expect_tlist(all_qevo):
+    "QobjEvo expect over tlist"
+    op = all_qevo
+    psi = Qobj(np.arange(N) * .5 + .5j)
+    assert_allclose(op.expect_tlist(TESTTIMES, psi),
+                    [op.expect(t, psi) for t in TESTTIMES], atol=1e-14)
+    rhos = [rand_dm(N) for _ in TESTTIMES]
+    assert_allclose(op.expect_tlist(TESTTIMES, rhos),
+                    [op.expect(t, rho) for t, rho in zip(TESTTIMES, rhos)],
+                    atol=1e-14)
+    L = liouvillian(op)
+    assert_allclose(L.expect_tlist(TESTTIMES, rhos),
+                    [L.expect(t, rho) for t, rho in zip(TESTTIMES, rhos)],
+                    atol=1e-14)
+    with pytest.raises(ValueError):
+        op.expect_tlist(TESTTIMES, rhos[:-1])
+
+
 @pytest.mark.parametrize('dtype',
 [pytest.param(dtype, id=dtype.__name__)
      for dtype in _data.to.dtypes])
@@ -467,6 +485,17 @@ def test_compress():
     _assert_qobjevo_equivalent(obj2, obj3)
 
 
+def test_compress_flattens_coefficients():
+    from qutip.core.cy.coefficient import FlatCoefficient
+    coeffs = [coefficient(lambda t, w=w: np.cos(w * t)) for w in range(20)]
+    obj = QobjEvo([[qeye(N), coeff] for coeff in coeffs], compress=False)
+    obj.compress()
+    assert obj.num_elements == 1
+    assert isinstance(obj.to_list()[0][1], FlatCoefficient)
+    for t in [0, 0.5, 1.5]:
+        assert obj(t) == qeye(N) * sum(np.cos(w * t) for w in range(20))
+
+
 @pytest.mark.parametrize(['qobjdtype'],
     [pytest.param(dtype, id=dtype.__name__)
      for dtype in _data.to.dtypes])
@@ -107,6 +107,35 @@ class TestHierarchyADOs:
         assert ados.prev((1, 1), 1) == (1, 0)
         assert ados.prev((0, 2), 1) == (0, 1)
 
+    def test_tol(self):
+        exponents = self.mk_exponents([2, 3])
+        ados = HierarchyADOs(exponents, max_depth=2, tol=0.2)
+        assert ados.tol == 0.2
+        # (0, 2) has an estimated magnitude of 0.5**2 / sqrt(2) < 0.2
+        assert ados.labels == [(0, 0), (0, 1), (1, 0), (1, 1)]
+        assert ados.idx((1, 0)) == 2
+        assert ados.next((0, 1), 1) is None
+        assert ados.next((0, 1), 0) == (1, 1)
+        assert ados.filter(level=2) == [(1, 1)]
+        assert ados.filter(level=2, types=["I", "I"]) == [(1, 1)]
+
+        ados = HierarchyADOs(exponents, max_depth=2, tol=0.3)
+        assert ados.labels == [(0, 0), (0, 1), (1, 0)]
+        assert ados.prev((1, 0), 0) == (0, 0)
+        assert ados.next((1, 0), 1) is None
+
+        ados = HierarchyADOs(exponents, max_depth=2, tol=0)
+        assert ados.labels == HierarchyADOs(exponents, max_depth=2).labels
+
+    def test_tol_keeps_hierarchy_connected(self):
+        exponents = [BathExponent("I", None, Q=None, ck=2.0, vk=1.0)]
+        # (2,) has an estimated magnitude of 2**2 / sqrt(2) > 2.5 but is
+        # only reachable through (1,), which is dropped.
+        ados = HierarchyADOs(exponents, max_depth=2, tol=2.5)
+        assert ados.labels == [(0,)]
+        ados = HierarchyADOs(exponents, max_depth=2, tol=1.5)
+        assert ados.labels == [(0,), (1,), (2,)]
+
     def test_exps(self):
         ados = HierarchyADOs(self.mk_exponents([3, 3, 2]), max_depth=4)
         assert ados.exps((0, 0, 0)) == ()
@@ -759,6 +788,32 @@ class TestHEOMSolver:
         fid = fidelity(rho_final, result.states[-1])
         np.testing.assert_allclose(fid, 1.0, atol=atol)
 
+    @pytest.mark.parametrize(['solver'], [
+        pytest.param("gmres", id="gmres"),
+        pytest.param("lgmres", id="lgmres"),
+        pytest.param("bicgstab", id="bicgstab"),
+    ])
+    def test_steady_state_iterative(self, solver):
+        H_sys = 0.25 * sigmaz() + 0.5 * sigmay()
+        bath = DrudeLorentzBath(sigmaz(), lam=0.025,
+                                gamma=0.05, T=1/0.95, Nk=2)
+        hsolver = HEOMSolver(H_sys, bath, 5)
+
+        rho_direct, ados_direct = hsolver.steady_state()
+        rho_iter, ados_iter = hsolver.steady_state(solver=solver, atol=1e-12)
+        np.testing.assert_allclose(
+            rho_iter.full(), rho_direct.full(), atol=1e-4,
+        )
+
+        # Starting from the solution, no iteration is needed.
+        rho_x0, ados_x0 = hsolver.steady_state(
+            solver=solver, x0=ados_direct, maxiter=1, atol=1e-12,
+            use_precond=False,
+        )
+        np.testing.assert_allclose(
+            ados_x0._ado_state, ados_direct._ado_state, atol=1e-10,
+        )
+
     @pytest.mark.parametrize(['terminator'], [
         pytest.param(True, id="terminator"),
         pytest.param(False, id="noterminator"),
@@ -1145,6 +1200,109 @@ class TestHEOMSolver:
 
         assert states[-1] == ado_state.extract(0)
 
+    @pytest.mark.parametrize(['evo'], [
+        pytest.param("qobj", id="qobj"),
+        pytest.param("qobjevo_timedep", id="qobjevo_timedep"),
+    ])
+    @pytest.mark.parametrize(['fermionic'], [
+        pytest.param(False, id="bosonic"),
+        pytest.param(True, id="fermionic"),
+    ])
+    def test_matrix_free(self, evo, fermionic):
+        Q = sigmaz() + 0.5 * sigmax()
+        H = hamiltonian_to_sys(sigmax(), evo, False)
+        if fermionic:
+            bath = FermionicBath(
+                destroy(2), [1.1, 0.3j], [2.1, 0.5], [0.7, 0.2j], [1.5, 0.4],
+            )
+        else:
+            bath = Bath([
+                BathExponent("R", None, Q=Q, ck=1.1, vk=2.1),
+                BathExponent("I", None, Q=Q, ck=1.2, vk=2.2),
+                BathExponent("RI", None, Q=Q, ck=1.3, vk=2.3, ck2=3.3),
+            ])
+        hsolver = HEOMSolver(H, bath, 3)
+        hsolver_mf = HEOMSolver(H, bath, 3, options={"matrix_free": True})
+        n = hsolver.rhs.shape[0]
+        state = _data.Dense(np.random.rand(n, 1) + 1j * np.random.rand(n, 1))
+        for t in [0, 0.5]:
+            np.testing.assert_allclose(
+                _data.to(_data.CSR, hsolver_mf.rhs(t).data).to_array(),
+                hsolver.rhs(t).full(), atol=1e-14,
+            )
+            np.testing.assert_allclose(
+                hsolver_mf.rhs.matmul_data(t, state).to_array(),
+                hsolver.rhs.matmul_data(t, state).to_array(), atol=1e-13,
+            )
+
+        rho0 = basis(2, 0).proj()
+        tlist = [0, 0.5, 1]
+        expected = hsolver.run(rho0, tlist).states
+        computed = hsolver_mf.run(rho0, tlist).states
+        for rho_mf, rho in zip(computed, expected):
+            np.testing.assert_allclose(rho_mf.full(), rho.full(), atol=1e-6)
+
+        hsolver_mf.options["matrix_free"] = False
+        assert not isinstance(hsolver_mf.rhs(0).data, _data.KronOp)
+
+    def test_rhs_cache_dir(self, tmp_path, monkeypatch):
+        Q = sigmaz() + 0.5 * sigmax()
+        bath = Bath([
+            BathExponent("R", None, Q=Q, ck=1.1, vk=2.1),
+            BathExponent("RI", None, Q=Q, ck=1.3, vk=2.3, ck2=3.3),
+        ])
+        options = {"rhs_cache_dir": str(tmp_path)}
+        hsolver = HEOMSolver(sigmax(), bath, 3, options=options)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # The cached couplings do not depend on the system Hamiltonian.
+        def _no_assembly(self):
+            raise AssertionError("The RHS should be loaded from the cache")
+
+        monkeypatch.setattr(HEOMSolver, "_rhs", _no_assembly)
+        hsolver_cached = HEOMSolver(sigmay(), bath, 3, options=options)
+        monkeypatch.undo()
+        expected = HEOMSolver(sigmay(), bath, 3)
+        np.testing.assert_allclose(
+            hsolver_cached.rhs(0).full(), expected.rhs(0).full(), atol=0,
+        )
+        assert hsolver.rhs(0) != hsolver_cached.rhs(0)
+
+        # A different hierarchy is stored separately.
+        HEOMSolver(sigmax(), bath, 2, options=options)
+        assert len(list(tmp_path.iterdir())) == 2
+
+    @pytest.mark.parametrize(['matrix_free'], [
+        pytest.param(False, id="matrix"),
+        pytest.param(True, id="matrix_free"),
+    ])
+    def test_ado_tol(self, matrix_free):
+        dlm = DrudeLorentzPureDephasingModel(
+            lam=0.025, gamma=0.05, T=1 / 0.95, Nk=2,
+        )
+        bath = DrudeLorentzBath(
+            dlm.Q, dlm.lam, dlm.gamma, dlm.T, dlm.Nk,
+        )
+        options = {"matrix_free": matrix_free, "progress_bar": ""}
+        hsolver = HEOMSolver(dlm.H, bath, 6, options=options)
+        hsolver_tol = HEOMSolver(
+            dlm.H, bath, 6, options=options, ado_tol=1e-5,
+        )
+        assert len(hsolver_tol.ados.labels) < len(hsolver.ados.labels)
+        assert hsolver_tol.rhs.shape[0] == (
+            len(hsolver_tol.ados.labels) * 4
+        )
+
+        tlist = np.linspace(0, 10, 11)
+        expected = hsolver.run(dlm.rho(), tlist).states
+        computed = hsolver_tol.run(dlm.rho(), tlist).states
+        for rho_tol, rho in zip(computed, expected):
+            np.testing.assert_allclose(rho_tol.full(), rho.full(), atol=1e-4)
+        np.testing.assert_allclose(
+            hsolver_tol.steady_state()[0].full(),
+            hsolver.steady_state()[0].full(), atol=1e-4,
+        )
+
 
 class TestHeomsolveFunction:
     @pytest.mark.parametrize(['evo'], [
@@ -243,6 +243,25 @@ def test_time_dependent_spline_in_c_ops():
     assert np.mean(np.abs(brme.expect[0] - exact) / exact) < 1e-5
 
 
+def test_tensor_grid():
+    N = 10
+    a = qutip.destroy(N)
+    H = a.dag()*a
+    psi0 = qutip.basis(N, 9)
+    times = np.linspace(0, 10, 100)
+    kappa = 0.2
+    exact = 9 * np.exp(-kappa * (1 - np.exp(-times)))
+    a_ops = [[qutip.QobjEvo([a + a.dag(), "exp(-t/2)"]),
+              "{kappa} * (w >= 0)".format(kappa=kappa)]]
+    options = {"tensor_grid": np.linspace(0, 10, 201)}
+    brme = brmesolve(H, psi0, times, a_ops, e_ops=[a.dag()*a],
+                     options=options)
+    assert np.mean(np.abs(brme.expect[0] - exact) / exact) < 1e-4
+    with pytest.raises(ValueError) as err:
+        brmesolve(H, psi0, np.linspace(0, 12, 10), a_ops, options=options)
+    assert "tensor grid" in str(err.value)
+
+
 @pytest.mark.slow
 def test_nonhermitian_e_ops():
     N = 5
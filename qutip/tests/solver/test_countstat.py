@@ -88,3 +88,45 @@ def test_dqd_current():
 
     np.testing.assert_allclose(current, current_target, atol=1e-4)
     np.testing.assert_allclose(noise, noise_target, atol=1e-4)
+
+
+@pytest.mark.parametrize("sparse", [True, False])
+def test_noise_sweep_matches_pseudo_inverse(sparse):
+    a = qutip.destroy(4)
+    H = a.dag() * a + 0.3 * (a + a.dag())
+    c_ops = [np.sqrt(0.5) * a, np.sqrt(0.2) * a.dag()]
+    L = qutip.liouvillian(H, c_ops)
+    rhoss = qutip.steadystate(L)
+    wlist = np.linspace(-2, 2, 5)
+    current, noise = qutip.countstat_current_noise(
+        L, c_ops, wlist=wlist, rhoss=rhoss, sparse=sparse
+    )
+    current_pi, noise_pi = qutip.countstat_current_noise(
+        L, c_ops, wlist=wlist, rhoss=rhoss, sparse=False, method="scipy"
+    )
+    np.testing.assert_allclose(current, current_pi, atol=1e-10)
+    np.testing.assert_allclose(noise, noise_pi, atol=1e-8)
+
+
+def test_sparse_sweep_reuses_factorization(monkeypatch):
+    from qutip.solver.steadystate import _pseudo_inverse_sweep
+    calls = []
+    factorize = qutip.core.data.factorize
+
+    def counting_factorize(*args, **kwargs):
+        calls.append(args[0])
+        return factorize(*args, **kwargs)
+
+    a = qutip.destroy(6)
+    H = a.dag() * a + 0.3 * (a + a.dag())
+    L = qutip.liouvillian(H, [np.sqrt(0.5) * a])
+    rhoss = qutip.steadystate(L)
+    lefts = qutip.operator_to_vector(a.dag()).full().T
+    rights = qutip.operator_to_vector(a * rhoss).full()
+    wlist = np.linspace(0.9, 1.1, 21)
+    expected = _pseudo_inverse_sweep(L, rhoss, wlist, lefts, rights, False)
+    monkeypatch.setattr(qutip.core.data, "factorize", counting_factorize)
+    out = _pseudo_inverse_sweep(L, rhoss, wlist, lefts, rights, True)
+    np.testing.assert_allclose(out, expected, rtol=1e-8, atol=1e-10)
+    # Close frequencies are solved with the factorization at another one.
+    assert len(calls) < len(wlist)
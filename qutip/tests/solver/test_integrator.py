@@ -146,6 +146,17 @@ def test_krylov(sizes):
         assert qutip.data.norm.l2(out - ref) == pytest.approx(0, abs=1e-6)
 
 
+def test_diag_defective_system():
+    # Jordan block: the eigenvectors do not span the space.
+    system = qutip.QobjEvo(qutip.Qobj([[-1, 1], [0, -1]]))
+    integrator = IntegratorDiag(system, {})
+    integrator.set_state(0, qutip.basis(2, 1).data)
+    assert integrator.name == "qutip expm_multiply"
+    for t in np.linspace(0.25, 1, 4):
+        out = integrator.integrate(t)[1].to_array()[:, 0]
+        assert_allclose(out, [t * np.exp(-t), np.exp(-t)], atol=1e-10)
+
+
 @pytest.mark.parametrize('integrator',
     [IntegratorScipyAdams, IntegratorScipyBDF, IntegratorScipylsoda],
     ids=["adams", 'bdf', "lsoda"]
@@ -510,3 +510,48 @@ def test_feedback(func, kind):
         psi0, np.linspace(0, 3, 31), e_ops=[qutip.num(10)], ntraj=10
     )
     assert np.all(result.expect[0] > 4. - tol)
+
+
+@pytest.mark.parametrize("improved_sampling", [True, False])
+@pytest.mark.parametrize("super_H", [True, False], ids=["super", "oper"])
+def test_batch_size(improved_sampling, super_H):
+    size = 10
+    ntraj = 50
+    a = qutip.destroy(size)
+    H = qutip.num(size)
+    if super_H:
+        H = qutip.liouvillian(H)
+    state = qutip.basis(size, size-1)
+    times = np.linspace(0, 2, 21)
+    c_ops = [np.sqrt(0.5) * a, [0.2 * a.dag() * a, "t"]]
+    e_ops = [qutip.num(size)]
+    options = {
+        "improved_sampling": improved_sampling,
+        "keep_runs_results": True,
+        "store_final_state": True,
+    }
+    ref = mcsolve(H, state, times, c_ops, e_ops, ntraj=ntraj, seeds=1,
+                  options=options)
+    res = mcsolve(H, state, times, c_ops, e_ops, ntraj=ntraj, seeds=1,
+                  options={**options, "batch_size": 8})
+    assert res.num_trajectories == ntraj
+    assert res.col_which == ref.col_which
+    for col_times, ref_col_times in zip(res.col_times, ref.col_times):
+        np.testing.assert_allclose(col_times, ref_col_times, atol=1e-3)
+    np.testing.assert_allclose(res.expect[0], ref.expect[0], atol=1e-3)
+    for state, ref_state in zip(res.final_state, ref.final_state):
+        assert (state - ref_state).norm() < 1e-3
+
+
+def test_batch_size_feedback():
+    a = qutip.destroy(10)
+    solver = MCSolver(
+        qutip.num(10),
+        c_ops=[qutip.QobjEvo(
+            [a, lambda t, A: A-4],
+            args={"A": MCSolver.ExpectFeedback(qutip.num(10))}
+        )],
+        options={"batch_size": 4},
+    )
+    with pytest.raises(ValueError):
+        solver.run(qutip.basis(10, 7), np.linspace(0, 1, 11), ntraj=4)
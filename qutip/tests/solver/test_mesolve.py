@@ -710,3 +710,52 @@ def test_non_normalized_dm(rho0):
     solver = qutip.MESolver(H, c_ops=[qutip.sigmaz()])
     result = solver.run(rho0, np.linspace(0, 1, 10), e_ops=[qutip.qeye(2)])
     np.testing.assert_allclose(result.expect[0], rho0.tr(), atol=1e-7)
+
+
+@pytest.mark.parametrize("method", all_ode_method, ids=all_ode_method)
+def test_matrix_free(method):
+    N = 6
+    a = qutip.destroy(N)
+    H = [a.dag() * a, [a + a.dag(), lambda t: np.cos(t)]]
+    c_ops = [np.sqrt(0.1) * a, [0.2 * a.dag() * a, lambda t: 1 + t]]
+    rho0 = qutip.coherent_dm(N, 1.)
+    tlist = np.linspace(0, 2, 11)
+    options = {"method": method, "store_states": True}
+    expected = mesolve(H, rho0, tlist, c_ops, options=options)
+    options["matrix_free"] = True
+    result = mesolve(H, rho0, tlist, c_ops, options=options)
+    for state, target in zip(result.states, expected.states):
+        assert state.dims == target.dims
+        assert (state - target).norm() < 1e-6
+
+
+def test_matrix_free_options():
+    N = 4
+    a = qutip.destroy(N)
+    solver = MESolver(
+        qutip.QobjEvo(a.dag() * a), [a], options={"matrix_free": True}
+    )
+    assert not solver.rhs.issuper
+    final = solver.run(qutip.basis(N, 2), [0, 1]).final_state
+    assert final.isoper
+    np.testing.assert_allclose(final.tr(), 1.)
+    solver.options["matrix_free"] = False
+    assert solver.rhs.issuper
+    expected = solver.run(qutip.basis(N, 2), [0, 1]).final_state
+    assert (final - expected).norm() < 1e-6
+
+    # Setting other options must not rebuild the right hand side.
+    solver = MESolver(a.dag() * a, [])
+    solver.options = {"matrix_free": False, "atol": 1e-9}
+    assert isinstance(solver.rhs, qutip.QobjEvo)
+
+    with pytest.raises(ValueError):
+        MESolver(
+            qutip.QobjEvo(qutip.num(N)), [qutip.lindblad_dissipator(a)],
+            options={"matrix_free": True}
+        )
+    with pytest.raises(ValueError):
+        MESolver(
+            qutip.QobjEvo(qutip.num(N)), [a],
+            options={"matrix_free": True, "method": "diag"}
+        )
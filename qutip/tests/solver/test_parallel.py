@@ -1,3 +1,4 @@
+import mmap
 import numpy as np
 import time
 import pytest
@@ -162,3 +163,87 @@ def test_map_early_end(map):
     map(_func1, range(100), reduce_func=reduce_func, **kwargs)
 
     assert len(results) < 100
+
+
+@pytest.mark.parametrize('map', [
+    pytest.param(parallel_map, id='parallel_map'),
+    pytest.param(loky_pmap, id='loky_pmap'),
+    pytest.param(mpi_pmap, id='mpi_pmap'),
+])
+@pytest.mark.parametrize('chunk_kw', [
+    pytest.param({'chunksize': 3}, id='chunksize'),
+    pytest.param({'prefetch': 2}, id='prefetch'),
+    pytest.param({'cache_task': True}, id='cache_task'),
+    pytest.param(
+        {'chunksize': 4, 'prefetch': 1, 'cache_task': True}, id='all'
+    ),
+])
+def test_map_chunks(map, chunk_kw):
+    if map is loky_pmap:
+        pytest.importorskip("loky")
+    if map is mpi_pmap:
+        pytest.importorskip("mpi4py")
+
+    args = (1, 2, 3)
+    kwargs = {'d': 4, 'e': 5, 'f': 6}
+    map_kw = {'num_cpus': 2, **chunk_kw}
+    x = np.arange(10)
+    y1 = [_func1(xx) for xx in x]
+
+    y2 = map(_func2, x, args, kwargs, map_kw=map_kw)
+    assert ((np.array(y1) == np.array(y2)).all())
+
+    y3 = []
+    map(_func2, x, args, kwargs, reduce_func=y3.append, map_kw=map_kw)
+    assert ((np.array(sorted(y1)) == np.array(sorted(y3))).all())
+
+
+@pytest.mark.parametrize('map', [
+    pytest.param(parallel_map, id='parallel_map'),
+    pytest.param(loky_pmap, id='loky_pmap'),
+])
+def test_map_chunks_store_error(map):
+    if map is loky_pmap:
+        pytest.importorskip("loky")
+    map_kw = {"fail_fast": False, "chunksize": 3, "cache_task": True}
+
+    with pytest.raises(MapExceptions) as err:
+        map(func, range(10), map_kw=map_kw)
+    map_error = err.value
+    assert sorted(map_error.errors) == [1, 3, 5, 7, 9]
+    for n, result in enumerate(map_error.results):
+        assert result == (n if n % 2 == 0 else None)
+
+
+def _shared_data_info(x, op, state):
+    return (
+        x,
+        isinstance(op.data.as_scipy().data.base, mmap.mmap),
+        (op @ state).full(),
+    )
+
+
+@pytest.mark.parametrize('map', [
+    pytest.param(parallel_map, id='parallel_map'),
+    pytest.param(loky_pmap, id='loky_pmap'),
+])
+@pytest.mark.parametrize('cache_task', [True, False])
+def test_map_shared_memory(map, cache_task):
+    if map is loky_pmap:
+        pytest.importorskip("loky")
+    import qutip
+    op = qutip.rand_herm(500, density=0.1, dtype="CSR")
+    state = qutip.rand_ket(500, dtype="Dense")
+    expected = (op @ state).full()
+    map_kw = {'num_cpus': 2, 'shared_memory': True, 'cache_task': cache_task}
+
+    results = map(_shared_data_info, range(4), (op, state), map_kw=map_kw)
+    for x, (x_out, is_view, out) in enumerate(results):
+        assert x == x_out
+        assert is_view
+        np.testing.assert_allclose(out, expected)
+
+
+def test_mpi_pmap_shared_memory():
+    with pytest.raises(ValueError):
+        mpi_pmap(_func1, range(4), map_kw={'shared_memory': True})
@@ -21,18 +21,58 @@ def testPropHOB():
 def testPropObj():
     opt = {"method": "dop853"}
     a = destroy(5)
-    H = a.dag()*a
+    # Time dependent system: the propagators are integrated and memoized.
+    H = [a.dag()*a, [a + a.dag(), "0.1 * cos(t)"]]
     U = Propagator(H, c_ops=[a], options=opt, memoize=5, tol=1e-5)
     # Few call to fill the stored propagators.
     U(0.5), U(0.25), U(0.75), U(1), U(-1), U(-.5)
     assert len(U.times) == 5
     assert (U(1) - propagator(H, 1, [a])).norm('max') < 1e-4
     assert (U(0.5) - propagator(H, 0.5, [a])).norm('max') < 1e-4
-    assert (U(1.5, 0.5) - propagator(H, 1, [a])).norm('max') < 1e-4
+    assert (
+        U(1.5, 0.5) - propagator(H, [0.5, 1.5], [a])[1]
+    ).norm('max') < 1e-4
     # Within tol, should use the precomupted value at U(0.5)
     assert (U(0.5) - U(0.5 + 1e-6)).norm('max') < 1e-10
 
 
+@pytest.mark.parametrize("c_ops", [[], [destroy(5)]], ids=["se", "me"])
+def testPropObjConstant(c_ops):
+    a = destroy(5)
+    H = a.dag()*a + 0.3 * (a + a.dag())
+    U = Propagator(H, c_ops=c_ops, memoize=3)
+    L = liouvillian(H, c_ops) if c_ops else -1j * H
+    for t in [0.5, 0.25, 1, -0.5, 2]:
+        assert (U(t) - (L * t).expm()).norm('max') < 1e-10
+    assert len(U._cache) == 3
+    assert (U(1.5, 0.5) - L.expm()).norm('max') < 1e-10
+    assert U(2) is U(2 + 1e-16)
+
+
+def testPropObjDefective():
+    # Jordan block: the generator can not be diagonalised.
+    H = qutip.Qobj([[1, 1], [0, 1]])
+    U = Propagator(H)
+    assert not isinstance(U._eigen, tuple)
+    assert (U(1) - (-1j * H).expm()).norm('max') < 1e-10
+
+
+def testPropObjPeriodic():
+    a = destroy(5)
+    T = 2 * np.pi
+    H = [a.dag()*a, [a + a.dag(), "0.5 * cos(t)"]]
+    opt = {"atol": 1e-10, "rtol": 1e-8}
+    U = Propagator(H, options=opt, period=T)
+    U_ref = Propagator(H, options=opt)
+    for t in [3.7 * T, 2 * T, -1.3 * T]:
+        assert (U(t) - U_ref(t)).norm('max') < 1e-5
+    # Powers of U(T) are obtained by squaring.
+    assert len(U._period_squares) == 2
+    assert all(0 <= t <= T for t in U.times)
+    with pytest.raises(ValueError):
+        Propagator(H, period=0)
+
+
 def func(t):
     return np.cos(t)
 
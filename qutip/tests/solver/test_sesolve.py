@@ -7,7 +7,7 @@ from qutip.solver.krylovsolve import krylovsolve
 from qutip.solver.solver_base import Solver
 
 # Deactivate warning for test without cython
-from qutip.core.coefficient import WARN_MISSING_MODULE
+from qutip.core.coefficient import WARN_MISSING_MODULE, InterCoefficient
 WARN_MISSING_MODULE[0] = 0
 
 
@@ -332,3 +332,33 @@ def test_feedback():
     solver = qutip.SESolver(H)
     result = solver.run(psi0, np.linspace(0, 30, 301), e_ops=[qutip.num(N)])
     assert np.all(result.expect[0] > 2 - tol)
+
+
+def test_tabulate_coefficients():
+    smooth = lambda t: np.cos(t) * np.exp(-t / 5)
+    step = lambda t: 1. if t > 5 else 0.
+    H = qutip.QobjEvo([
+        qutip.sigmaz(),
+        [qutip.sigmax(), smooth],
+        [qutip.sigmay(), step],
+        [qutip.sigmaz(), lambda t: np.sqrt(t)],
+    ])
+    psi0 = qutip.basis(2, 0)
+    tlist = np.linspace(0, 10, 101)
+    options = {"atol": 1e-10, "rtol": 1e-10}
+    ref = SESolver(H, options=options).run(psi0, tlist, e_ops=[qutip.sigmaz()])
+    solver = SESolver(H, options={**options, "tabulate_coefficients": True})
+    systems = []
+
+    def e_op(t, state):
+        systems.append(solver._integrator.system)
+        return qutip.expect(qutip.sigmaz(), state)
+
+    result = solver.run(psi0, tlist, e_ops=[e_op])
+    np.testing.assert_allclose(result.expect[0], ref.expect[0], atol=1e-6)
+    # The smooth function is replaced by a spline during the evolution, the
+    # discontinuous one is kept.
+    coeffs = [part[1] for part in systems[-1].to_list()[1:]]
+    assert isinstance(coeffs[0], InterCoefficient)
+    assert not isinstance(coeffs[1], InterCoefficient)
+    assert solver._integrator.system is solver.rhs
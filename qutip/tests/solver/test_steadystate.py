@@ -65,6 +65,24 @@ def test_qubit(method, kwargs, dtype):
     np.testing.assert_allclose(p_ss_analytic, p_ss, atol=1e-5)
 
 
+@pytest.mark.parametrize("dtype", ["dense", "csr"])
+def test_power_factorizes_once(dtype, monkeypatch):
+    calls = []
+    factorize = qutip.core.data.factorize
+
+    def counting_factorize(*args, **kwargs):
+        calls.append(args[0])
+        return factorize(*args, **kwargs)
+
+    monkeypatch.setattr(qutip.core.data, "factorize", counting_factorize)
+    H = qutip.num(4).to(dtype)
+    c_ops = [qutip.destroy(4, dtype=dtype), 0.5 * qutip.create(4, dtype=dtype)]
+    rho_ss = qutip.steadystate(H, c_ops, method="power", power_tol=1e-14)
+    expected = qutip.steadystate(H, c_ops)
+    np.testing.assert_allclose(rho_ss.full(), expected.full(), atol=1e-8)
+    assert len(calls) == 1
+
+
 @pytest.mark.parametrize(['method', 'kwargs'], [
     pytest.param('direct', {}, id="direct"),
     pytest.param('direct', {'solver': 'mkl'}, id="direct_mkl",
@@ -3,6 +3,7 @@ import itertools
 import random
 import numpy as np
 import qutip
+from qutip.core.energy_restricted import EnrIndex, EnrSpace
 
 
 def _n_enr_states(dimensions, n_excitations):
@@ -79,6 +80,47 @@ def test_fock_state(dimensions, n_excitations):
             assert abs(n.matrix_element(state.dag(), state)) - x < 1e-10
 
 
+def test_enr_index(dimensions, n_excitations):
+    index = EnrIndex(dimensions, n_excitations)
+    expected = list(qutip.state_number_enumerate(dimensions, n_excitations))
+    states = index.states()
+    assert index.size == len(expected)
+    assert [tuple(state) for state in states.tolist()] == expected
+    np.testing.assert_array_equal(
+        index.rank(states), np.arange(len(expected))
+    )
+    np.testing.assert_array_equal(
+        index.unrank(np.arange(len(expected))), states
+    )
+    for idx, state in enumerate(expected):
+        assert index.rank(state) == idx
+        assert index.unrank(idx) == state
+    all_states = np.array(list(itertools.product(
+        *(range(-1, dimension + 1) for dimension in dimensions)
+    )))
+    outside = [
+        state for state in all_states.tolist()
+        if tuple(state) not in set(expected)
+    ]
+    assert np.all(index.rank(np.array(outside)) == -1)
+    assert index.rank(outside[0]) == -1
+    with pytest.raises(IndexError):
+        index.unrank(len(expected))
+
+
+def test_enr_space_lookup():
+    space = EnrSpace([2, 3], 2)
+    assert space.dims2idx([1, 1]) == 4
+    assert space.idx2dims(4) == (1, 1)
+    assert space.state2idx[(1, 1)] == 4
+    assert space.idx2state[4] == (1, 1)
+    # The dictionaries are only built once.
+    assert space.state2idx is space.state2idx
+    assert space.idx2state is space.idx2state
+    with pytest.raises(KeyError):
+        space.dims2idx([1, 2])
+
+
 def test_fock_state_error():
     with pytest.raises(ValueError) as e:
         state = qutip.enr_fock([2, 2, 2], 1, [1, 1, 1])